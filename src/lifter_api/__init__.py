@@ -1,6 +1,56 @@
 """Lifter API Wrapper."""
+
 from .main import LifterAPI
+from .models import Athlete, Attempt, Competition, Lift, LiftStatus
+from .table import LiftTable, lifts_to_columns
+from .utils.cache import ResponseCache
+from .utils.metrics import MetricsCollector
+from .utils.ratelimit import RateLimiter
+from .utils.tracing import InMemorySpanExporter, Tracer
+from .utils.transport import RetryPolicy, Transport
 
-__all__ = ["LifterAPI"]
+# `AsyncLifterAPI` is left out, as `import *` would fail without `httpx`
+__all__ = [
+    "Athlete",
+    "Attempt",
+    "Competition",
+    "InMemorySpanExporter",
+    "Lift",
+    "LiftStatus",
+    "LiftTable",
+    "LifterAPI",
+    "LifterMirror",
+    "MetricsCollector",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "Tracer",
+    "Transport",
+    "lifts_to_columns",
+]
 
 __version__ = "0.4.0"
+
+
+def __getattr__(name: str):
+    """Import `AsyncLifterAPI` and `LifterMirror` only when used.
+
+    `AsyncLifterAPI` needs `httpx`, and `LifterMirror` loads `sqlite3`.
+    """
+    if name == "AsyncLifterAPI":
+        try:
+            from .async_main import AsyncLifterAPI
+        except ModuleNotFoundError as error:
+            if error.name != "httpx":
+                raise
+            raise ImportError(
+                "AsyncLifterAPI needs httpx: "
+                "pip install lifter-api-wrapper[async]"
+            ) from error
+
+        return AsyncLifterAPI
+    if name == "LifterMirror":
+        from .mirror import LifterMirror
+
+        return LifterMirror
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,1051 @@
+"""Lifter API Wrapper asyncio module."""
+
+import asyncio
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from datetime import datetime
+from functools import partial
+from typing import Any, Literal
+
+import httpx
+
+from .utils.deadline import Timeout, remaining, request_timeout
+from .utils.decorators import _async_check_id
+from .utils.defaults import (
+    ALREADY_ENTERED,
+    ATHLETE_FIELDS,
+    CHECK_IDS_POLICIES,
+    COMPETITION_FIELDS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    DOES_NOT_EXIST,
+    LIFT_FIELDS,
+    TOKEN_REFRESH_SKEW,
+    VERSION,
+)
+from .utils.exceptions import (
+    DeadlineExceededError,
+    NotAllowedError,
+    TokenNotProvidedError,
+    TokenNotValidError,
+)
+from .utils.helpers import (
+    build_lift_payload,
+    load_url,
+    verify_date,
+    verify_edit_kwargs,
+)
+from .utils.tokens import (
+    AccessToken,
+    decode_token_expiry,
+    token_is_fresh,
+)
+from .utils.types import (
+    AthleteDetail,
+    AthleteList,
+    CompetitionDetail,
+    CompetitionList,
+    DetailResponse,
+    LiftDetail,
+    _SubAthleteList,
+    _SubCompetitionList,
+)
+
+
+def _httpx_timeout(timeout: Timeout) -> httpx.Timeout:
+    """Convert a timeout, e.g. `(connect, read)`, for `httpx`."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncLifterAPI:
+    """Create object to wrap all API calls for `lifter_api` with asyncio.
+
+    Has the same methods as `lifter_api.LifterAPI`, but they are \
+            coroutines run over a pooled `httpx.AsyncClient`, so many \
+            requests can be in flight without blocking the event loop. \
+            Errors from the API raise `httpx.HTTPStatusError`.
+
+    Nothing is sent when the object is created: the endpoint is checked \
+            and the access token obtained by `connect`, which is awaited \
+            automatically by the first call. Every request, including \
+            token requests, keeps to the `deadline` and `timeout` blocks \
+            of `lifter_api.utils.deadline`.
+
+    Unlike `lifter_api.LifterAPI`, it has no `RateLimiter`, \
+            `RetryPolicy`, response cache, request coalescing, metrics or \
+            tracing hooks, or models: requests are sent once as they are \
+            awaited, with `max_workers` bounding the bulk helpers.
+
+    Args:
+        url (str | None): API endpoint base URL. Defaults to `None`, which \
+                uses the same default as `lifter_api.LifterAPI`.
+        version (str | None): Version of the API. Defaults to "v1", which is \
+                set to `VERSION`.
+        auth_token (str | None): Authorization token to access 'higher' \
+                methods. Defaults to None.
+        client (httpx.AsyncClient | None): HTTP client shared by every \
+                call. Defaults to `None`, which creates a pooled, \
+                keep-alive client with `max_connections` connections.
+        max_connections (int): Maximum number of open connections. Defaults \
+                to `DEFAULT_POOL_MAXSIZE`.
+        timeout (float | tuple[float, float] | None): Default timeout of \
+                each request in seconds, either a single value or \
+                `(connect, read)`, also with a given `client`. Defaults to \
+                `DEFAULT_TIMEOUT`.
+        token_refresh_skew (float): Seconds before the access token expires \
+                at which it is refreshed. Defaults to `TOKEN_REFRESH_SKEW`.
+        check_ids (str): How IDs are checked to exist before calls that \
+                take them, see `lifter_api.LifterAPI`. "cache" behaves \
+                like "head". Defaults to "get".
+
+    Examples:
+        Typical use:
+        >>> from lifter_api import AsyncLifterAPI
+        >>> async with AsyncLifterAPI(auth_token=os.getenv("API_TOKEN")) as api:
+        ...     competition = await api.get_competition("ab345l")
+
+        Many requests at once:
+        >>> athletes = await api.get_athletes(["ab345l", "123def7"])
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        version: str | None = VERSION,
+        auth_token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float | tuple[float, float] | None = DEFAULT_TIMEOUT,
+        token_refresh_skew: float = TOKEN_REFRESH_SKEW,
+        check_ids: Literal["get", "head", "cache", "off"] = "get",
+    ) -> None:
+        """Init method."""
+        if check_ids not in CHECK_IDS_POLICIES:
+            raise NotAllowedError(
+                message=f"'{check_ids}' not a correct argument. {CHECK_IDS_POLICIES}"
+            )
+        self._url = url if url is not None else load_url()
+        self._version = version
+        self._auth_token = auth_token
+        self._token_refresh_skew = token_refresh_skew
+        self._check_ids = check_ids
+        self.__access_token = AccessToken()
+        self.__token_lock = asyncio.Lock()
+        self.__connect_lock = asyncio.Lock()
+        self._connected = False
+        self._timeout = timeout
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+                timeout=_httpx_timeout(timeout),
+            )
+        self._client = client
+
+    async def __aenter__(self) -> "AsyncLifterAPI":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit async context manager, closing pooled connections."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the client."""
+        await self._client.aclose()
+
+    async def connect(self) -> None:
+        """Check the endpoint and obtain the access token.
+
+        Raises:
+            httpx.HTTPStatusError: The URL or version is not valid.
+            TokenNotValidError: The authorization token is not valid.
+        """
+        async with self.__connect_lock:
+            if self._connected:
+                return
+            response = await self._send("GET", f"{self._url}/{self._version}")
+            response.raise_for_status()
+            if self._auth_token is not None:
+                await self._obtain_access_token()
+            self._connected = True
+
+    async def _request(
+        self, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request, connecting first if needed."""
+        if not self._connected:
+            await self.connect()
+        return await self._send(method, url, **kwargs)
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request within the current deadline and timeout.
+
+        The request is sent with the `timeout` override or the default \
+                timeout, cut to the time left, and is cancelled if the \
+                deadline passes.
+        """
+        kwargs["timeout"] = _httpx_timeout(request_timeout(self._timeout))
+        left = remaining()
+        if left is None:
+            return await self._client.request(method, url, **kwargs)
+        try:
+            return await asyncio.wait_for(
+                self._client.request(method, url, **kwargs), left
+            )
+        except asyncio.TimeoutError as error:
+            raise DeadlineExceededError(
+                message="Deadline exceeded."
+            ) from error
+
+    async def _verify_access_token(
+        self, access: AccessToken | None = None
+    ) -> bool:
+        """Check if the access token is true and valid.
+
+        Args:
+            access (AccessToken | None): Access token to check. Defaults to \
+                    `None`, which checks the current access token.
+
+        Returns:
+            bool: Result of valid access token.
+        """
+        if self._auth_token is None:
+            raise TokenNotProvidedError
+
+        if access is None:
+            access = self.__access_token
+        if access.token is None:
+            return False
+
+        if access.expiry is not None:
+            return token_is_fresh(access.expiry, self._token_refresh_skew)
+
+        response = await self._send(
+            "POST",
+            f"{self._url}/api/token/verify",
+            json={"token": access.token},
+        )
+        return response.json().get("code") != "token_not_valid"
+
+    async def _obtain_access_token(self, stale: str | None = None) -> str:
+        """Obtain the access key, refreshing it at most once at a time.
+
+        Args:
+            stale (str | None): Access token the API rejected. Defaults to \
+                    `None`.
+
+        Raises:
+            TokenNotValidError: The refresh token is not valid.
+
+        Returns:
+            str: access token.
+        """
+        access = self.__access_token
+        if stale is None and await self._verify_access_token(access):
+            return access.token  # type: ignore
+
+        async with self.__token_lock:
+            current = self.__access_token
+            if current is not access and current.token != stale:
+                # refreshed by another task while waiting for the lock
+                return current.token  # type: ignore
+
+            response = await self._send(
+                "POST",
+                f"{self._url}/api/token/refresh/",
+                data={"refresh": f"{self._auth_token}"},
+            )
+            if response.status_code == 401:
+                # the refresh token is no longer valid
+                raise TokenNotValidError
+
+            token = response.json()["access"]
+            self.__access_token = AccessToken(
+                token, decode_token_expiry(token)
+            )
+            return token
+
+    async def _authorized_request(
+        self, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request with the authorization header.
+
+        A rejected access token is refreshed and the request retried once.
+        """
+        if self._auth_token is None:
+            raise TokenNotProvidedError
+        if not self._connected:
+            await self.connect()
+        token = await self._obtain_access_token()
+        response = await self._request(
+            method, url, headers={"Authorization": f"Bearer {token}"}, **kwargs
+        )
+        if response.status_code == 401:
+            token = await self._obtain_access_token(stale=token)
+            response = await self._request(
+                method,
+                url,
+                headers={"Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+        return response
+
+    async def _check_exists(
+        self,
+        kind: str,
+        athlete_id: str | None = None,
+        competition_id: str | None = None,
+        lift_id: str | None = None,
+    ) -> str | Literal[False]:
+        """Check if an athlete, competition or lift exists.
+
+        Returns:
+            str | Literal[False]: The "detail" message if it does not exist, \
+                    otherwise `False`.
+        """
+        paths = {
+            "athlete": f"athletes/{athlete_id}",
+            "competition": f"competitions/{competition_id}",
+            "lift": f"competitions/{competition_id}/lifts/{lift_id}",
+        }
+        method = "GET" if self._check_ids == "get" else "HEAD"
+        response = await self._request(
+            method, f"{self._url}/{self._version}/{paths[kind]}"
+        )
+        if response.status_code != 404:
+            response.raise_for_status()
+            return False
+        return DOES_NOT_EXIST[kind].format(
+            {"athlete": athlete_id, "competition": competition_id}.get(
+                kind, lift_id
+            )
+        )
+
+    async def _gather(
+        self,
+        calls: Iterable[Callable[[], Awaitable[Any]]],
+        max_workers: int,
+    ) -> list[Any]:
+        """Await calls concurrently, at most `max_workers` at a time."""
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _bounded(call: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await call()
+
+        return list(await asyncio.gather(*(_bounded(call) for call in calls)))
+
+    async def _iter_results(
+        self, fetch_page: Callable[[int], Awaitable[Any]]
+    ) -> AsyncIterator[Any]:
+        """Step through the results of every page.
+
+        The next page is fetched while the current one is consumed.
+        """
+        task: asyncio.Future[Any] | None = asyncio.ensure_future(fetch_page(1))
+        page_number = 1
+        try:
+            while task is not None:
+                page = await task
+                task = None
+                if page.get("next"):
+                    page_number += 1
+                    task = asyncio.ensure_future(fetch_page(page_number))
+                for result in page["results"]:
+                    yield result
+        finally:
+            # stopped early, so the prefetched page is not needed
+            if task is not None:
+                task.cancel()
+
+    async def _fetch_all_results(
+        self,
+        fetch_page: Callable[[int], Awaitable[Any]],
+        max_workers: int,
+    ) -> list[Any]:
+        """Fetch the results of every page concurrently, in page order."""
+        first_page = await fetch_page(1)
+        results = list(first_page["results"])
+        if not first_page.get("next") or not results:
+            return results
+
+        last_page_number = math.ceil(first_page["count"] / len(results))
+        pages = await self._gather(
+            (
+                partial(self._fetch_page_or_none, fetch_page, page)
+                for page in range(2, last_page_number + 1)
+            ),
+            max_workers=max_workers,
+        )
+        for page in pages:
+            if page is None:
+                # items were deleted, so the results end sooner
+                return results
+            results.extend(page["results"])
+
+        # items added since the first page was read spill onto more pages
+        page_number = last_page_number
+        page = pages[-1] if pages else first_page
+        while page.get("next"):
+            page_number += 1
+            page = await self._fetch_page_or_none(fetch_page, page_number)
+            if page is None:
+                break
+            results.extend(page["results"])
+        return results
+
+    @staticmethod
+    async def _fetch_page_or_none(
+        fetch_page: Callable[[int], Awaitable[Any]], page_number: int
+    ) -> Any | None:
+        """Fetch a page, or `None` if it no longer exists (404)."""
+        try:
+            return await fetch_page(page_number)
+        except httpx.HTTPStatusError as error:
+            if error.response.status_code == 404:
+                return None
+            raise
+
+    async def athletes(self, page: int | None = 1) -> AthleteList:
+        """List all athletes.
+
+        Args:
+            page (Optional[int]): The page number if there is pagination. \
+                    Defaults to page 1.
+
+        Returns:
+            AthleteList: List of athletes as well as page information.
+        """
+        response = await self._request(
+            "GET", f"{self._url}/{self._version}/athletes?page={page}"
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_athletes(self) -> AsyncIterator[_SubAthleteList]:
+        """Iterate over all athletes, one page at a time.
+
+        Examples:
+            Typical use:
+            >>> async for athlete in api.iter_athletes():
+            ...     print(athlete["full_name"])
+        """
+        return self._iter_results(lambda page: self.athletes(page=page))
+
+    async def fetch_all_athletes(
+        self, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[_SubAthleteList]:
+        """Fetch all athletes, requesting pages concurrently.
+
+        Args:
+            max_workers (int): Maximum number of pages fetched at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[_SubAthleteList]: All athletes, in page order.
+        """
+        return await self._fetch_all_results(
+            lambda page: self.athletes(page=page), max_workers=max_workers
+        )
+
+    async def get_athlete(
+        self, athlete_id: str
+    ) -> AthleteDetail | DetailResponse:
+        """Get information about an athlete.
+
+        Args:
+            athlete_id (str): Athlete ID.
+
+        Returns:
+            (AthleteDetail|DetailResponse): Athlete details including lifts  \
+                    in competitions.
+        """
+        response = await self._request(
+            "GET", f"{self._url}/{self._version}/athletes/{athlete_id}"
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
+        response.raise_for_status()
+        return response.json()
+
+    async def get_athletes(
+        self,
+        athlete_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[AthleteDetail | DetailResponse]:
+        """Get information about many athletes concurrently.
+
+        Args:
+            athlete_ids (Iterable[str]): Athlete IDs.
+            max_workers (int): Maximum number of requests at once. Defaults \
+                    to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[AthleteDetail | DetailResponse]: Athlete details, in the \
+                    same order as `athlete_ids`.
+        """
+        return await self._gather(
+            (
+                partial(self.get_athlete, athlete_id)
+                for athlete_id in athlete_ids
+            ),
+            max_workers=max_workers,
+        )
+
+    async def find_athlete(
+        self,
+        search: str,
+        page: int = 1,
+        ordering: Literal["first_name", "last_name"] = "last_name",
+        ascending: bool = True,
+    ) -> AthleteList:
+        """Search for an athlete.
+
+        Args:
+            search (str): Search term for athlete; this will be the athlete's \
+                    name.
+            page (int): Page number for search. Defaults to 1.
+            ordering (str): Accepts `last_name` or `first_name` on what to \
+                    order, default to `last_name`.
+            ascending (bool): If the search results are ascending or \
+                    descending, defaults to True.
+
+        Raises:
+            NotAllowedError: The ordering was inputted incorrectly.
+
+        Returns:
+            AthleteList: Search results of athletes as well as page \
+                    information.
+        """
+        if ordering not in ["last_name", "first_name"]:
+            raise NotAllowedError(
+                message=f"'{ordering}' not a correcting argument. `last_name` and `first_name`"
+            )
+        response = await self._request(
+            "GET",
+            f"{self._url}/{self._version}/athletes?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}",
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_find_athletes(
+        self,
+        search: str,
+        ordering: Literal["first_name", "last_name"] = "last_name",
+        ascending: bool = True,
+    ) -> AsyncIterator[_SubAthleteList]:
+        """Iterate over all search results for an athlete."""
+        return self._iter_results(
+            lambda page: self.find_athlete(
+                search=search,
+                page=page,
+                ordering=ordering,
+                ascending=ascending,
+            )
+        )
+
+    async def create_athlete(
+        self, first_name: str, last_name: str, yearborn: int
+    ) -> AthleteDetail:
+        """Create an athlete.
+
+        Args:
+            first_name (str): First name of athlete and can include middle \
+                    names.
+            last_name (str): Surname of athlete.
+            yearborn (int): Birth year.
+
+        Returns:
+            AthleteDetail: information about created athlete.
+        """
+        response = await self._authorized_request(
+            "POST",
+            f"{self._url}/{self._version}/athletes",
+            json={
+                "first_name": str(first_name),
+                "last_name": str(last_name),
+                "yearborn": int(yearborn),
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def edit_athlete(
+        self, athlete_id: str, **kwargs
+    ) -> AthleteDetail | DetailResponse:
+        """Edit an existing athlete.
+
+        Args:
+            athlete_id (str): Athlete ID.
+            **kwargs: first_name (str), last_name(str), yearborn (int).
+
+        Returns:
+            AthleteDetail | DetailResponse: Information about edited athlete.
+        """
+        verify_edit_kwargs(kwargs, ATHLETE_FIELDS)
+        response = await self._authorized_request(
+            "PATCH",
+            f"{self._url}/{self._version}/athletes/{athlete_id}",
+            json=kwargs,
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def delete_athlete(self, athlete_id: str) -> DetailResponse:
+        """Delete an existing athlete.
+
+        Args:
+            athlete_id (str): Athlete ID.
+
+        Returns:
+            DetailResponse: Information about deleted athlete. Will also \
+                    return if athlete does not exist.
+        """
+        response = await self._authorized_request(
+            "DELETE",
+            f"{self._url}/{self._version}/athletes/{athlete_id}",
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
+        response.raise_for_status()
+        return {"detail": f"Athlete ID: '{athlete_id}' deleted."}
+
+    async def competitions(self, page: int = 1) -> CompetitionList:
+        """List all competitions.
+
+        Args:
+            page (int): Page number if there is pagination. Defaults to 1.
+
+        Returns:
+            CompetitionList: List of competition. Also, there will be \
+                    pagination information.
+        """
+        response = await self._request(
+            "GET", f"{self._url}/{self._version}/competitions?page={page}"
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_competitions(self) -> AsyncIterator[_SubCompetitionList]:
+        """Iterate over all competitions, one page at a time."""
+        return self._iter_results(lambda page: self.competitions(page=page))
+
+    async def fetch_all_competitions(
+        self, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[_SubCompetitionList]:
+        """Fetch all competitions, requesting pages concurrently.
+
+        Args:
+            max_workers (int): Maximum number of pages fetched at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[_SubCompetitionList]: All competitions, in page order.
+        """
+        return await self._fetch_all_results(
+            lambda page: self.competitions(page=page), max_workers=max_workers
+        )
+
+    async def get_competition(
+        self, competition_id: str
+    ) -> DetailResponse | CompetitionDetail:
+        """Get detail of an existing competition and it also includes the \
+                lifts.
+
+        Args:
+            competition_id (str): Competition ID.
+
+        Returns:
+           (CompetitionDetail|DetailResponse): Data for the competition and \
+                   lifts.
+        """
+        response = await self._request(
+            "GET", f"{self._url}/{self._version}/competitions/{competition_id}"
+        )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        response.raise_for_status()
+        return response.json()
+
+    async def get_competitions(
+        self,
+        competition_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[CompetitionDetail | DetailResponse]:
+        """Get many competitions, with their lifts, concurrently.
+
+        Args:
+            competition_ids (Iterable[str]): Competition IDs.
+            max_workers (int): Maximum number of requests at once. Defaults \
+                    to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[CompetitionDetail | DetailResponse]: Competition details, \
+                    in the same order as `competition_ids`.
+        """
+        return await self._gather(
+            (
+                partial(self.get_competition, competition_id)
+                for competition_id in competition_ids
+            ),
+            max_workers=max_workers,
+        )
+
+    async def find_competition(
+        self,
+        search: str = "",
+        page: int = 1,
+        date_after: str | datetime = "",
+        date_before: str | datetime | None = None,
+        order_by_date: bool = False,
+        ascending: bool = False,
+    ) -> CompetitionList:
+        """Find a competition by name, location search and/or by date.
+
+        Args:
+            search (str): Search parameter for location and/or name. Defaults \
+                    to ""
+            page (int): Page of number for search.
+            date_after (str | datetime): Search after date.
+            date_before (str | datetime): Search before date. If left as \
+                    `None`, it will default to today's date.
+            order_by_date (bool): To order by date.
+            ascending (bool): Ascending order for date search.
+
+        Returns:
+            The competitions that have been found.
+        """
+        if date_before is None:
+            date_before = datetime.now()
+
+        ordering = ""
+        if order_by_date:
+            ordering = "date_start"
+
+        if ordering == "":
+            # prevents "?ordering=-" on query string
+            ascending = True
+
+        response = await self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}&date_start_before={str(date_before)[:10]}&date_start_after={str(date_after)[:10]}",
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_find_competitions(
+        self,
+        search: str = "",
+        date_after: str | datetime = "",
+        date_before: str | datetime | None = None,
+        order_by_date: bool = False,
+        ascending: bool = False,
+    ) -> AsyncIterator[_SubCompetitionList]:
+        """Iterate over all competitions found by name, location and/or date."""
+        if date_before is None:
+            # fixed once, so every page uses the same search
+            date_before = datetime.now()
+        return self._iter_results(
+            lambda page: self.find_competition(
+                search=search,
+                page=page,
+                date_after=date_after,
+                date_before=date_before,
+                order_by_date=order_by_date,
+                ascending=ascending,
+            )
+        )
+
+    async def create_competition(
+        self,
+        date_start: str | datetime,  # date format YYYY-MM-DD
+        date_end: str | datetime,
+        location: str,
+        name: str,
+    ) -> CompetitionDetail:
+        """Create a competition.
+
+        Args:
+            date_start (str): Start date of the competition. Format: \
+                    YYYY-MM-DD.
+            date_end (str): End date of the competition. Format: YYYY-MM-DD.
+            location (str): Location of the competition.
+            name (str): The name of the competition.
+
+        Returns:
+            CompetitionDetail: Created competition information.
+        """
+        response = await self._authorized_request(
+            "POST",
+            f"{self._url}/{self._version}/competitions",
+            json={
+                "date_start": verify_date(date_start),
+                "date_end": verify_date(date_end),
+                "location": str(location),
+                "name": str(name),
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def edit_competition(
+        self, competition_id: str, **kwargs
+    ) -> CompetitionDetail | DetailResponse:
+        """Edit an existing competition.
+
+        Args:
+            competition_id (str): Competition ID.
+            **kwargs: date_start (str), date_end (str), location (str),
+            name (str).
+
+        Returns:
+            (CompetitionDetail|DetailResponse): Return competition \
+                    information. Will also return if competition does not \
+                    exist.
+        """
+        verify_edit_kwargs(kwargs, COMPETITION_FIELDS)
+        response = await self._authorized_request(
+            "PATCH",
+            f"{self._url}/{self._version}/competitions/{competition_id}",
+            json=kwargs,
+        )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def delete_competition(self, competition_id: str) -> DetailResponse:
+        """Delete a competition.
+
+        Args:
+            competition_id (str): Competition ID.
+
+        Returns:
+            DetailResponse: Returning information about deleted competition. \
+                    Will also return if the competition does not exist.
+        """
+        response = await self._authorized_request(
+            "DELETE",
+            f"{self._url}/{self._version}/competitions/{competition_id}",
+        )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        response.raise_for_status()
+        return {"detail": f"Competition ID: '{competition_id}' entry deleted."}
+
+    @_async_check_id
+    async def lifts(
+        self, competition_id: str
+    ) -> list[LiftDetail] | DetailResponse:
+        """Provide lifts and competitions.
+
+        Args:
+            competition_id (str): Competition ID.
+
+        Returns:
+            list[LiftDetail] | DetailResponse: Lift data. Will also return if \
+                    competition does not exist.
+        """
+        response = await self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts",
+        )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def get_lift(
+        self, competition_id: str, lift_id: str
+    ) -> LiftDetail | DetailResponse:
+        """Get particular lift data.
+
+        Args:
+            competition_id (str): Competition ID
+            lift_id (str): Lift ID
+
+        Returns:
+            (LiftDetail|DetailResponse): Lift information. Will also return \
+                    if competition does not exist.
+        """
+        response = await self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def create_lift(
+        self,
+        competition_id: str,
+        athlete_id: str,
+        snatch_first: str,
+        snatch_first_weight: int,
+        snatch_second: str,
+        snatch_second_weight: int,
+        snatch_third: str,
+        snatch_third_weight: int,
+        cnj_first: str,
+        cnj_first_weight: int,
+        cnj_second: str,
+        cnj_second_weight: int,
+        cnj_third: str,
+        cnj_third_weight: int,
+        bodyweight: int,
+        weight_category: str,
+        session_number: int,
+        team: str,
+        lottery_number: int,
+    ) -> LiftDetail | DetailResponse:
+        """Create a lift in an existing session.
+
+        Takes the same arguments as `lifter_api.LifterAPI.create_lift`.
+
+        Args:
+            competition_id (str): Competition ID.
+            athlete_id (str): Athlete ID.
+            snatch_first (str): Accepts "LIFT", "NOLIFT", "DNA".
+            snatch_first_weight (int): Weight of the lift.
+            snatch_second (str): Same as snatch_first.
+            snatch_second_weight (int): Same as snatch_first_weight.
+            snatch_third (str): Same as snatch_first.
+            snatch_third_weight (int): Same as snatch_first_weight.
+            cnj_first (str): Follow same as snatches.
+            cnj_first_weight (int): Follows as above.
+            cnj_second (str): Follows as above.
+            cnj_second_weight (int): Follows as above.
+            cnj_third (str): Follows as above.
+            cnj_third_weight (int): Follows as above.
+            bodyweight (float): Body weight in kilograms.
+            weight_category (str): Appropriate weight category.
+            session_number (int): Session number.
+            team (str): Team.
+            lottery_number (int): Determines lift order.
+
+        Returns:
+            LiftDetail | DetailResponse: Information about created lift. \
+                    Will also return if athlete or competition does not \
+                    exist, or the athlete is already in the competition.
+        """
+        payload = build_lift_payload(
+            competition_id=competition_id,
+            athlete_id=athlete_id,
+            snatch_first=snatch_first,
+            snatch_first_weight=snatch_first_weight,
+            snatch_second=snatch_second,
+            snatch_second_weight=snatch_second_weight,
+            snatch_third=snatch_third,
+            snatch_third_weight=snatch_third_weight,
+            cnj_first=cnj_first,
+            cnj_first_weight=cnj_first_weight,
+            cnj_second=cnj_second,
+            cnj_second_weight=cnj_second_weight,
+            cnj_third=cnj_third,
+            cnj_third_weight=cnj_third_weight,
+            bodyweight=bodyweight,
+            weight_category=weight_category,
+            session_number=session_number,
+            team=team,
+            lottery_number=lottery_number,
+        )
+        response = await self._authorized_request(
+            "POST",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts",
+            json=payload,
+        )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        if response.status_code == 400:
+            competition = await self.get_competition(
+                competition_id=competition_id
+            )
+            lifts = competition.get("lift_set", [])
+            if athlete_id in (lift["athlete"] for lift in lifts):  # type: ignore
+                return {
+                    "detail": ALREADY_ENTERED.format(
+                        athlete_id, competition_id
+                    )
+                }
+            if self._check_ids == "off":
+                not_exists = await self._check_exists(
+                    "athlete", athlete_id=athlete_id
+                )
+                if not_exists:
+                    return {"detail": not_exists}
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def edit_lift(
+        self, competition_id: str, lift_id: str, **kwargs
+    ) -> LiftDetail | DetailResponse:
+        """Edit an existing lift.
+
+        Args:
+            competition_id (str): competition id
+            lift_id (str): lift id
+
+        Returns:
+            (LiftDetail|DetailResponse): edited lift information and \
+                    return messages if competition id is invalid.
+        """
+        verify_edit_kwargs(kwargs, LIFT_FIELDS)
+        response = await self._authorized_request(
+            "PATCH",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
+            json=kwargs,
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
+        response.raise_for_status()
+        return response.json()
+
+    @_async_check_id
+    async def delete_lift(
+        self, competition_id: str, lift_id: str
+    ) -> DetailResponse:
+        """Delete an existing lift.
+
+        Args:
+            competition_id (str): Competition ID.
+            lift_id (str): Lift ID.
+
+        Returns:
+            DetailResponse: Information about deleted lift. Will also mention \
+                    if session or competition does not exist.
+        """
+        response = await self._authorized_request(
+            "DELETE",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
+        )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
+        response.raise_for_status()
+        return {"detail": f"Lift ID: '{lift_id}' entry deleted."}
@@ -1,41 +1,89 @@
 """Lifter API Wrapper main module."""
 
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Literal
 
 import requests
-from rich import pretty
 
-from .utils.decorators import _check_id
+from .models import Athlete, Competition, Lift, Model, to_models
+from .utils.cache import (
+    ExistenceCache,
+    ResponseCache,
+    cached_response,
+    conditional_headers,
+)
+from .utils.coalesce import RequestCoalescer
+from .utils.deadline import ContextThreadPoolExecutor, Timeout
+from .utils.deadline import deadline as _deadline
+from .utils.deadline import timeout as _timeout
+from .utils.decorators import _check_id, _traced
 from .utils.defaults import (
+    ALREADY_ENTERED,
     ATHLETE_FIELDS,
+    BULK_ROW_ERROR,
+    CHECK_IDS_POLICIES,
     COMPETITION_FIELDS,
+    COMPETITION_LOCK_STRIPES,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_TIMEOUT,
+    DOES_NOT_EXIST,
+    EXISTENCE_CACHE_TTL,
+    FAR_FUTURE_DATE,
     LIFT_FIELDS,
+    READ_METHODS,
+    STREAM_CHUNK_SIZE,
+    TOKEN_REFRESH_SKEW,
     VERSION,
 )
 from .utils.exceptions import (
+    InvalidLiftsError,
     NotAllowedError,
     TokenNotProvidedError,
     TokenNotValidError,
 )
 from .utils.helpers import (
+    build_lift_payload,
     load_url,
     verify_date,
     verify_edit_kwargs,
-    verify_lifts,
 )
+from .utils.index import (
+    AthleteIndex,
+    AthleteKey,
+    CompetitionIndex,
+)
+from .utils.metrics import (
+    MetricsCollector,
+    ResponseEvent,
+    current_tag,
+    tagged,
+)
+from .utils.pagination import fetch_all_results, iter_results
+from .utils.stream import iter_json_array, iter_text
+from .utils.tokens import (
+    AccessToken,
+    decode_token_expiry,
+    token_is_fresh,
+)
+from .utils.tracing import Tracer
+from .utils.transport import TransferStats, Transport, endpoint_template
 from .utils.types import (
     AthleteDetail,
     AthleteList,
+    AthleteUpsertResult,
+    BulkLiftResult,
     CompetitionDetail,
     CompetitionList,
     DetailResponse,
     LiftDetail,
+    _SubAthleteList,
+    _SubCompetitionList,
 )
 
-# make output nice to look at
-pretty.install()
-
 
 class LifterAPI:
     """Create object to wrap all API calls for `lifter_api`.
@@ -50,6 +98,48 @@ class LifterAPI:
                 set to `VERSION`.
         auth_token (str | None): Authorization token to access 'higher' \
                 methods. Defaults to None.
+        transport (Transport | None): HTTP transport shared by every call. \
+                Defaults to `None`, which creates a pooled, keep-alive \
+                `Transport` with the default pool size and `timeout`.
+        token_refresh_skew (float): Seconds before the access token expires \
+                at which it is refreshed. Defaults to `TOKEN_REFRESH_SKEW`.
+        check_ids (str): How IDs are checked to exist before calls that \
+                take them. "get" fetches the full record, "head" sends a \
+                cheap HEAD probe, "cache" sends a HEAD probe and remembers \
+                the result for `existence_cache_ttl` seconds, and "off" \
+                skips the check, relying on the API's 404 instead. Defaults \
+                to "get".
+        existence_cache_ttl (float): Seconds the "cache" policy trusts an \
+                ID to exist. Defaults to `EXISTENCE_CACHE_TTL`.
+        lazy (bool): Do not check the endpoint or obtain the access token \
+                until the first call, or until `connect` is called, so \
+                creating the client sends nothing. Defaults to `False`.
+        timeout (float | tuple[float, float] | None): Timeout in seconds \
+                of every request, either a single value or \
+                `(connect, read)`. Only used if `transport` is `None`. \
+                Defaults to `DEFAULT_TIMEOUT`.
+        cache (ResponseCache | None): Cache of GET responses, revalidated \
+                with ETag/Last-Modified once their time to live runs out \
+                and invalidated by writes made through this client. \
+                Defaults to `None`, which does not cache.
+        models (bool): Return athletes, competitions and lifts as compact \
+                `Athlete`, `Competition` and `Lift` models instead of \
+                dictionaries. Models use less memory and faster attribute \
+                access, and can still be read like dictionaries. Defaults \
+                to `False`.
+        coalesce (bool): Share one request, and one decoded result, \
+                between identical GET and HEAD requests made at the same \
+                time by different threads, such as the `_check_id` checks \
+                of a concurrent import into one competition. Callers may \
+                then get the same object, so results should not be \
+                changed in place. Defaults to `True`.
+        metrics (MetricsCollector | None): Collect counts, bytes, latency, \
+                retries and cache hits of every request by endpoint, \
+                including the ID checks and token requests made behind the \
+                scenes. Defaults to `None`, which collects nothing.
+        tracer (Tracer | None): Open a span for every public call, with a \
+                child span for every HTTP exchange it sends. Defaults to \
+                `None`, which traces nothing.
 
     Examples:
         Importing:
@@ -64,6 +154,32 @@ class LifterAPI:
 
         Different version and URL for api (not recommended):
         >>> api = LifterAPI(url="https://otherurl.com", version="v2")
+
+        Custom connection pool, closing connections when done:
+        >>> from lifter_api import Transport
+        >>> with LifterAPI(transport=Transport(pool_maxsize=32)) as api:
+        ...     api.athletes()
+
+        Instant start up, connecting on the first call:
+        >>> api = LifterAPI(auth_token=os.getenv("API_TOKEN"), lazy=True)
+
+        Fewer pre-flight requests for bulk work:
+        >>> api = LifterAPI(auth_token=os.getenv("API_TOKEN"),
+                check_ids="cache")
+
+        Bounding a call, including its ID checks:
+        >>> with api.deadline(10):
+        ...     api.lifts(competition_id="123def7")
+
+        Reusing responses for repeated reads:
+        >>> from lifter_api import ResponseCache
+        >>> api = LifterAPI(cache=ResponseCache())
+
+        Compact models for large result sets:
+        >>> api = LifterAPI(models=True)
+        >>> lift = api.get_lift(competition_id="123def7", lift_id="1ab")
+        >>> lift.snatches[0].weight
+        90
     """
 
     def __init__(
@@ -71,30 +187,316 @@ class LifterAPI:
         url: str | None = None,
         version: str | None = VERSION,
         auth_token: str | None = None,
+        transport: Transport | None = None,
+        token_refresh_skew: float = TOKEN_REFRESH_SKEW,
+        check_ids: Literal["get", "head", "cache", "off"] = "get",
+        existence_cache_ttl: float = EXISTENCE_CACHE_TTL,
+        lazy: bool = False,
+        cache: ResponseCache | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        models: bool = False,
+        coalesce: bool = True,
+        metrics: MetricsCollector | None = None,
+        tracer: Tracer | None = None,
     ) -> None:
         """Init method."""
+        if check_ids not in CHECK_IDS_POLICIES:
+            raise NotAllowedError(
+                message=f"'{check_ids}' not a correct argument. {CHECK_IDS_POLICIES}"
+            )
         self._url = url
         self._version = version
         self._auth_token = auth_token
-        self.__access_token = None
+        self._token_refresh_skew = token_refresh_skew
+        self.__access_token = AccessToken()
+        self.__token_lock = threading.Lock()
+        self._transport = (
+            transport if transport is not None else Transport(timeout=timeout)
+        )
+        self._check_ids = check_ids
+        self._existence_cache = ExistenceCache(ttl=existence_cache_ttl)
+        self._cache = cache
+        self._models = models
+        self._coalescer = RequestCoalescer() if coalesce else None
+        if metrics is not None:
+            metrics.attach(self._transport)
+        self._tracer = tracer
+        if tracer is not None:
+            tracer.attach(self._transport)
+        self._competition_index: CompetitionIndex | None = None
+        self.__competition_index_lock = threading.Lock()
+        self.__competition_locks = tuple(
+            threading.Lock() for _ in range(COMPETITION_LOCK_STRIPES)
+        )
+
+        self._connected = False
+        self.__connect_lock = threading.Lock()
 
         if self._url is None:
             self._url = load_url()
 
-        # check if parameters are valid
-        # `_url` and `_version`
-        response = requests.get(f"{self._url}/{self._version}")
-        response.raise_for_status()
+        if not lazy:
+            self.connect()
+
+    def __enter__(self) -> "LifterAPI":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Exit context manager, closing pooled connections."""
+        self.close()
 
-        # `_auth_token`
-        if self._auth_token is not None:
-            self._obtain_access_token()
+    def close(self) -> None:
+        """Close the pooled connections of the transport."""
+        self._transport.close()
 
-    def _verify_access_token(self) -> bool:
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Bytes received by endpoint, as sent and once decompressed.
+
+        Examples:
+            >>> api.fetch_all_athletes()
+            >>> api.transfer_stats.total().ratio
+            7.4
+        """
+        return self._transport.transfer_stats
+
+    @staticmethod
+    def deadline(seconds: float):
+        """Give every request sent in the block `seconds` to finish in total.
+
+        Covers everything a call sends, such as the `_check_id` checks and \
+                every page of a scan, including requests sent by worker \
+                threads. Once the deadline passes, further requests raise \
+                `DeadlineExceededError` instead of being sent.
+
+        Args:
+            seconds (float): Seconds from now.
+
+        Examples:
+            >>> with api.deadline(60):
+            ...     athletes = api.fetch_all_athletes()
+        """
+        return _deadline(seconds)
+
+    @staticmethod
+    def timeout(seconds: Timeout):
+        """Override the timeout of every request sent in the block.
+
+        Args:
+            seconds (float | tuple[float, float] | None): Timeout in \
+                    seconds, either a single value or `(connect, read)`, \
+                    or `None` for no timeout.
+
+        Examples:
+            >>> with api.timeout((2, 5)):
+            ...     api.get_athlete(athlete_id="ab345l")
+        """
+        return _timeout(seconds)
+
+    @_traced
+    def connect(self) -> None:
+        """Check the endpoint and obtain the access token.
+
+        Called on construction, or by the first call if the client was \
+                created with `lazy=True`. It can also be called early to \
+                warm up the connection. Only the first successful call does \
+                anything.
+
+        Raises:
+            requests.HTTPError: The URL or version is not valid.
+            TokenNotValidError: The authorization token is not valid.
+
+        Examples:
+            Warming up a lazy client:
+            >>> api = LifterAPI(auth_token=os.getenv("API_TOKEN"), lazy=True)
+            >>> api.connect()
+        """
+        with self.__connect_lock:
+            if self._connected:
+                return
+            # check if parameters are valid
+            # `_url` and `_version`
+            with tagged("connect"):
+                response = self._transport.get(f"{self._url}/{self._version}")
+            response.raise_for_status()
+
+            # `_auth_token`
+            if self._auth_token is not None:
+                self._obtain_access_token()
+            self._connected = True
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, connecting first if needed.
+
+        Identical GET and HEAD requests in flight at the same time share \
+                one request and response, if coalescing is on. Requests \
+                that waited for another are passed to the `after_request` \
+                hooks as `coalesced` events.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            **kwargs: Passed on to the transport.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if not self._connected:
+            self.connect()
+        if (
+            self._coalescer is None
+            or method not in READ_METHODS
+            or set(kwargs) - {"headers"}
+        ):
+            return self._send(method, url, **kwargs)
+        key = (method, url, tuple(sorted(kwargs.get("headers", {}).items())))
+        sent = False
+
+        def _send() -> requests.Response:
+            nonlocal sent
+            sent = True
+            return self._send(method, url, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = self._coalescer.do(key, _send)
+        except Exception as error:
+            if not sent:
+                self._notify_unsent(
+                    method,
+                    url,
+                    None,
+                    error,
+                    time.perf_counter() - start,
+                    coalesced=True,
+                )
+            raise
+        if not sent:
+            self._notify_unsent(
+                method,
+                url,
+                response.status_code,
+                None,
+                time.perf_counter() - start,
+                coalesced=True,
+            )
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the response cache, if there is one.
+
+        GET requests are served from the cache unless they are streamed.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            **kwargs: Passed on to the transport.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if (
+            self._cache is None
+            or method != "GET"
+            or "params" in kwargs
+            or kwargs.get("stream")
+        ):
+            return self._transport.request(method, url, **kwargs)
+
+        entry, fresh = self._cache.lookup(url)
+        if entry is not None:
+            if fresh:
+                self._notify_unsent("GET", url, 200, None, 0.0, cached=True)
+                return cached_response(url, entry)
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                **conditional_headers(entry),
+            }
+        response = self._transport.request(method, url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self._notify_unsent("GET", url, 200, None, 0.0, cached=True)
+            return cached_response(url, self._cache.revalidated(url, entry))
+        if response.status_code == 200:
+            self._cache.store(url, response)
+        return response
+
+    def _notify_unsent(
+        self,
+        method: str,
+        url: str,
+        status_code: int | None,
+        error: Exception | None,
+        elapsed: float,
+        cached: bool = False,
+        coalesced: bool = False,
+    ) -> None:
+        """Tell the `after_request` hooks about a response not sent for.
+
+        Either a GET answered from the cache, or a request that waited for \
+                an identical one in flight and shared its response.
+        """
+        if self._transport.after_request:
+            self._transport.notify(
+                ResponseEvent(
+                    method,
+                    url,
+                    endpoint_template(url),
+                    current_tag(),
+                    0,
+                    status_code,
+                    error,
+                    elapsed,
+                    False,
+                    cached,
+                    None,
+                    None,
+                    coalesced,
+                )
+            )
+
+    def _invalidate_cached(self, url: str) -> None:
+        """Drop cached responses a write to `url` may have changed.
+
+        Lists and searches of the written type are always dropped. Athletes \
+                and competitions embed each other's names and lifts, so \
+                changing an existing one (or any lift) also drops the \
+                details of the other type.
+
+        Args:
+            url (str): Full URL written to.
+        """
+        if self._cache is None:
+            return
+        base = f"{self._url}/{self._version}"
+        # e.g. ["competitions", "<id>", "lifts", "<id>"]
+        segments = url[len(base) :].strip("/").split("/")
+        if segments[0] == "athletes":
+            prefixes = [f"{base}/athletes?"]
+            if len(segments) > 1:
+                prefixes += [f"{base}/athletes/", f"{base}/competitions"]
+        elif len(segments) > 2:
+            prefixes = [
+                f"{base}/competitions/{segments[1]}",
+                f"{base}/competitions?",
+                f"{base}/athletes/",
+            ]
+        else:
+            prefixes = [f"{base}/competitions?"]
+            if len(segments) > 1:
+                prefixes += [f"{base}/competitions/", f"{base}/athletes/"]
+        self._cache.invalidate(*prefixes)
+
+    def _verify_access_token(self, access: AccessToken | None = None) -> bool:
         """Check if the access token is true and valid.
 
         If `False` is returned, then the access token will need to be
-        refreshed.
+        refreshed. The expiry of the access token is read locally, so the \
+                API is only asked to verify tokens it cannot be decoded from.
+
+        Args:
+            access (AccessToken | None): Access token to check. Defaults to \
+                    `None`, which checks the current access token.
 
         Returns:
             bool: Result of valid access token.
@@ -102,20 +504,33 @@ class LifterAPI:
         if self._auth_token is None:
             raise TokenNotProvidedError
 
-        if self.__access_token is None:
+        if access is None:
+            access = self.__access_token
+        if access.token is None:
             return False
 
-        response = requests.post(
-            f"{self._url}/api/token/verify",
-            json={"token": self.__access_token},
-        )
+        if access.expiry is not None:
+            return token_is_fresh(access.expiry, self._token_refresh_skew)
+
+        with tagged("token"):
+            response = self._transport.post(
+                f"{self._url}/api/token/verify",
+                json={"token": access.token},
+            )
         return response.json().get("code") != "token_not_valid"
 
-    def _obtain_access_token(self) -> str | None:
+    def _obtain_access_token(self, stale: str | None = None) -> str | None:
         """Obtain the access key.
 
         Also, checks if the current access key is valid as not to refresh
-        another key for no reason.
+        another key for no reason. Only one refresh runs at a time per \
+                client; other threads wait for it and then use the token it \
+                obtained.
+
+        Args:
+            stale (str | None): Access token the API rejected. It is \
+                    refreshed unless another thread has already replaced \
+                    it. Defaults to `None`.
 
         Raises:
             TokenNotValidException: There was a problems with the refresh
@@ -124,17 +539,30 @@ class LifterAPI:
         Returns:
             str: access token.
         """
-        if self._verify_access_token() is False:
-            response = requests.post(
-                f"{self._url}/api/token/refresh/",
-                data={"refresh": f"{self._auth_token}"},
-            )
+        access = self.__access_token
+        if stale is None and self._verify_access_token(access):
+            return access.token
+
+        with self.__token_lock:
+            current = self.__access_token
+            if current is not access and current.token != stale:
+                # refreshed by another thread while waiting for the lock
+                return current.token
+
+            with tagged("token"):
+                response = self._transport.post(
+                    f"{self._url}/api/token/refresh/",
+                    data={"refresh": f"{self._auth_token}"},
+                )
             if response.status_code == 401:
                 # the refresh token is no longer valid
                 raise TokenNotValidError
 
-            self.__access_token = response.json()["access"]
-        return self.__access_token
+            token = response.json()["access"]
+            self.__access_token = AccessToken(
+                token, decode_token_expiry(token)
+            )
+            return token
 
     def _provide_authorization_header(self) -> dict[str, str]:
         """Provide the authorization header.
@@ -145,10 +573,164 @@ class LifterAPI:
         Returns:
             Dict[str, str]: authorization header.
         """
-        self._obtain_access_token()
-        headers = {"Authorization": f"Bearer {self.__access_token}"}
-        return headers
+        return {"Authorization": f"Bearer {self._obtain_access_token()}"}
+
+    def _authorized_request(
+        self, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Send a request with the authorization header.
 
+        If the API rejects the access token (e.g. it was revoked before \
+                its expiry), the token is refreshed and the request is \
+                retried once.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            **kwargs: Passed on to the transport.
+
+        Returns:
+            requests.Response: The response.
+        """
+        if not self._connected:
+            self.connect()
+        token = self._obtain_access_token()
+        response = self._request(
+            method, url, headers={"Authorization": f"Bearer {token}"}, **kwargs
+        )
+        if response.status_code == 401:
+            token = self._obtain_access_token(stale=token)
+            response = self._request(
+                method,
+                url,
+                headers={"Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+        self._invalidate_cached(url)
+        return response
+
+    def _check_exists(
+        self,
+        kind: str,
+        athlete_id: str | None = None,
+        competition_id: str | None = None,
+        lift_id: str | None = None,
+        head: bool = False,
+    ) -> str | Literal[False]:
+        """Check if an athlete, competition or lift exists.
+
+        Used by the `_check_id` decorator according to the `check_ids` \
+                policy.
+
+        Args:
+            kind (str): "athlete", "competition" or "lift".
+            athlete_id (str | None): Athlete ID.
+            competition_id (str | None): Competition ID. Also needed for \
+                    lifts.
+            lift_id (str | None): Lift ID.
+            head (bool): Send a HEAD request even if the policy is "get". \
+                    Defaults to `False`.
+
+        Returns:
+            str | Literal[False]: The "detail" message if it does not \
+                    exist, otherwise `False`.
+        """
+        if self._check_ids == "get" and not head:
+            if kind == "athlete":
+                result = self.get_athlete(athlete_id=athlete_id)
+            elif kind == "competition":
+                result = self.get_competition(competition_id=competition_id)
+            else:
+                result = self.get_lift(
+                    competition_id=competition_id, lift_id=lift_id
+                )
+            return result.get("detail", False)
+
+        paths = {
+            "athlete": f"athletes/{athlete_id}",
+            "competition": f"competitions/{competition_id}",
+            "lift": f"competitions/{competition_id}/lifts/{lift_id}",
+        }
+        key = paths[kind]
+        exists = None
+        if self._check_ids == "cache":
+            exists = self._existence_cache.get(kind, key)
+        if exists is None:
+            response = self._request(
+                "HEAD", f"{self._url}/{self._version}/{key}"
+            )
+            exists = response.status_code != 404
+            if exists:
+                response.raise_for_status()
+            self._remember_exists(kind, key, exists)
+
+        if exists:
+            return False
+        return DOES_NOT_EXIST[kind].format(
+            {"athlete": athlete_id, "competition": competition_id}.get(
+                kind, lift_id
+            )
+        )
+
+    def _check_athletes_exist(
+        self, athlete_ids: Iterable[str], max_workers: int
+    ) -> dict[str, str | Literal[False]]:
+        """Check many athletes exist, once each and concurrently.
+
+        Athletes are checked with HEAD requests whatever the `check_ids` \
+                policy, as only their existence is needed, and nothing is \
+                checked if it is "off".
+
+        Returns:
+            dict[str, str | Literal[False]]: `_check_exists` result by \
+                    athlete ID.
+        """
+        athlete_ids = list(athlete_ids)
+        if self._check_ids == "off" or not athlete_ids:
+            return {}
+        with (
+            tagged("preflight"),
+            ContextThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(athlete_ids)))
+            ) as executor,
+        ):
+            return dict(
+                zip(
+                    athlete_ids,
+                    executor.map(
+                        lambda athlete_id: self._check_exists(
+                            "athlete", athlete_id=athlete_id, head=True
+                        ),
+                        athlete_ids,
+                    ),
+                )
+            )
+
+    def _json(self, response: requests.Response, model: type[Model]):
+        """Decode a response, as models if the client was created with \
+                `models=True`.
+
+        A response is only decoded once, so callers sharing a coalesced \
+                response share the decoded result. Each response has its \
+                own lock, so different responses are decoded in parallel.
+        """
+        # `setdefault` is atomic, so every caller gets the same lock
+        lock = vars(response).setdefault("_decode_lock", threading.Lock())
+        with lock:
+            decoded = getattr(response, "_decoded", None)
+            if decoded is None:
+                decoded = response.json()
+                if self._models:
+                    decoded = to_models(model, decoded)
+                response._decoded = decoded  # type: ignore
+        return decoded
+
+    def _remember_exists(self, kind: str, key: str, exists: bool) -> None:
+        """Record that an ID exists for the "cache" `check_ids` policy."""
+        if self._check_ids == "cache":
+            self._existence_cache.set(kind, key, exists)
+
+    @_traced
     def athletes(
         self,
         page: int | None = 1,
@@ -176,12 +758,67 @@ class LifterAPI:
             Specifying a page:
             >>> api.athletes(page=2)
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/athletes?page={page}"
+        response = self._request(
+            "GET", f"{self._url}/{self._version}/athletes?page={page}"
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Athlete)
+
+    @_traced
+    def iter_athletes(
+        self, prefetch: bool = True
+    ) -> Iterator[_SubAthleteList]:
+        """Iterate over all athletes, one page at a time.
+
+        Pages are only requested as they are needed, so the whole list is \
+                never held in memory.
+
+        Args:
+            prefetch (bool): Fetch the next page in the background while \
+                    the current one is consumed. Defaults to `True`.
+
+        Yields:
+            _SubAthleteList: Each athlete.
+
+        Examples:
+            Typical use:
+            >>> for athlete in api.iter_athletes():
+            ...     print(athlete["full_name"])
+
+            Stopping early:
+            >>> from itertools import islice
+            >>> first_ten = list(islice(api.iter_athletes(), 10))
+        """
+        yield from iter_results(
+            lambda page: self.athletes(page=page), prefetch=prefetch
+        )
+
+    @_traced
+    def fetch_all_athletes(
+        self, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[_SubAthleteList]:
+        """Fetch all athletes, requesting pages concurrently.
+
+        Page 1 is read first to work out how many pages there are, then \
+                the rest are fetched in parallel.
+
+        Args:
+            max_workers (int): Maximum number of pages fetched at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[_SubAthleteList]: All athletes, in the same order as \
+                    stepping through the pages.
+
+        Examples:
+            Typical use:
+            >>> athletes = api.fetch_all_athletes()
+        """
+        return fetch_all_results(
+            lambda page: self.athletes(page=page), max_workers=max_workers
+        )
 
+    @_traced
     def get_athlete(self, athlete_id: str) -> AthleteDetail | DetailResponse:
         """Get information about an athlete.
 
@@ -198,14 +835,48 @@ class LifterAPI:
             >>> api.get_athlete(athlete_id=athlete_id)
             # TODO: output
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/athletes/{athlete_id}"
+        response = self._request(
+            "GET", f"{self._url}/{self._version}/athletes/{athlete_id}"
         )
         if response.status_code == 404:
-            return {"detail": f"Athlete ID: '{athlete_id}' does not exist."}
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Athlete)
+
+    @_traced
+    def iter_athlete_lifts(
+        self, athlete_id: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[LiftDetail | Lift]:
+        """Stream the lifts of an athlete as the response arrives.
+
+        Same lifts as the `lift_set` of `get_athlete`, but they are decoded \
+                one at a time while the body is read, so memory stays \
+                bounded for long careers and the first lift is available \
+                before the whole body has arrived. The request is sent when \
+                iteration starts.
+
+        Args:
+            athlete_id (str): Athlete ID.
+            chunk_size (int): Bytes read at a time. Defaults to \
+                    `STREAM_CHUNK_SIZE`.
+
+        Raises:
+            requests.HTTPError: The athlete does not exist.
+
+        Yields:
+            LiftDetail | Lift: Each lift of the athlete, as a `Lift` when\
+                models are enabled.
+
+        Examples:
+            Typical use:
+            >>> for lift in api.iter_athlete_lifts(athlete_id="ab345l"):
+            ...     print(lift["total_lifted"])
+        """
+        yield from self._stream_lifts(
+            f"{self._url}/{self._version}/athletes/{athlete_id}", chunk_size
+        )
 
+    @_traced
     def find_athlete(
         self,
         search: str,
@@ -245,12 +916,51 @@ class LifterAPI:
             raise NotAllowedError(
                 message=f"'{ordering}' not a correcting argument. `last_name` and `first_name`"
             )
-        response = requests.get(
-            f"{self._url}/{self._version}/athletes?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}"
+        response = self._request(
+            "GET",
+            f"{self._url}/{self._version}/athletes?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}",
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Athlete)
+
+    @_traced
+    def iter_find_athletes(
+        self,
+        search: str,
+        ordering: Literal["first_name", "last_name"] = "last_name",
+        ascending: bool = True,
+        prefetch: bool = True,
+    ) -> Iterator[_SubAthleteList]:
+        """Iterate over all search results for an athlete.
+
+        Args:
+            search (str): Search term for athlete; this will be the athlete's \
+                    name.
+            ordering (str): Accepts `last_name` or `first_name` on what to \
+                    order, default to `last_name`.
+            ascending (bool): If the search results are ascending or \
+                    descending, defaults to True.
+            prefetch (bool): Fetch the next page in the background. Defaults \
+                    to `True`.
+
+        Yields:
+            _SubAthleteList: Each athlete found.
+
+        Examples:
+            Typical use:
+            >>> athletes = list(api.iter_find_athletes("Athlete"))
+        """
+        yield from iter_results(
+            lambda page: self.find_athlete(
+                search=search,
+                page=page,
+                ordering=ordering,
+                ascending=ascending,
+            ),
+            prefetch=prefetch,
+        )
 
+    @_traced
     def create_athlete(
         self, first_name: str, last_name: str, yearborn: int
     ) -> AthleteDetail:
@@ -259,8 +969,8 @@ class LifterAPI:
         NB: Duplicate athlete names can be created, so it might be a wise \
                 to utilise `lifter_api.LifterAPI.find_athlete` to search \
                 for the athlete first and then determine whether or not you \
-                want to create a new athlete. **This might be written in the \
-                future**.
+                want to create a new athlete. For many athletes, use \
+                `lifter_api.LifterAPI.upsert_athletes`.
 
         Args:
             first_name (str): First name of athlete and can include middle \
@@ -289,9 +999,9 @@ class LifterAPI:
                         }
             >>> api.create_athlete(**athlete)
         """
-        response = requests.post(
+        response = self._authorized_request(
+            "POST",
             f"{self._url}/{self._version}/athletes",
-            headers=self._provide_authorization_header(),
             json={
                 "first_name": str(first_name),
                 "last_name": str(last_name),
@@ -299,8 +1009,126 @@ class LifterAPI:
             },
         )
         response.raise_for_status()
-        return response.json()
+        athlete = self._json(response, Athlete)
+        self._remember_exists(
+            "athlete", f"athletes/{athlete['reference_id']}", True
+        )
+        return athlete
+
+    @staticmethod
+    def _match_athletes(rows: Iterable[dict], index: AthleteIndex) -> tuple[
+        AthleteUpsertResult,
+        dict[AthleteKey, list[int]],
+        dict[AthleteKey, dict],
+    ]:
+        """Match rows of athletes locally for `upsert_athletes`.
 
+        Returns:
+            tuple[AthleteUpsertResult, dict[AthleteKey, list[int]], \
+                    dict[AthleteKey, dict]]: The rows matched, ambiguous or \
+                    failed, and the row numbers and fields of the athletes \
+                    to create by key.
+        """
+        result: AthleteUpsertResult = {
+            "created": {},
+            "matched": {},
+            "ambiguous": {},
+            "failed": {},
+        }
+        misses: dict[AthleteKey, list[int]] = {}
+        fields: dict[AthleteKey, dict] = {}
+        for row, athlete in enumerate(rows):
+            try:
+                key = index.key(
+                    athlete["first_name"],
+                    athlete["last_name"],
+                    athlete["yearborn"],
+                )
+            except KeyError as error:
+                result["failed"][row] = f"Missing field: {error}."
+                continue
+            except (TypeError, ValueError) as error:
+                result["failed"][row] = str(error)
+                continue
+            found = index.match(*key)
+            if len(found) == 1:
+                result["matched"][row] = found[0]
+            elif found:
+                result["ambiguous"][row] = found
+            else:
+                misses.setdefault(key, []).append(row)
+                fields.setdefault(
+                    key, {field: athlete[field] for field in ATHLETE_FIELDS}
+                )
+        return result, misses, fields
+
+    @_traced
+    def upsert_athletes(
+        self,
+        rows: Iterable[dict],
+        index: AthleteIndex | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> AthleteUpsertResult:
+        """Create the athletes that do not exist yet, e.g. a club roster.
+
+        Existing athletes are read in one scan and matched locally by \
+                first name, last name and birth year, ignoring case, \
+                accents and hyphens. Only rows without a match are \
+                created, `max_workers` at a time, and identical rows are \
+                created once.
+
+        Args:
+            rows (Iterable[dict]): Rows with "first_name", "last_name" and \
+                    "yearborn".
+            index (AthleteIndex | None): Index of existing athletes to match \
+                    against, which is updated with the created athletes. \
+                    Defaults to `None`, which indexes all athletes.
+            max_workers (int): Maximum number of athletes created at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            AthleteUpsertResult: Rows by row number that were created, \
+                    matched one existing athlete, matched more than one \
+                    (not created), or failed, with the reason, because a \
+                    field is missing or not valid or the athlete could not \
+                    be created.
+
+        Examples:
+            Onboarding a roster:
+            >>> roster = [
+                    {"first_name": "Example", "last_name": "Athlete",
+                        "yearborn": 1990},
+                    ]
+            >>> result = api.upsert_athletes(roster)
+            >>> result["ambiguous"]
+            # rows to sort out by hand
+        """
+        if index is None:
+            index = AthleteIndex(self.iter_athletes())
+        result, misses, fields = self._match_athletes(rows, index)
+        if not misses:
+            return result
+
+        with ContextThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(misses)))
+        ) as executor:
+            created = {
+                key: executor.submit(self.create_athlete, **fields[key])
+                for key in misses
+            }
+            for key, future in created.items():
+                try:
+                    athlete = future.result()
+                except requests.RequestException as error:
+                    for row in misses[key]:
+                        result["failed"][row] = str(error)
+                    continue
+                index.add(athlete)
+                for row in misses[key]:
+                    result["created"][row] = athlete
+        return result
+
+    @_traced
     @_check_id
     def edit_athlete(
         self, athlete_id: str, **kwargs
@@ -320,14 +1148,17 @@ class LifterAPI:
             # TODO: output
         """
         verify_edit_kwargs(kwargs, ATHLETE_FIELDS)
-        response = requests.patch(
+        response = self._authorized_request(
+            "PATCH",
             f"{self._url}/{self._version}/athletes/{athlete_id}",
-            headers=self._provide_authorization_header(),
             json=kwargs,
         )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Athlete)
 
+    @_traced
     @_check_id
     def delete_athlete(self, athlete_id: str) -> DetailResponse:
         """Delete an existing athlete.
@@ -344,13 +1175,17 @@ class LifterAPI:
             >>> api.delete_athlete(athlete_id="123def7")
             { "detail": Athlete ID: '123def7' deleted. }
         """
-        response = requests.delete(
+        response = self._authorized_request(
+            "DELETE",
             f"{self._url}/{self._version}/athletes/{athlete_id}",
-            headers=self._provide_authorization_header(),
         )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
         response.raise_for_status()
+        self._remember_exists("athlete", f"athletes/{athlete_id}", False)
         return {"detail": f"Athlete ID: '{athlete_id}' deleted."}
 
+    @_traced
     def competitions(self, page: int = 1) -> CompetitionList:
         """List all competitions.
 
@@ -370,12 +1205,57 @@ class LifterAPI:
             >>> api.competitions(page=2)
             # TODO: output
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/competitions?page={page}"
+        response = self._request(
+            "GET", f"{self._url}/{self._version}/competitions?page={page}"
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Competition)
+
+    @_traced
+    def iter_competitions(
+        self, prefetch: bool = True
+    ) -> Iterator[_SubCompetitionList]:
+        """Iterate over all competitions, one page at a time.
+
+        Args:
+            prefetch (bool): Fetch the next page in the background while \
+                    the current one is consumed. Defaults to `True`.
+
+        Yields:
+            _SubCompetitionList: Each competition.
 
+        Examples:
+            Typical use:
+            >>> for competition in api.iter_competitions():
+            ...     print(competition["name"])
+        """
+        yield from iter_results(
+            lambda page: self.competitions(page=page), prefetch=prefetch
+        )
+
+    @_traced
+    def fetch_all_competitions(
+        self, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[_SubCompetitionList]:
+        """Fetch all competitions, requesting pages concurrently.
+
+        Args:
+            max_workers (int): Maximum number of pages fetched at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
+
+        Returns:
+            list[_SubCompetitionList]: All competitions, in the same order \
+                    as stepping through the pages.
+
+        Examples:
+            Typical use:
+            >>> competitions = api.fetch_all_competitions(max_workers=4)
+        """
+        return fetch_all_results(
+            lambda page: self.competitions(page=page), max_workers=max_workers
+        )
+
+    @_traced
     def get_competition(
         self, competition_id: str
     ) -> DetailResponse | CompetitionDetail:
@@ -395,16 +1275,78 @@ class LifterAPI:
             >>> api.get_competition(competition_id=competition_id)
             # TODO: output
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/competitions/{competition_id}"
+        response = self._request(
+            "GET", f"{self._url}/{self._version}/competitions/{competition_id}"
         )
         if response.status_code == 404:
             return {
-                "detail": f"Competition ID: '{competition_id}' does not exist."
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
             }
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Competition)
+
+    @_traced
+    def iter_competition_lifts(
+        self, competition_id: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[LiftDetail | Lift]:
+        """Stream the lifts of a competition as the response arrives.
+
+        Same lifts as the `lift_set` of `get_competition`, but they are \
+                decoded one at a time while the body is read, so memory \
+                stays bounded for big meets and the first lift is available \
+                before the whole body has arrived. The request is sent when \
+                iteration starts.
+
+        Args:
+            competition_id (str): Competition ID.
+            chunk_size (int): Bytes read at a time. Defaults to \
+                    `STREAM_CHUNK_SIZE`.
+
+        Raises:
+            requests.HTTPError: The competition does not exist.
+
+        Yields:
+            LiftDetail | Lift: Each lift of the competition, as a `Lift`\
+                when models are enabled.
 
+        Examples:
+            Straight into a table, without a list of lifts:
+            >>> from lifter_api import LiftTable
+            >>> table = LiftTable.from_lifts(
+                    api.iter_competition_lifts(competition_id="123def7")
+                    )
+        """
+        yield from self._stream_lifts(
+            f"{self._url}/{self._version}/competitions/{competition_id}",
+            chunk_size,
+        )
+
+    def _stream_lifts(
+        self, url: str, chunk_size: int
+    ) -> Iterator[LiftDetail | Lift]:
+        """Yield the `lift_set` of a detail response as it is decoded."""
+        response = self._request("GET", url, stream=True)
+        decompressed = 0
+
+        def _chunks() -> Iterator[bytes]:
+            nonlocal decompressed
+            for chunk in response.iter_content(chunk_size):
+                decompressed += len(chunk)
+                yield chunk
+
+        try:
+            response.raise_for_status()
+            lifts = iter_json_array(iter_text(_chunks()), "lift_set")
+            for lift in lifts:
+                yield Lift.from_dict(lift) if self._models else lift
+        finally:
+            compressed = getattr(response.raw, "tell", lambda: decompressed)
+            self._transport.transfer_stats.record(
+                "GET", url, compressed(), decompressed
+            )
+            response.close()
+
+    @_traced
     def find_competition(
         self,
         search: str = "",
@@ -450,12 +1392,61 @@ class LifterAPI:
             # prevents "?ordering=-" on query string
             ascending = True
 
-        response = requests.get(
-            f"{self._url}/{self._version}/competitions?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}&date_start_before={str(date_before)[:10]}&date_start_after={str(date_after)[:10]}"
+        response = self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions?ordering={'' if ascending else '-'}{ordering}&page={page}&search={search}&date_start_before={str(date_before)[:10]}&date_start_after={str(date_after)[:10]}",
         )
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Competition)
+
+    @_traced
+    def iter_find_competitions(
+        self,
+        search: str = "",
+        date_after: str | datetime = "",
+        date_before: str | datetime | None = None,
+        order_by_date: bool = False,
+        ascending: bool = False,
+        prefetch: bool = True,
+    ) -> Iterator[_SubCompetitionList]:
+        """Iterate over all competitions found by name, location and/or date.
+
+        Args:
+            search (str): Search parameter for location and/or name. Defaults \
+                    to ""
+            date_after (str | datetime): Search after date.
+            date_before (str | datetime): Search before date. If left as \
+                    `None`, it will default to today's date.
+            order_by_date (bool): To order by date.
+            ascending (bool): Ascending order for date search.
+            prefetch (bool): Fetch the next page in the background. Defaults \
+                    to `True`.
+
+        Yields:
+            _SubCompetitionList: Each competition found.
+
+        Examples:
+            Typical use:
+            >>> competitions = list(
+                    api.iter_find_competitions(date_after="2022-01-01")
+                    )
+        """
+        if date_before is None:
+            # fixed once, so every page uses the same search
+            date_before = datetime.now()
+        yield from iter_results(
+            lambda page: self.find_competition(
+                search=search,
+                page=page,
+                date_after=date_after,
+                date_before=date_before,
+                order_by_date=order_by_date,
+                ascending=ascending,
+            ),
+            prefetch=prefetch,
+        )
 
+    @_traced
     def create_competition(
         self,
         date_start: str | datetime,  # date format YYYY-MM-DD
@@ -466,11 +1457,9 @@ class LifterAPI:
         """Create a competition.
 
         NB: Competitions can be duplicated. There is no check for an existing \
-                competition. A good idea is to loop through all the \
-                competitions using `lifter_api.LifterAPI.competitions` and \
-                search for competitions with a similar date or name. In the \
-                future, a check will be added to reduce the change of \
-                duplicated competition.
+                competition. Use \
+                `lifter_api.LifterAPI.get_or_create_competition` to only \
+                create it if it does not exist.
 
         Args:
             date_start (str): Start date of the competition. Format: \
@@ -502,9 +1491,9 @@ class LifterAPI:
             >>> api.create_competition(**competition)
             # TODO: output
         """
-        response = requests.post(
+        response = self._authorized_request(
+            "POST",
             f"{self._url}/{self._version}/competitions",
-            headers=self._provide_authorization_header(),
             json={
                 "date_start": verify_date(date_start),
                 "date_end": verify_date(date_end),
@@ -513,8 +1502,124 @@ class LifterAPI:
             },
         )
         response.raise_for_status()
-        return response.json()
+        competition = self._json(response, Competition)
+        self._remember_exists(
+            "competition", f"competitions/{competition['reference_id']}", True
+        )
+        with self.__competition_index_lock:
+            # not while the index is being refreshed, or it may be lost
+            if self._competition_index is not None:
+                self._competition_index.add(competition)
+        return competition
+
+    @_traced
+    def refresh_competition_index(self) -> CompetitionIndex:
+        """Bring the local index of competitions up to date.
+
+        The first call indexes every competition. Later calls only fetch \
+                competitions starting on or after the latest one indexed, \
+                then compare the number indexed with the count of the API, \
+                and index every competition again if they differ, e.g. \
+                after older competitions were added or some were deleted \
+                by another client. Competitions created, edited or deleted \
+                through this client are kept up to date as they happen.
 
+        Returns:
+            CompetitionIndex: The index.
+        """
+        with self.__competition_index_lock:
+            if self._competition_index is None:
+                self._competition_index = CompetitionIndex(
+                    self.iter_competitions()
+                )
+                return self._competition_index
+            index = self._competition_index
+            count = self.competitions()["count"]
+            if index.latest_date_start is not None:
+                for competition in self.iter_find_competitions(
+                    date_after=index.latest_date_start,
+                    date_before=FAR_FUTURE_DATE,
+                ):
+                    index.add(competition)
+            if len(index) != count:
+                index = self._competition_index = CompetitionIndex(
+                    self.iter_competitions()
+                )
+            return index
+
+    @_traced
+    def get_or_create_competition(
+        self,
+        date_start: str | datetime,
+        date_end: str | datetime,
+        location: str,
+        name: str,
+        refresh: bool = False,
+    ) -> tuple[_SubCompetitionList | CompetitionDetail, bool]:
+        """Get a competition, creating it if it does not exist.
+
+        Existing competitions are matched locally by name, location and \
+                dates, ignoring case, accents and hyphens, using an index \
+                that is refreshed incrementally instead of scanning every \
+                competition. A match needs no requests; the index is only \
+                refreshed when it has no match, before creating the \
+                competition. Concurrent calls for the same competition are \
+                run one at a time, so it is only created once.
+
+        Args:
+            date_start (str): Start date of the competition. Format: \
+                    YYYY-MM-DD.
+            date_end (str): End date of the competition. Format: YYYY-MM-DD.
+            location (str): Location of the competition.
+            name (str): The name of the competition.
+            refresh (bool): Refresh the index before matching, even if it \
+                    has a match, e.g. if competitions may have been \
+                    deleted by another client. Defaults to `False`.
+
+        Returns:
+            tuple[_SubCompetitionList | CompetitionDetail, bool]: The \
+                    competition, and whether it was created.
+
+        Examples:
+            Typical use:
+            >>> competition, created = api.get_or_create_competition(
+                    date_start="2020-01-01",
+                    date_end="2020-01-02",
+                    location="Example Place",
+                    name="Example Competition"
+                    )
+        """
+        date_start = verify_date(date_start)
+        date_end = verify_date(date_end)
+        key = CompetitionIndex.key(name, location, date_start, date_end)
+        lock = self.__competition_locks[
+            hash(key) % len(self.__competition_locks)
+        ]
+        with lock:
+            index = self._competition_index
+            if index is None or refresh:
+                index = self.refresh_competition_index()
+                found = index.match(name, location, date_start, date_end)
+            else:
+                # refreshed on a miss, in case another client created it
+                found = index.match(
+                    name, location, date_start, date_end
+                ) or self.refresh_competition_index().match(
+                    name, location, date_start, date_end
+                )
+            if found:
+                return found[0], False
+            return (
+                self.create_competition(
+                    date_start=date_start,
+                    date_end=date_end,
+                    location=location,
+                    name=name,
+                ),
+                True,
+            )
+
+    @_traced
     @_check_id
     def edit_competition(
         self, competition_id: str, **kwargs
@@ -535,14 +1640,23 @@ class LifterAPI:
             >>> # TODO
         """
         verify_edit_kwargs(kwargs, COMPETITION_FIELDS)
-        response = requests.patch(
+        response = self._authorized_request(
+            "PATCH",
             f"{self._url}/{self._version}/competitions/{competition_id}",
-            headers=self._provide_authorization_header(),
             json=kwargs,
         )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
         response.raise_for_status()
-        return response.json()
+        competition = self._json(response, Competition)
+        with self.__competition_index_lock:
+            if self._competition_index is not None:
+                self._competition_index.add(competition)
+        return competition
 
+    @_traced
     @_check_id
     def delete_competition(self, competition_id: str) -> DetailResponse:
         """Delete a competition.
@@ -559,13 +1673,24 @@ class LifterAPI:
             >>> api.delete_competition(competition_id='ab345l')
             { "detail": "Competition_ID: 'ab345l' entry deleted."}
         """
-        response = requests.delete(
+        response = self._authorized_request(
+            "DELETE",
             f"{self._url}/{self._version}/competitions/{competition_id}",
-            headers=self._provide_authorization_header(),
         )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
         response.raise_for_status()
+        self._remember_exists(
+            "competition", f"competitions/{competition_id}", False
+        )
+        with self.__competition_index_lock:
+            if self._competition_index is not None:
+                self._competition_index.discard(competition_id)
         return {"detail": f"Competition ID: '{competition_id}' entry deleted."}
 
+    @_traced
     @_check_id
     def lifts(self, competition_id: str) -> list[LiftDetail] | DetailResponse:
         """Provide lifts and competitions.
@@ -587,12 +1712,18 @@ class LifterAPI:
             >>> api.lifts(competition_id=competition_id)
             # TODO: output
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/competitions/{competition_id}/lifts"
+        response = self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts",
         )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Lift)
 
+    @_traced
     @_check_id
     def get_lift(
         self, competition_id: str, lift_id: str
@@ -616,14 +1747,16 @@ class LifterAPI:
                     athlete_id=athlete_id
                     )
         """
-        response = requests.get(
-            f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}"
+        response = self._request(
+            "GET",
+            f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
         )
         if response.status_code == 404:
-            return {"detail": f"Lift ID: '{lift_id}' does not exist."}
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Lift)
 
+    @_traced
     @_check_id
     def create_lift(
         self,
@@ -734,52 +1867,222 @@ class LifterAPI:
             # TODO: output
         """
         # validate lifts
-        verify_lifts(
-            (str(snatch_first), int(snatch_first_weight)),
-            (str(snatch_second), int(snatch_second_weight)),
-            (str(snatch_third), int(snatch_third_weight)),
-        )
-        verify_lifts(
-            (str(cnj_first), int(cnj_first_weight)),
-            (str(cnj_second), int(cnj_second_weight)),
-            (str(cnj_third), int(cnj_third_weight)),
+        payload = build_lift_payload(
+            competition_id=competition_id,
+            athlete_id=athlete_id,
+            snatch_first=snatch_first,
+            snatch_first_weight=snatch_first_weight,
+            snatch_second=snatch_second,
+            snatch_second_weight=snatch_second_weight,
+            snatch_third=snatch_third,
+            snatch_third_weight=snatch_third_weight,
+            cnj_first=cnj_first,
+            cnj_first_weight=cnj_first_weight,
+            cnj_second=cnj_second,
+            cnj_second_weight=cnj_second_weight,
+            cnj_third=cnj_third,
+            cnj_third_weight=cnj_third_weight,
+            bodyweight=bodyweight,
+            weight_category=weight_category,
+            session_number=session_number,
+            team=team,
+            lottery_number=lottery_number,
         )
-        response = requests.post(
+        response = self._authorized_request(
+            "POST",
             f"{self._url}/{self._version}/competitions/{competition_id}/lifts",
-            headers=self._provide_authorization_header(),
-            json={
-                "competition": competition_id,
-                "athlete": athlete_id,
-                "snatch_first": snatch_first,
-                "snatch_first_weight": snatch_first_weight,
-                "snatch_second": snatch_second,
-                "snatch_second_weight": snatch_second_weight,
-                "snatch_third": snatch_third,
-                "snatch_third_weight": snatch_third_weight,
-                "cnj_first": cnj_first,
-                "cnj_first_weight": cnj_first_weight,
-                "cnj_second": cnj_second,
-                "cnj_second_weight": cnj_second_weight,
-                "cnj_third": cnj_third,
-                "cnj_third_weight": cnj_third_weight,
-                "bodyweight": float(bodyweight),
-                "weight_category": str(weight_category),
-                "session_number": int(session_number),
-                "team": str(team),
-                "lottery_number": int(lottery_number),
-            },
+            json=payload,
         )
+        if response.status_code == 404:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
         if response.status_code == 400:
-            # TODO: need to fix type checking below?
+            detail = self._lift_rejected(competition_id, athlete_id)
+            if detail:
+                return {"detail": detail}
+        response.raise_for_status()
+        return self._json(response, Lift)
+
+    def _lift_rejected(
+        self,
+        competition_id: str,
+        athlete_id: str,
+        competition: CompetitionDetail | DetailResponse | None = None,
+    ) -> str | None:
+        """Find why the API rejected a lift with a 400.
+
+        Args:
+            competition_id (str): Competition ID.
+            athlete_id (str): Athlete ID.
+            competition (CompetitionDetail | DetailResponse | None): The \
+                    competition fetched after the lift was rejected. \
+                    Defaults to `None`, which fetches it.
+
+        Returns:
+            str | None: The "detail" message if the athlete is already in \
+                    the competition or, when IDs are not checked before \
+                    calls, does not exist. Otherwise `None`.
+        """
+        if competition is None:
             competition = self.get_competition(competition_id=competition_id)
-            lifts = competition["lift_set"]  # type: ignore
-            if athlete_id in (lift["athlete"] for lift in lifts):  # type: ignore
-                return {
-                    "detail": f"Error: athlete, '{athlete_id}', already in competition, '{competition_id}'"
+        if "detail" in competition:
+            # deleted since, so there is nothing to explain
+            return None
+        if athlete_id in _entered(competition):
+            return ALREADY_ENTERED.format(athlete_id, competition_id)
+        if self._check_ids == "off":
+            # the athlete was not checked before the call
+            return self._check_exists("athlete", athlete_id=athlete_id) or None
+        return None
+
+    @staticmethod
+    def _validate_lifts(
+        competition_id: str, lifts: Iterable[dict]
+    ) -> tuple[list[BulkLiftResult], dict[int, dict]]:
+        """Validate rows of lifts locally for `create_lifts`.
+
+        Returns:
+            tuple[list[BulkLiftResult], dict[int, dict]]: A report per row, \
+                    with the `detail` set for invalid rows, and the payloads \
+                    of valid rows by row number.
+        """
+        results: list[BulkLiftResult] = []
+        payloads: dict[int, dict] = {}
+        for row, lift in enumerate(lifts):
+            results.append(
+                {
+                    "row": row,
+                    "athlete_id": (
+                        lift.get("athlete_id")
+                        if isinstance(lift, Mapping)
+                        else None
+                    ),
+                    "lift": None,
+                    "detail": None,
                 }
-        response.raise_for_status()
-        return response.json()
+            )
+            if not results[row]["athlete_id"]:
+                results[row]["detail"] = BULK_ROW_ERROR
+                continue
+            try:
+                payloads[row] = build_lift_payload(
+                    competition_id=competition_id, **lift
+                )
+            except (InvalidLiftsError, TypeError, ValueError) as error:
+                results[row]["detail"] = str(error)
+        return results, payloads
+
+    @_traced
+    def create_lifts(
+        self,
+        competition_id: str,
+        lifts: Iterable[dict],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[BulkLiftResult]:
+        """Create many lifts in an existing competition, e.g. a whole session.
+
+        Every row is validated locally before anything is sent. The \
+                competition is fetched once, each distinct athlete is \
+                checked once with a HEAD request (unless `check_ids` is \
+                "off") and duplicates are found from the fetched \
+                `lift_set`, so only the valid rows are posted, \
+                `max_workers` at a time. A row failing does not stop the \
+                others.
+
+        Args:
+            competition_id (str): Competition ID.
+            lifts (Iterable[dict]): Rows with the same keyword arguments as \
+                    `create_lift`, apart from `competition_id`.
+            max_workers (int): Maximum number of lifts posted at once. \
+                    Defaults to `DEFAULT_MAX_WORKERS`.
 
+        Returns:
+            list[BulkLiftResult]: One report per row, in order, with the \
+                    created `lift` or the `detail` of why it failed.
+
+        Examples:
+            Importing a session:
+            >>> rows = [
+                    {"athlete_id": "ab345l", "snatch_first": "LIFT", ...},
+                    {"athlete_id": "cd678m", "snatch_first": "DNA", ...},
+                    ]
+            >>> report = api.create_lifts(competition_id="123def7", lifts=rows)
+            >>> [row for row in report if row["detail"]]
+            # rows that were not created
+        """
+        results, payloads = self._validate_lifts(competition_id, lifts)
+        if not payloads:
+            return results
+
+        competition = self.get_competition(competition_id=competition_id)
+        if "detail" in competition:
+            for row in payloads:
+                results[row]["detail"] = competition["detail"]
+            return results
+        entered = _entered(competition)
+
+        not_exists = self._check_athletes_exist(
+            {payload["athlete"] for payload in payloads.values()},
+            max_workers=max_workers,
+        )
+        with ContextThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(payloads)))
+        ) as executor:
+            posted: dict[int, Future[requests.Response]] = {}
+            for row, payload in payloads.items():
+                athlete_id = payload["athlete"]
+                detail = not_exists.get(athlete_id)
+                if detail:
+                    results[row]["detail"] = detail
+                elif athlete_id in entered:
+                    results[row]["detail"] = ALREADY_ENTERED.format(
+                        athlete_id, competition_id
+                    )
+                else:
+                    entered.add(athlete_id)
+                    posted[row] = executor.submit(
+                        self._authorized_request,
+                        "POST",
+                        f"{self._url}/{self._version}/competitions/{competition_id}/lifts",
+                        json=payload,
+                    )
+            self._collect_lifts(competition_id, posted, payloads, results)
+        return results
+
+    def _collect_lifts(
+        self,
+        competition_id: str,
+        posted: dict[int, Future[requests.Response]],
+        payloads: dict[int, dict],
+        results: list[BulkLiftResult],
+    ) -> None:
+        """Report the lifts posted by `create_lifts` as they finish.
+
+        The competition is fetched again once, after the first row the \
+                API rejects, to explain every rejected row.
+        """
+        rejected: CompetitionDetail | DetailResponse | None = None
+        for row, future in posted.items():
+            try:
+                response = future.result()
+                if response.status_code == 400:
+                    if rejected is None:
+                        rejected = self.get_competition(
+                            competition_id=competition_id
+                        )
+                    results[row]["detail"] = self._lift_rejected(
+                        competition_id, payloads[row]["athlete"], rejected
+                    )
+                    if results[row]["detail"]:
+                        continue
+                response.raise_for_status()
+            except requests.RequestException as error:
+                results[row]["detail"] = str(error)
+            else:
+                results[row]["lift"] = self._json(response, Lift)
+
+    @_traced
     @_check_id
     def edit_lift(
         self, competition_id: str, lift_id: str, **kwargs
@@ -798,14 +2101,17 @@ class LifterAPI:
            >>> # TODO
         """
         verify_edit_kwargs(kwargs, LIFT_FIELDS)
-        response = requests.patch(
+        response = self._authorized_request(
+            "PATCH",
             f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
-            headers=self._provide_authorization_header(),
             json=kwargs,
         )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
         response.raise_for_status()
-        return response.json()
+        return self._json(response, Lift)
 
+    @_traced
     @_check_id
     def delete_lift(self, competition_id: str, lift_id: str) -> DetailResponse:
         """Delete an existing lift.
@@ -821,9 +2127,19 @@ class LifterAPI:
         Examples:
             >>> #  TODO
         """
-        response = requests.delete(
+        response = self._authorized_request(
+            "DELETE",
             f"{self._url}/{self._version}/competitions/{competition_id}/lifts/{lift_id}",
-            headers=self._provide_authorization_header(),
         )
+        if response.status_code == 404:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
         response.raise_for_status()
+        self._remember_exists(
+            "lift", f"competitions/{competition_id}/lifts/{lift_id}", False
+        )
         return {"detail": f"Lift ID: '{lift_id}' entry deleted."}
+
+
+def _entered(competition: CompetitionDetail) -> set[str]:
+    """IDs of the athletes with a lift in a competition."""
+    return {lift["athlete"] for lift in competition["lift_set"]}
@@ -0,0 +1,441 @@
+"""Local SQLite mirror of the Lifter API module."""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .main import LifterAPI
+from .utils.deadline import ContextThreadPoolExecutor
+from .utils.defaults import (
+    DEFAULT_MAX_WORKERS,
+    DOES_NOT_EXIST,
+    FAR_FUTURE_DATE,
+    MIRROR_LOOKBACK_DAYS,
+    MIRROR_PAGE_SIZE,
+)
+from .utils.exceptions import NotAllowedError
+from .utils.pagination import iter_results
+from .utils.types import (
+    AthleteDetail,
+    AthleteList,
+    CompetitionDetail,
+    CompetitionList,
+    DetailResponse,
+    LiftDetail,
+    _SubAthleteList,
+    _SubCompetitionList,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS athletes (
+    reference_id TEXT PRIMARY KEY,
+    first_name TEXT,
+    last_name TEXT,
+    search TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS competitions (
+    reference_id TEXT PRIMARY KEY,
+    date_start TEXT,
+    search TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS lifts (
+    reference_id TEXT PRIMARY KEY,
+    competition TEXT,
+    athlete TEXT,
+    lottery_number INTEGER,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS lifts_competition ON lifts (competition);
+CREATE INDEX IF NOT EXISTS lifts_athlete ON lifts (athlete);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class LifterMirror:
+    """Local copy of athletes, competitions and lifts in SQLite.
+
+    The first `sync` copies everything, fetching competitions in parallel. \
+            Later syncs only fetch competitions starting from \
+            `lookback_days` before the last sync, with any athletes they \
+            introduce. The read methods take the same arguments and return \
+            the same data as those of `LifterAPI`, without the network.
+
+    NB: Incremental syncs do not notice competitions or athletes deleted \
+            from the API, or lifts added to competitions that started \
+            before the lookback window. Use `sync(full=True)` for those.
+
+    Args:
+        api (LifterAPI): Client used to sync.
+        path (str | os.PathLike): SQLite file, created if missing. Defaults \
+                to ":memory:", which keeps the mirror in memory.
+        max_workers (int): Maximum number of requests sent at once while \
+                syncing. Defaults to `DEFAULT_MAX_WORKERS`.
+        lookback_days (int): Days before the last sync from which \
+                competitions are fetched again, to pick up late results. \
+                Defaults to `MIRROR_LOOKBACK_DAYS`.
+        page_size (int): Results per page of the list and find methods. \
+                Defaults to `MIRROR_PAGE_SIZE`.
+
+    Examples:
+        Syncing, then reading offline:
+        >>> from lifter_api import LifterAPI, LifterMirror
+        >>> mirror = LifterMirror(LifterAPI(), "lifter.sqlite")
+        >>> mirror.sync()
+        {"athletes": 1000, "competitions": 100, "lifts": 5000}
+        >>> mirror.get_competition(competition_id="123def7")
+    """
+
+    def __init__(
+        self,
+        api: LifterAPI,
+        path: str | os.PathLike = ":memory:",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        lookback_days: int = MIRROR_LOOKBACK_DAYS,
+        page_size: int = MIRROR_PAGE_SIZE,
+    ) -> None:
+        """Init method."""
+        self._api = api
+        self.max_workers = max_workers
+        self.lookback_days = lookback_days
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False
+        )
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        self._connection.close()
+
+    @property
+    def last_sync(self) -> date | None:
+        """Date of the last sync, or `None` if never synced."""
+        row = self._query_one("SELECT value FROM meta WHERE key = 'last_sync'")
+        return None if row is None else date.fromisoformat(row[0])
+
+    def sync(self, full: bool = False) -> dict[str, int]:
+        """Bring the mirror up to date.
+
+        Args:
+            full (bool): Copy everything again, even if synced before. \
+                    Defaults to `False`.
+
+        Returns:
+            dict[str, int]: Number of athletes, competitions and lifts \
+                    fetched.
+        """
+        started = date.today()
+        last_sync = None if full else self.last_sync
+        if last_sync is None:
+            athletes = self._api.fetch_all_athletes(
+                max_workers=self.max_workers
+            )
+            competitions = self._api.fetch_all_competitions(
+                max_workers=self.max_workers
+            )
+        else:
+            athletes = []
+            competitions = list(
+                self._api.iter_find_competitions(
+                    date_after=(
+                        last_sync - timedelta(days=self.lookback_days)
+                    ).isoformat(),
+                    date_before=FAR_FUTURE_DATE,
+                )
+            )
+
+        details = self._map(
+            lambda competition: self._api.get_competition(
+                competition_id=competition["reference_id"]
+            ),
+            competitions,
+        )
+        lifts = [
+            (competition["reference_id"], lift)
+            for competition, detail in zip(competitions, details)
+            for lift in detail.get("lift_set", [])
+        ]
+        if last_sync is not None:
+            # athletes first seen in the new lifts
+            athletes = self._fetch_missing_athletes(lifts)
+
+        with self._lock, self._connection:
+            if last_sync is None:
+                for table in ("athletes", "competitions", "lifts"):
+                    self._connection.execute(f"DELETE FROM {table}")
+            self._store(athletes, competitions, lifts)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_sync', ?)",
+                (started.isoformat(),),
+            )
+        return {
+            "athletes": len(athletes),
+            "competitions": len(competitions),
+            "lifts": len(lifts),
+        }
+
+    def _map(self, func, items: list) -> list:
+        """Call `func` on every item concurrently, keeping the order."""
+        if not items:
+            return []
+        with ContextThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(items)))
+        ) as executor:
+            return list(executor.map(func, items))
+
+    def _fetch_missing_athletes(
+        self, lifts: list[tuple[str, LiftDetail]]
+    ) -> list[AthleteDetail]:
+        """Fetch the athletes of `lifts` that are not mirrored yet."""
+        athlete_ids = {lift["athlete"] for _, lift in lifts}  # type: ignore
+        known = {
+            row[0]
+            for row in self._query_all("SELECT reference_id FROM athletes")
+        }
+        athletes = self._map(
+            lambda athlete_id: self._api.get_athlete(athlete_id=athlete_id),
+            sorted(athlete_ids - known),
+        )
+        return [athlete for athlete in athletes if "detail" not in athlete]
+
+    def _store(
+        self,
+        athletes: list,
+        competitions: list,
+        lifts: list[tuple[str, LiftDetail]],
+    ) -> None:
+        """Write records, replacing the lifts of every competition given."""
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO athletes VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    athlete["reference_id"],
+                    athlete["first_name"].casefold(),
+                    athlete["last_name"].casefold(),
+                    f"{athlete['first_name']} {athlete['last_name']}".casefold(),
+                    json.dumps(
+                        {k: v for k, v in athlete.items() if k != "lift_set"}
+                    ),
+                )
+                for athlete in athletes
+            ],
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO competitions VALUES (?, ?, ?, ?)",
+            [
+                (
+                    competition["reference_id"],
+                    str(competition["date_start"])[:10],
+                    f"{competition['name']} {competition['location']}".casefold(),
+                    json.dumps(
+                        {
+                            k: v
+                            for k, v in competition.items()
+                            if k != "lift_set"
+                        }
+                    ),
+                )
+                for competition in competitions
+            ],
+        )
+        self._connection.executemany(
+            "DELETE FROM lifts WHERE competition = ?",
+            [(competition["reference_id"],) for competition in competitions],
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO lifts VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    lift["reference_id"],
+                    competition_id,
+                    lift["athlete"],  # type: ignore
+                    int(lift.get("lottery_number") or 0),
+                    # `dict` also takes the models of `models=True` clients
+                    json.dumps(dict(lift)),
+                )
+                for competition_id, lift in lifts
+            ],
+        )
+
+    def _query_all(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query, returning all rows."""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> tuple | None:
+        """Run a query, returning the first row."""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchone()
+
+    def _page(
+        self, table: str, where: str, params: tuple, order: str, page: int
+    ) -> dict[str, Any]:
+        """Page of results shaped like the API's paginated responses.
+
+        Raises:
+            ValueError: `page` is less than 1.
+        """
+        if page < 1:
+            raise ValueError(f"Invalid page: {page}. Pages start at 1.")
+        count = self._query_all(
+            f"SELECT COUNT(*) FROM {table} WHERE {where}", params
+        )[0][0]
+        rows = self._query_all(
+            f"SELECT data FROM {table} WHERE {where} ORDER BY {order} "
+            "LIMIT ? OFFSET ?",
+            (*params, self.page_size, (page - 1) * self.page_size),
+        )
+        return {
+            "count": count,
+            "next": (
+                f"mirror://{table}?page={page + 1}"
+                if page * self.page_size < count
+                else None
+            ),
+            "previous": (
+                f"mirror://{table}?page={page - 1}" if page > 1 else None
+            ),
+            "results": [json.loads(row[0]) for row in rows],
+        }
+
+    def _lift_set(self, column: str, reference_id: str) -> list[LiftDetail]:
+        """Lifts of a competition or athlete."""
+        rows = self._query_all(
+            f"SELECT data FROM lifts WHERE {column} = ? "
+            "ORDER BY lottery_number",
+            (reference_id,),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def athletes(self, page: int = 1) -> AthleteList:
+        """List all athletes, like `LifterAPI.athletes`."""
+        return self._page(
+            "athletes", "1", (), "last_name, first_name", page
+        )  # type: ignore
+
+    def iter_athletes(self) -> Iterator[_SubAthleteList]:
+        """Iterate over all athletes, like `LifterAPI.iter_athletes`."""
+        return iter_results(
+            lambda page: self.athletes(page=page), prefetch=False
+        )
+
+    def get_athlete(self, athlete_id: str) -> AthleteDetail | DetailResponse:
+        """Get an athlete and their lifts, like `LifterAPI.get_athlete`."""
+        row = self._query_one(
+            "SELECT data FROM athletes WHERE reference_id = ?", (athlete_id,)
+        )
+        if row is None:
+            return {"detail": DOES_NOT_EXIST["athlete"].format(athlete_id)}
+        athlete: AthleteDetail = json.loads(row[0])
+        athlete["lift_set"] = self._lift_set("athlete", athlete_id)
+        return athlete
+
+    def find_athlete(
+        self,
+        search: str,
+        page: int = 1,
+        ordering: str = "last_name",
+        ascending: bool = True,
+    ) -> AthleteList:
+        """Find athletes by name, like `LifterAPI.find_athlete`."""
+        if ordering not in ["last_name", "first_name"]:
+            raise NotAllowedError(
+                message=f"'{ordering}' not a correcting argument. `last_name` and `first_name`"
+            )
+        return self._page(
+            "athletes",
+            "instr(search, ?) > 0",
+            (search.casefold(),),
+            f"{ordering} {'ASC' if ascending else 'DESC'}",
+            page,
+        )  # type: ignore
+
+    def competitions(self, page: int = 1) -> CompetitionList:
+        """List all competitions, like `LifterAPI.competitions`."""
+        return self._page(
+            "competitions", "1", (), "date_start DESC", page
+        )  # type: ignore
+
+    def iter_competitions(self) -> Iterator[_SubCompetitionList]:
+        """Iterate over all competitions, like \
+                `LifterAPI.iter_competitions`."""
+        return iter_results(
+            lambda page: self.competitions(page=page), prefetch=False
+        )
+
+    def get_competition(
+        self, competition_id: str
+    ) -> CompetitionDetail | DetailResponse:
+        """Get a competition and its lifts, like \
+                `LifterAPI.get_competition`."""
+        row = self._query_one(
+            "SELECT data FROM competitions WHERE reference_id = ?",
+            (competition_id,),
+        )
+        if row is None:
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        competition: CompetitionDetail = json.loads(row[0])
+        competition["lift_set"] = self._lift_set("competition", competition_id)
+        return competition
+
+    def find_competition(
+        self,
+        search: str = "",
+        page: int = 1,
+        date_after: str | datetime = "",
+        date_before: str | datetime | None = None,
+        order_by_date: bool = False,
+        ascending: bool = False,
+    ) -> CompetitionList:
+        """Find competitions by name, location and/or date, like \
+                `LifterAPI.find_competition`."""
+        if date_before is None:
+            date_before = datetime.now()
+        where = ["instr(search, ?) > 0", "date_start <= ?"]
+        params = [search.casefold(), str(date_before)[:10]]
+        if date_after:
+            where.append("date_start >= ?")
+            params.append(str(date_after)[:10])
+        order = "reference_id"
+        if order_by_date:
+            order = f"date_start {'ASC' if ascending else 'DESC'}"
+        return self._page(
+            "competitions", " AND ".join(where), tuple(params), order, page
+        )  # type: ignore
+
+    def lifts(self, competition_id: str) -> list[LiftDetail] | DetailResponse:
+        """List the lifts of a competition, like `LifterAPI.lifts`."""
+        if (
+            self._query_one(
+                "SELECT 1 FROM competitions WHERE reference_id = ?",
+                (competition_id,),
+            )
+            is None
+        ):
+            return {
+                "detail": DOES_NOT_EXIST["competition"].format(competition_id)
+            }
+        return self._lift_set("competition", competition_id)
+
+    def get_lift(
+        self, competition_id: str, lift_id: str
+    ) -> LiftDetail | DetailResponse:
+        """Get a lift, like `LifterAPI.get_lift`."""
+        row = self._query_one(
+            "SELECT data FROM lifts WHERE reference_id = ? "
+            "AND competition = ?",
+            (lift_id, competition_id),
+        )
+        if row is None:
+            return {"detail": DOES_NOT_EXIST["lift"].format(lift_id)}
+        return json.loads(row[0])
@@ -0,0 +1,315 @@
+"""Compact model objects for API payloads.
+
+Enabled with `LifterAPI(models=True)`. Models use `__slots__` instead of a \
+        dictionary per record, statuses are shared `LiftStatus` members, \
+        repeated strings such as teams and categories are interned, and \
+        nested sections are only parsed when first used. They can still be \
+        read like the dictionaries they replace.
+"""
+
+import sys
+from collections.abc import Iterator, Mapping
+from enum import Enum
+from typing import Any, NamedTuple, TypeVar
+
+_PLACINGS = ("1st", "2nd", "3rd")
+_M = TypeVar("_M", bound="Model")
+
+
+class LiftStatus(str, Enum):
+    """Outcome of an attempt. Members compare equal to their strings."""
+
+    LIFT = "LIFT"
+    NOLIFT = "NOLIFT"
+    DNA = "DNA"
+
+    def __str__(self) -> str:
+        """Plain value, e.g. "LIFT"."""
+        return self.value
+
+
+class Attempt(NamedTuple):
+    """One attempt of a lift."""
+
+    status: LiftStatus | str | None
+    weight: int | None
+
+
+class Model(Mapping[str, Any]):
+    """Base of the models; reads like the dictionary it was built from.
+
+    Keys missing from the payload are left unset, so `to_dict` gives back \
+            the same keys. Keys the model does not know are kept in \
+            `_extra`.
+    """
+
+    __slots__ = ("_extra",)
+    _extra: dict[str, Any] | None
+    _fields: tuple[str, ...] = ()
+    _interned: frozenset[str] = frozenset()
+    _statuses: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls: type[_M], data: Mapping[str, Any]) -> _M:
+        """Build a model from a payload."""
+        model = cls.__new__(cls)
+        extra: dict[str, Any] | None = None
+        for key, value in data.items():
+            if key in cls._fields:
+                if key in cls._interned and isinstance(value, str):
+                    value = sys.intern(value)
+                elif key in cls._statuses:
+                    value = _status(value)
+                setattr(model, _slot(key), value)
+            elif key not in _DERIVED:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        model._extra = extra
+        return model
+
+    def __getitem__(self, key: str) -> Any:
+        """Read a value like a dictionary."""
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        elif key in self._derived_keys():
+            return self._derived(key)
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Keys present in the payload."""
+        for key in self._fields:
+            if hasattr(self, _slot(key)):
+                yield key
+        yield from self._derived_keys()
+        if self._extra is not None:
+            yield from self._extra
+
+    def _derived_keys(self) -> tuple[str, ...]:
+        """Keys of sections rebuilt from other fields."""
+        return ()
+
+    def _derived(self, key: str) -> Any:
+        """Rebuild a section from other fields."""
+        raise KeyError(key)
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Show the reference ID."""
+        reference_id = getattr(self, "reference_id", None)
+        return f"{type(self).__name__}(reference_id={reference_id!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert back to the payload, including nested sections."""
+        return {key: _plain(self[key]) for key in self}
+
+
+# sections the API derives from other fields, rebuilt instead of stored
+_DERIVED = {"snatches": "snatch", "cnjs": "cnj"}
+
+
+def _slot(key: str) -> str:
+    """Slot holding a field; nested sections are parsed on first use."""
+    return f"_{key}" if key in _NESTED else key
+
+
+def _status(value: Any) -> Any:
+    """Shared `LiftStatus` member for a status string."""
+    try:
+        return LiftStatus(value)
+    except ValueError:
+        return value
+
+
+def _plain(value: Any) -> Any:
+    """Convert models, statuses and lists of models to plain values."""
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, LiftStatus):
+        return value.value
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+_NESTED = frozenset(("lift_set",))
+
+
+class Lift(Model):
+    """A lift of an athlete in a competition.
+
+    `snatches` and `cnjs` are tuples of `Attempt` built on access; read \
+            as items they give the API's nested dictionaries.
+    """
+
+    _fields = (
+        "url",
+        "reference_id",
+        "lottery_number",
+        "athlete",
+        "athlete_name",
+        "athlete_yearborn",
+        "competition",
+        "competition_name",
+        "competition_date_start",
+        "snatch_first",
+        "snatch_first_weight",
+        "snatch_second",
+        "snatch_second_weight",
+        "snatch_third",
+        "snatch_third_weight",
+        "best_snatch_weight",
+        "cnj_first",
+        "cnj_first_weight",
+        "cnj_second",
+        "cnj_second_weight",
+        "cnj_third",
+        "cnj_third_weight",
+        "best_cnj_weight",
+        "total_lifted",
+        "session_number",
+        "bodyweight",
+        "age_categories",
+        "weight_category",
+        "team",
+        "placing",
+    )
+    __slots__ = _fields
+    _interned = frozenset(
+        (
+            "athlete",
+            "athlete_name",
+            "competition",
+            "competition_name",
+            "competition_date_start",
+            "weight_category",
+            "team",
+            "placing",
+        )
+    )
+    _statuses = frozenset(
+        (
+            "snatch_first",
+            "snatch_second",
+            "snatch_third",
+            "cnj_first",
+            "cnj_second",
+            "cnj_third",
+        )
+    )
+
+    def _attempts(self, lift: str) -> tuple[Attempt, Attempt, Attempt]:
+        """Attempts of "snatch" or "cnj"."""
+        first, second, third = (
+            Attempt(
+                getattr(self, f"{lift}_{number}", None),
+                getattr(self, f"{lift}_{number}_weight", None),
+            )
+            for number in ("first", "second", "third")
+        )
+        return first, second, third
+
+    @property
+    def snatches(self) -> tuple[Attempt, Attempt, Attempt]:
+        """Snatch attempts."""
+        return self._attempts("snatch")
+
+    @property
+    def cnjs(self) -> tuple[Attempt, Attempt, Attempt]:
+        """Clean and jerk attempts."""
+        return self._attempts("cnj")
+
+    def _derived_keys(self) -> tuple[str, ...]:
+        """`snatches` and `cnjs`, if the payload had their attempts."""
+        return tuple(
+            key
+            for key, lift in _DERIVED.items()
+            if hasattr(self, f"{lift}_first")
+        )
+
+    def _derived(self, key: str) -> dict[str, dict[str, Any]]:
+        """`snatches` or `cnjs` as the API's nested dictionaries."""
+        return {
+            placing: {"lift_status": _plain(status), "weight": weight}
+            for placing, (status, weight) in zip(
+                _PLACINGS, self._attempts(_DERIVED[key])
+            )
+        }
+
+
+class _WithLifts(Model):
+    """Model with a `lift_set`, parsed into `Lift` models on first use."""
+
+    __slots__ = ()
+    # payload dictionaries until parsed, then `Lift` models
+    _lift_set: list[Any]
+
+    @property
+    def lift_set(self) -> list[Lift]:
+        """Lifts, parsed on first use."""
+        lifts = self._lift_set
+        if lifts and not isinstance(lifts[0], Lift):
+            lifts = [Lift.from_dict(lift) for lift in lifts]
+            self._lift_set = lifts
+        return lifts
+
+
+class Athlete(_WithLifts):
+    """An athlete. `lift_set` is only in athlete detail."""
+
+    _fields = (
+        "reference_id",
+        "url",
+        "full_name",
+        "first_name",
+        "last_name",
+        "yearborn",
+        "age_categories",
+        "lift_set",
+    )
+    __slots__ = tuple(_slot(field) for field in _fields)
+
+
+class Competition(_WithLifts):
+    """A competition. `lift_set` is only in competition detail."""
+
+    _fields = (
+        "url",
+        "reference_id",
+        "date_start",
+        "date_end",
+        "location",
+        "name",
+        "lifts_count",
+        "lift_set",
+    )
+    __slots__ = tuple(_slot(field) for field in _fields)
+    _interned = frozenset(("location",))
+
+
+def to_models(model: type[Model], data: Any) -> Any:
+    """Convert a payload to models.
+
+    Args:
+        model (type[Model]): Model of the records.
+        data (Any): A record, a list of records, or a page with `results`.
+
+    Returns:
+        Any: The same shape with records as models. "detail" responses \
+                are left as they are.
+    """
+    if isinstance(data, list):
+        return [model.from_dict(record) for record in data]
+    if not isinstance(data, dict) or "detail" in data:
+        return data
+    if "results" in data:
+        return {**data, "results": to_models(model, data["results"])}
+    return model.from_dict(data)
@@ -0,0 +1,272 @@
+"""Columnar tables of lifts for analysis."""
+
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+from .models import Lift
+from .utils.defaults import LIFT_STATUS_CODES
+from .utils.types import LiftDetail
+
+# columns, by how they are stored
+STATUS_COLUMNS = (
+    "snatch_first",
+    "snatch_second",
+    "snatch_third",
+    "cnj_first",
+    "cnj_second",
+    "cnj_third",
+)
+INT_COLUMNS = (
+    "lottery_number",
+    "session_number",
+    "athlete_yearborn",
+    "snatch_first_weight",
+    "snatch_second_weight",
+    "snatch_third_weight",
+    "cnj_first_weight",
+    "cnj_second_weight",
+    "cnj_third_weight",
+    "total_lifted",
+)
+FLOAT_COLUMNS = ("bodyweight",)
+FLAG_COLUMNS = ("is_youth", "is_junior", "is_senior", "is_master")
+STRING_COLUMNS = (
+    "reference_id",
+    "athlete",
+    "athlete_name",
+    "competition",
+    "competition_name",
+    "competition_date_start",
+    "weight_category",
+    "team",
+    "placing",
+)
+
+
+def _to_int(value: Any) -> int:
+    """Read a number, e.g. a weight or "3", as 0 if it is not one."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _to_float(value: Any) -> float:
+    """Read a number as NaN if it is not one."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class DictionaryColumn:
+    """Strings stored as codes into a list of distinct values."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.codes = array("i")
+        self.values: list[str] = []
+        self._lookup: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        """Decoded values, row by row."""
+        values = self.values
+        return (values[code] for code in self.codes)
+
+    def append(self, value: str) -> None:
+        """Add a row."""
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class LiftTable:
+    """Lifts as typed, contiguous columns.
+
+    Weights and other numbers are `array` columns, lift statuses are \
+            `LIFT_STATUS_CODES` (-1 if unknown), age categories are 0/1 \
+            flags, and strings such as weight categories and teams are \
+            dictionary encoded. Nested payloads are flattened as they are \
+            added, so no list of dictionaries is kept.
+
+    Examples:
+        From a competition:
+        >>> table = LiftTable.from_lifts(api.lifts(competition_id="123def7"))
+        >>> table["snatch_first_weight"]
+        array('i', [90, 85, ...])
+
+        Exporting:
+        >>> table.to_csv("lifts.csv")
+        >>> table.to_npz("lifts.npz")  # needs numpy
+        >>> table.to_parquet("lifts.parquet")  # needs pyarrow
+    """
+
+    columns = (
+        STRING_COLUMNS
+        + INT_COLUMNS
+        + FLOAT_COLUMNS
+        + STATUS_COLUMNS
+        + FLAG_COLUMNS
+    )
+
+    def __init__(self) -> None:
+        """Init method."""
+        self._strings = {name: DictionaryColumn() for name in STRING_COLUMNS}
+        self._ints: dict[str, "array[int]"] = {
+            name: array("i") for name in INT_COLUMNS
+        }
+        self._floats: dict[str, "array[float]"] = {
+            name: array("d") for name in FLOAT_COLUMNS
+        }
+        # statuses and flags, as small codes
+        self._codes: dict[str, "array[int]"] = {
+            name: array("b") for name in STATUS_COLUMNS + FLAG_COLUMNS
+        }
+        self._columns: dict[str, "array[Any] | DictionaryColumn"] = {
+            **self._strings,
+            **self._ints,
+            **self._floats,
+            **self._codes,
+        }
+
+    @classmethod
+    def from_lifts(cls, lifts: Iterable[LiftDetail | Lift]) -> "LiftTable":
+        """Build a table from lift payloads, e.g. a `lift_set`."""
+        table = cls()
+        table.extend(lifts)
+        return table
+
+    def __len__(self) -> int:
+        """Number of lifts."""
+        return len(self._columns["reference_id"])
+
+    def __getitem__(self, name: str) -> "array[Any] | DictionaryColumn":
+        """Get a column by name."""
+        return self._columns[name]
+
+    def append(self, lift: LiftDetail | Lift) -> None:
+        """Add a lift."""
+        for name, strings in self._strings.items():
+            value = lift.get(name)
+            strings.append("" if value is None else str(value))
+        for name, ints in self._ints.items():
+            ints.append(_to_int(lift.get(name)))
+        for name, floats in self._floats.items():
+            floats.append(_to_float(lift.get(name)))
+        for name in STATUS_COLUMNS:
+            self._codes[name].append(
+                LIFT_STATUS_CODES.get(str(lift.get(name)), -1)
+            )
+        age_categories = lift.get("age_categories") or {}
+        for name in FLAG_COLUMNS:
+            self._codes[name].append(int(bool(age_categories.get(name))))
+
+    def extend(self, lifts: Iterable[LiftDetail | Lift]) -> None:
+        """Add lifts one at a time, so `lifts` can be a stream."""
+        for lift in lifts:
+            self.append(lift)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Columns as NumPy arrays, sharing memory with the table.
+
+        Dictionary encoded columns are given as their codes, with their \
+                distinct values under "<name>_values". Needs `numpy`.
+
+        Returns:
+            dict[str, numpy.ndarray]: Arrays by column name.
+        """
+        import numpy as np
+
+        arrays = {}
+        for name, column in self._columns.items():
+            if isinstance(column, DictionaryColumn):
+                arrays[name] = np.asarray(column.codes)
+                arrays[f"{name}_values"] = np.array(column.values, dtype=str)
+            else:
+                arrays[name] = np.asarray(column)
+        return arrays
+
+    def to_npz(self, path: str | os.PathLike, compressed: bool = True) -> None:
+        """Save the columns of `to_numpy` as a NumPy `.npz` file."""
+        import numpy as np
+
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **self.to_numpy())
+
+    def to_parquet(self, path: str | os.PathLike) -> None:
+        """Save as a Parquet file, keeping dictionary encoding.
+
+        Needs `pyarrow`.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {"i": pa.int32(), "b": pa.int8(), "d": pa.float64()}
+
+        def _arrow(column: "array[Any]"):
+            return pa.Array.from_buffers(
+                types[column.typecode],
+                len(column),
+                [None, pa.py_buffer(column)],
+            )
+
+        arrays = []
+        for column in self._columns.values():
+            if isinstance(column, DictionaryColumn):
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        _arrow(column.codes), pa.array(column.values)
+                    )
+                )
+            else:
+                arrays.append(_arrow(column))
+        pq.write_table(
+            pa.Table.from_arrays(arrays, names=list(self._columns)), path
+        )
+
+    def to_csv(self, file: str | os.PathLike | IO[str]) -> None:
+        """Save as CSV, with statuses and strings decoded.
+
+        Args:
+            file (str | os.PathLike | IO[str]): Path or open text file.
+        """
+        import csv
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", newline="") as opened:
+                self.to_csv(opened)
+            return
+
+        statuses = {code: status for status, code in LIFT_STATUS_CODES.items()}
+        columns: list[Iterable[Any]] = []
+        for name, column in self._columns.items():
+            if name in STATUS_COLUMNS:
+                columns.append(
+                    statuses.get(code, "") for code in self._codes[name]
+                )
+            else:
+                columns.append(column)
+        writer = csv.writer(file)
+        writer.writerow(self._columns)
+        writer.writerows(zip(*columns))
+
+
+def lifts_to_columns(lifts: Iterable[LiftDetail | Lift]) -> LiftTable:
+    """Convert lift payloads to a columnar `LiftTable`.
+
+    Args:
+        lifts (Iterable[LiftDetail | Lift]): Lifts, e.g. a `lift_set` or \
+            a stream.
+
+    Returns:
+        LiftTable: The lifts as columns.
+    """
+    return LiftTable.from_lifts(lifts)
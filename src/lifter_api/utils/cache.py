@@ -0,0 +1,327 @@
+"""Caches used by `LifterAPI`."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .defaults import (
+    EXISTENCE_CACHE_TTL,
+    RESPONSE_CACHE_MAXSIZE,
+    RESPONSE_CACHE_TTLS,
+)
+
+
+class ExistenceCache:
+    """Short-lived record of which IDs exist.
+
+    Used by the `_check_id` decorator so repeated calls for the same \
+            athlete, competition or lift do not each probe the API.
+
+    Args:
+        ttl (float): Seconds an entry is trusted for. Defaults to \
+                `EXISTENCE_CACHE_TTL`.
+    """
+
+    def __init__(self, ttl: float = EXISTENCE_CACHE_TTL) -> None:
+        """Init method."""
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, key: str) -> bool | None:
+        """Look up whether an ID exists.
+
+        Args:
+            kind (str): "athlete", "competition" or "lift".
+            key (str): The ID.
+
+        Returns:
+            bool | None: Whether it exists, or `None` if unknown or expired.
+        """
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is None:
+                return None
+            exists, expires = entry
+            if expires < time.monotonic():
+                del self._entries[(kind, key)]
+                return None
+            return exists
+
+    def set(self, kind: str, key: str, exists: bool) -> None:
+        """Record whether an ID exists."""
+        with self._lock:
+            self._entries[(kind, key)] = (exists, time.monotonic() + self.ttl)
+
+    def discard(self, kind: str, key: str) -> None:
+        """Forget an ID."""
+        with self._lock:
+            self._entries.pop((kind, key), None)
+
+    def clear(self) -> None:
+        """Forget all IDs."""
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheEntry(NamedTuple):
+    """Cached response body and its validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored: float
+
+
+class MemoryCacheBackend:
+    """Keep cached responses in memory, evicting the least recently used.
+
+    Args:
+        maxsize (int): Maximum number of responses kept. Defaults to \
+                `RESPONSE_CACHE_MAXSIZE`.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_MAXSIZE) -> None:
+        """Init method."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete all entries with keys starting with `prefix`."""
+        with self._lock:
+            for key in [
+                key for key in self._entries if key.startswith(prefix)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheBackend:
+    """Keep cached responses in an SQLite file, evicting the least recently \
+            used.
+
+    Args:
+        path (str | os.PathLike): SQLite file, created if missing.
+        maxsize (int): Maximum number of responses kept. Defaults to \
+                `RESPONSE_CACHE_MAXSIZE`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        maxsize: int = RESPONSE_CACHE_MAXSIZE,
+    ) -> None:
+        """Init method."""
+        # imported here so `import lifter_api` does not load sqlite3
+        import sqlite3
+
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, body BLOB, etag TEXT, "
+                "last_modified TEXT, stored REAL, accessed REAL)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get an entry, marking it as recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored FROM entries "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, *entry, time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete all entries with keys starting with `prefix`."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM entries WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+
+class ResponseCache:
+    """Cache of GET responses keyed by URL and query string.
+
+    Responses are reused without asking the API until their time to live \
+            runs out. After that, they are revalidated with \
+            `If-None-Match`/`If-Modified-Since`, so an unchanged response \
+            costs a 304 without a body.
+
+    Args:
+        backend (MemoryCacheBackend | DiskCacheBackend | None): Where \
+                responses are kept. Defaults to `None`, which keeps them in \
+                memory.
+        ttls (dict[str, float] | None): Seconds responses are reused \
+                without revalidating, by endpoint type: "athlete", \
+                "competition", "lift", "list" or "search". Defaults to \
+                `None`, which uses `RESPONSE_CACHE_TTLS`.
+
+    Examples:
+        In memory:
+        >>> from lifter_api import LifterAPI, ResponseCache
+        >>> api = LifterAPI(cache=ResponseCache())
+
+        On disk, keeping competitions for a day:
+        >>> from lifter_api.utils.cache import DiskCacheBackend
+        >>> cache = ResponseCache(
+                backend=DiskCacheBackend("lifter.sqlite"),
+                ttls={"competition": 86400},
+                )
+    """
+
+    def __init__(
+        self,
+        backend: MemoryCacheBackend | DiskCacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        """Init method."""
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = {**RESPONSE_CACHE_TTLS, **(ttls or {})}
+
+    @staticmethod
+    def endpoint_type(url: str) -> str:
+        """Work out the endpoint type of a URL, which sets its TTL.
+
+        Args:
+            url (str): Full URL.
+
+        Returns:
+            str: "athlete", "competition", "lift", "list" or "search".
+        """
+        parts = urlsplit(url)
+        if "search=" in parts.query:
+            return "search"
+        segments = [segment for segment in parts.path.split("/") if segment]
+        # e.g. ["v1", "competitions", "<id>", "lifts", "<id>"]
+        if len(segments) >= 4:
+            return "lift"
+        if len(segments) == 3:
+            return "athlete" if segments[1] == "athletes" else "competition"
+        return "list"
+
+    def lookup(self, url: str) -> tuple[CacheEntry | None, bool]:
+        """Look up a response.
+
+        Args:
+            url (str): Full URL.
+
+        Returns:
+            tuple[CacheEntry | None, bool]: The entry, if any, and whether \
+                    it can be used without revalidating.
+        """
+        entry = self.backend.get(url)
+        if entry is None:
+            return None, False
+        ttl = self.ttls[self.endpoint_type(url)]
+        return entry, time.time() - entry.stored < ttl
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """Store a successful response."""
+        self.backend.set(
+            url,
+            CacheEntry(
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                time.time(),
+            ),
+        )
+
+    def revalidated(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """Mark an entry as fresh after the API answered 304."""
+        entry = entry._replace(stored=time.time())
+        self.backend.set(url, entry)
+        return entry
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop all responses with URLs starting with any of `prefixes`."""
+        for prefix in prefixes:
+            self.backend.delete_prefix(prefix)
+
+    def clear(self) -> None:
+        """Drop all responses."""
+        self.backend.clear()
+
+
+def conditional_headers(entry: CacheEntry) -> dict[str, str]:
+    """Headers to revalidate a cached response."""
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def cached_response(url: str, entry: CacheEntry) -> requests.Response:
+    """Build a response from a cached entry.
+
+    The `X-Lifter-Cache` header is set to "HIT".
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.reason = "OK"
+    response._content = entry.body
+    response.headers["Content-Type"] = "application/json"
+    response.headers["X-Lifter-Cache"] = "HIT"
+    if entry.etag:
+        response.headers["ETag"] = entry.etag
+    return response
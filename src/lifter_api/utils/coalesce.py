@@ -0,0 +1,85 @@
+"""Sharing of identical requests that are in flight at the same time."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .deadline import remaining
+from .exceptions import DeadlineExceededError
+
+
+class _Call:
+    """A request in flight, and its outcome once it has finished."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Run identical concurrent calls once, sharing the result.
+
+    The first call for a key runs; calls for the same key made while it is \
+            running wait for it and get the same result, or the same \
+            exception. Calls made after it has finished run again, so \
+            nothing is cached.
+
+    Attributes:
+        shared (int): Number of calls that waited for another instead of \
+                running.
+    """
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.shared = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call `func`, unless a call for `key` is already running.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. method and URL.
+            func (Callable[[], Any]): The call.
+
+        Raises:
+            DeadlineExceededError: The current deadline passed while \
+                    waiting for another call.
+
+        Returns:
+            Any: The result of `func`, possibly from another thread.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                running = False
+            else:
+                self.shared += 1
+                running = True
+        if running:
+            return self._wait(call)
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @staticmethod
+    def _wait(call: _Call) -> Any:
+        """Wait for a call made by another thread, within the deadline."""
+        if not call.done.wait(remaining()):
+            raise DeadlineExceededError(message="Deadline exceeded.")
+        if call.error is not None:
+            raise call.error
+        return call.result
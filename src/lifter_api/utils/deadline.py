@@ -0,0 +1,117 @@
+"""Deadlines and timeouts that apply to every request in a block of code."""
+
+import contextvars
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from .exceptions import DeadlineExceededError
+
+Timeout = float | tuple[float, float] | None
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "lifter_api_deadline", default=None
+)
+# the `timeout` override, in a tuple so `(None,)` can mean no timeout
+_timeout: contextvars.ContextVar[tuple[Timeout] | None] = (
+    contextvars.ContextVar("lifter_api_timeout", default=None)
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Give every request sent in the block `seconds` to finish in total.
+
+    Requests are sent with their timeouts cut to the time left, and once \
+            it has run out, any further request raises \
+            `DeadlineExceededError`. An inner deadline cannot extend an \
+            outer one.
+
+    Args:
+        seconds (float): Seconds from now.
+
+    Examples:
+        >>> with deadline(10):
+        ...     api.lifts(competition_id="123def7")
+    """
+    expires = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def timeout(seconds: Timeout) -> Iterator[None]:
+    """Override the transport timeout for requests sent in the block.
+
+    Args:
+        seconds (float | tuple[float, float] | None): Timeout in seconds, \
+                either a single value or `(connect, read)`, or `None` for \
+                no timeout.
+
+    Examples:
+        >>> with timeout((2, 5)):
+        ...     api.get_athlete(athlete_id="ab345l")
+    """
+    token = _timeout.set((seconds,))
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or `None` if none is set."""
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def request_timeout(default: Timeout) -> Timeout:
+    """Timeout for a request sent now.
+
+    Uses the `timeout` override or `default`, cut to the time left before \
+            the deadline.
+
+    Args:
+        default (float | tuple[float, float] | None): Transport timeout.
+
+    Raises:
+        DeadlineExceededError: The deadline has passed.
+
+    Returns:
+        float | tuple[float, float] | None: Timeout to send with.
+    """
+    override = _timeout.get()
+    chosen = default if override is None else override[0]
+    left = remaining()
+    if left is None:
+        return chosen
+    if left <= 0:
+        raise DeadlineExceededError(message="Deadline exceeded.")
+    if chosen is None:
+        return left
+    if isinstance(chosen, tuple):
+        connect, read = chosen
+        return min(connect, left), min(read, left)
+    return min(chosen, left)
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool running each task in a copy of the submitter's context.
+
+    Deadlines and timeouts set around a bulk or paginated call then also \
+            apply to the requests its worker threads send.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Submit `fn` to run in a copy of the current context."""
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
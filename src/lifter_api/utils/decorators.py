@@ -1,37 +1,48 @@
 """Decorators for mixins."""
 
-from collections.abc import Callable
+import inspect
+from collections.abc import Callable, Iterator
 from functools import wraps
+from typing import Any
+
+from .metrics import tagged
 
 
 def _check_id(func: Callable) -> Callable:
     """Check competition ID - Decorator.
 
     An incorrect id will return a dictionary containing the key "detail".
+    How the IDs are checked is set by the `check_ids` policy of the client, \
+            and the check is skipped entirely if it is "off".
     """
 
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> dict[str, str] | Callable:
         """Wrap function."""
+        if self._check_ids == "off":
+            return func(self, *args, **kwargs)
+
         not_exists = {}
 
         athlete_id = kwargs.get("athlete_id")
-        if athlete_id and func.__name__ != "get_athlete":
-            not_exists["athlete"] = self.get_athlete(
-                athlete_id=athlete_id
-            ).get("detail", False)
-
         competition_id = kwargs.get("competition_id")
-        if competition_id and func.__name__ != "get_competition":
-            not_exists["competition"] = self.get_competition(
-                competition_id=competition_id
-            ).get("detail", False)
-
         lift_id = kwargs.get("lift_id")
-        if lift_id and func.__name__ != "get_lift":
-            not_exists["lift"] = self.get_lift(
-                competition_id=competition_id, lift_id=lift_id
-            ).get("detail", False)
+        # tagged so that metrics can tell the checks from the call itself
+        with tagged("preflight"):
+            if athlete_id and func.__name__ != "get_athlete":
+                not_exists["athlete"] = self._check_exists(
+                    "athlete", athlete_id=athlete_id
+                )
+
+            if competition_id and func.__name__ != "get_competition":
+                not_exists["competition"] = self._check_exists(
+                    "competition", competition_id=competition_id
+                )
+
+            if lift_id and func.__name__ != "get_lift":
+                not_exists["lift"] = self._check_exists(
+                    "lift", competition_id=competition_id, lift_id=lift_id
+                )
 
         cleaned_not_exists = list(not_exists.values())
         if any(cleaned_not_exists):
@@ -44,3 +55,101 @@ def _check_id(func: Callable) -> Callable:
         return func(self, *args, **kwargs)
 
     return wrapper
+
+
+def _async_check_id(func: Callable) -> Callable:
+    """Check IDs of a coroutine method - Decorator.
+
+    Same as `_check_id`, but the IDs are checked concurrently.
+    """
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs) -> dict[str, str] | Any:
+        """Wrap coroutine."""
+        # imported here so `import lifter_api` does not load asyncio
+        import asyncio
+
+        if self._check_ids == "off":
+            return await func(self, *args, **kwargs)
+
+        checks = []
+
+        athlete_id = kwargs.get("athlete_id")
+        if athlete_id and func.__name__ != "get_athlete":
+            checks.append(self._check_exists("athlete", athlete_id=athlete_id))
+
+        competition_id = kwargs.get("competition_id")
+        if competition_id and func.__name__ != "get_competition":
+            checks.append(
+                self._check_exists(
+                    "competition", competition_id=competition_id
+                )
+            )
+
+        lift_id = kwargs.get("lift_id")
+        if lift_id and func.__name__ != "get_lift":
+            checks.append(
+                self._check_exists(
+                    "lift", competition_id=competition_id, lift_id=lift_id
+                )
+            )
+
+        not_exists = await asyncio.gather(*checks)
+        if any(not_exists):
+            return {"detail": " ".join([item for item in not_exists if item])}
+
+        return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _traced(func: Callable) -> Callable:
+    """Trace a public method - Decorator.
+
+    If the client has a tracer, the call runs in a span named after the \
+            method, with the IDs it was given as attributes, so the \
+            requests it sends become its child spans. Should be applied \
+            above `_check_id`, so the ID checks are included. The span of \
+            a generator covers its iteration.
+    """
+
+    def _attributes(kwargs: dict[str, Any]) -> dict[str, Any]:
+        """IDs the method was given, as span attributes."""
+        return {
+            f"lifter.{key}": value
+            for key, value in kwargs.items()
+            if key.endswith("_id")
+        }
+
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def generator_wrapper(self, *args, **kwargs) -> Iterator[Any]:
+            """Wrap generator."""
+            if self._tracer is None:
+                return (yield from func(self, *args, **kwargs))
+            return (
+                yield from self._tracer.iterate(
+                    f"LifterAPI.{func.__name__}",
+                    func(self, *args, **kwargs),
+                    _attributes(kwargs),
+                )
+            )
+
+        return generator_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs) -> Any:
+        """Wrap function."""
+        if self._tracer is None:
+            return func(self, *args, **kwargs)
+
+        with self._tracer.start_span(
+            f"LifterAPI.{func.__name__}", _attributes(kwargs)
+        ) as span:
+            result = func(self, *args, **kwargs)
+            if isinstance(result, dict) and "detail" in result:
+                span.set_attribute("lifter.detail", result["detail"])
+            return result
+
+    return wrapper
@@ -5,6 +5,82 @@ TEST_URL = "http://0.0.0.0:8000"
 LIVE_URL = "https://api.lifter.shivan.xyz"
 VERSION = "v1"
 
+# connection pooling and timeouts (seconds) for the HTTP transport
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# content encodings, best first; only those urllib3 can decode are sent
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+
+# retries: attempts per request, backoff in seconds, and what is retried
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_MAX_BACKOFF = 30.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE")
+
+# methods counted as reads by the rate limiter; all others are writes
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# upper bounds, in seconds, of the latency histograms of `MetricsCollector`
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# requests sent at once by bulk helpers, kept within the connection pool
+DEFAULT_MAX_WORKERS = 8
+
+# seconds before expiry at which an access token is refreshed
+TOKEN_REFRESH_SKEW = 30.0
+
+# locks shared out between the competitions `get_or_create_competition` is
+# called for, so concurrent calls for the same one run one at a time
+COMPETITION_LOCK_STRIPES = 32
+
+# how `_check_id` checks IDs exist before a call, and for how long (seconds)
+# the "cache" policy trusts the result
+CHECK_IDS_POLICIES = ["get", "head", "cache", "off"]
+EXISTENCE_CACHE_TTL = 60.0
+
+# responses kept by the response cache, and seconds they are reused without
+# revalidating by endpoint type
+RESPONSE_CACHE_MAXSIZE = 1024
+RESPONSE_CACHE_TTLS = {
+    "athlete": 300.0,
+    "competition": 300.0,
+    "lift": 300.0,
+    "list": 60.0,
+    "search": 60.0,
+}
+
+# "detail" messages returned when an ID does not exist
+DOES_NOT_EXIST = {
+    "athlete": "Athlete ID: '{}' does not exist.",
+    "competition": "Competition ID: '{}' does not exist.",
+    "lift": "Lift ID: '{}' does not exist.",
+}
+ALREADY_ENTERED = "Error: athlete, '{}', already in competition, '{}'"
+BULK_ROW_ERROR = "Error: row must be a dictionary with an 'athlete_id'"
+
+# lift statuses, their codes for batch validation, and the messages for lift
+# sequences that are not valid
+LIFT_STATUS_CODES = {"LIFT": 0, "NOLIFT": 1, "DNA": 2}
+LIFT_STATUS_ERROR = "Check lift status must be 'LIFT', 'NOLIFT' or 'DNA'"
+LIFT_MADE_ERROR = (
+    " Lifts cannot be less than equal to previous. CHECK: {} lifts."
+)
+LIFT_MISSED_ERROR = "Lifts cannot be less than previous lift. CHECK: {} lifts."
+
+# days before the last sync from which the mirror fetches competitions again,
+# and results per page of its list and find methods
+MIRROR_LOOKBACK_DAYS = 30
+MIRROR_PAGE_SIZE = 20
+
+# bytes read at a time when streaming a `lift_set`
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# "date_before" for searches that should include upcoming competitions
+FAR_FUTURE_DATE = "9999-12-31"
+
 # field required for creation/deletion
 ATHLETE_FIELDS = ["first_name", "last_name", "yearborn"]
 COMPETITION_FIELDS = ["date_start", "date_end", "location", "name"]
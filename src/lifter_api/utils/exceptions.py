@@ -36,3 +36,7 @@ class InvalidDateTimeError(Error):
 
 class InvalidLiftsError(Error):
     """Check if the Lifts are valid."""
+
+
+class DeadlineExceededError(Error):
+    """The deadline for a block of requests has passed."""
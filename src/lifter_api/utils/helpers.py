@@ -3,8 +3,16 @@
 import os
 from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
 
-from .defaults import LIVE_URL, TEST_URL
+from .defaults import (
+    LIFT_MADE_ERROR,
+    LIFT_MISSED_ERROR,
+    LIFT_STATUS_CODES,
+    LIFT_STATUS_ERROR,
+    LIVE_URL,
+    TEST_URL,
+)
 from .exceptions import (
     InvalidDateError,
     InvalidLiftsError,
@@ -105,10 +113,8 @@ def verify_lifts(
     for i, lift in enumerate(lifts):
         # lift[0] is lift_status ("LIFT", "NOLIFT", "DNA")
         # lift [1] is weight
-        if lift[0] not in ["LIFT", "NOLIFT", "DNA"]:
-            raise InvalidLiftsError(
-                message="Check lift status must be 'LIFT', 'NOLIFT' or 'DNA'"
-            )
+        if lift[0] not in LIFT_STATUS_CODES:
+            raise InvalidLiftsError(message=LIFT_STATUS_ERROR)
         if i < 2:
             if (
                 lift[0] == "LIFT"
@@ -118,7 +124,7 @@ def verify_lifts(
                 # if lift is made
                 # the next weight must be greater than previous, unless it's DNA
                 raise InvalidLiftsError(
-                    message=f" Lifts cannot be less than equal to previous. CHECK: {DICT_PLACING[i+1]} lifts."
+                    message=LIFT_MADE_ERROR.format(DICT_PLACING[i + 1])
                 )
             if (
                 lift[0] == "NOLIFT"
@@ -128,6 +134,158 @@ def verify_lifts(
                 # if lift is a no life
                 # the next weight must be greater than or equal to the previous unless it's a DNA
                 raise InvalidLiftsError(
-                    message=f"Lifts cannot be less than previous lift. CHECK: {DICT_PLACING[i+1]} lifts."
+                    message=LIFT_MISSED_ERROR.format(DICT_PLACING[i + 1])
                 )
     return True
+
+
+def _lift_sequence_errors(statuses: Any, weights: Any) -> Any:
+    """Find the first error of each row of three attempts.
+
+    The checks run in the same order as `verify_lifts`, so each row gets \
+            the message `verify_lifts` would have raised.
+
+    Returns:
+        numpy.ndarray: Error message per row, "" if valid.
+    """
+    import numpy as np
+
+    # reshaped so that no rows gives an empty (0, 3) sheet
+    statuses = np.asarray(statuses).reshape(-1, 3)
+    weights = np.asarray(weights, dtype=float).reshape(-1, 3)
+    if statuses.dtype.kind in "OSU":
+        codes = np.full(statuses.shape, -1)
+        for status, code in LIFT_STATUS_CODES.items():
+            codes[statuses == status] = code
+    else:
+        codes = statuses
+    valid = np.isin(codes, list(LIFT_STATUS_CODES.values()))
+
+    conditions, messages = [], []
+    for i, placing in enumerate(["2nd", "3rd", None]):
+        conditions.append(~valid[:, i])
+        messages.append(LIFT_STATUS_ERROR)
+        if placing is None:
+            break
+        attempted = codes[:, i + 1] != LIFT_STATUS_CODES["DNA"]
+        conditions.append(
+            (codes[:, i] == LIFT_STATUS_CODES["LIFT"])
+            & attempted
+            & (weights[:, i] >= weights[:, i + 1])
+        )
+        messages.append(LIFT_MADE_ERROR.format(placing))
+        conditions.append(
+            (codes[:, i] == LIFT_STATUS_CODES["NOLIFT"])
+            & attempted
+            & (weights[:, i] > weights[:, i + 1])
+        )
+        messages.append(LIFT_MISSED_ERROR.format(placing))
+    # `select` takes the first condition that holds for each row
+    return np.select(conditions, np.array(messages, dtype=object), default="")
+
+
+def verify_lifts_batch(
+    snatch_statuses: Any,
+    snatch_weights: Any,
+    cnj_statuses: Any,
+    cnj_weights: Any,
+) -> tuple[Any, Any]:
+    """Validate many lifts at once, e.g. a whole results sheet.
+
+    Applies the rules of `verify_lifts` to every row together instead of \
+            raising on the first bad row. Needs `numpy`, installed with \
+            `pip install lifter-api-wrapper[batch]`.
+
+    Args:
+        snatch_statuses (array-like): Snatch statuses, shape (rows, 3). \
+                Either "LIFT", "NOLIFT", "DNA" or their `LIFT_STATUS_CODES`.
+        snatch_weights (array-like): Snatch weights, shape (rows, 3).
+        cnj_statuses (array-like): Clean and jerk statuses, as above.
+        cnj_weights (array-like): Clean and jerk weights, as above.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Mask of rows that are not \
+                valid, and the message `verify_lifts` would raise for each \
+                row ("" if valid). Snatch errors are reported first.
+
+    Examples:
+        >>> invalid, reasons = verify_lifts_batch(
+                [["LIFT", "NOLIFT", "LIFT"], ["LIFT", "LIFT", "DNA"]],
+                [[90, 95, 95], [90, 85, 0]],
+                [["LIFT", "DNA", "DNA"], ["LIFT", "LIFT", "LIFT"]],
+                [[120, 0, 0], [110, 115, 120]],
+                )
+        >>> invalid
+        array([False,  True])
+    """
+    import numpy as np
+
+    snatch_errors = _lift_sequence_errors(snatch_statuses, snatch_weights)
+    cnj_errors = _lift_sequence_errors(cnj_statuses, cnj_weights)
+    reasons = np.where(snatch_errors != "", snatch_errors, cnj_errors)
+    return reasons != "", reasons
+
+
+def build_lift_payload(
+    competition_id: str,
+    athlete_id: str,
+    snatch_first: str,
+    snatch_first_weight: int,
+    snatch_second: str,
+    snatch_second_weight: int,
+    snatch_third: str,
+    snatch_third_weight: int,
+    cnj_first: str,
+    cnj_first_weight: int,
+    cnj_second: str,
+    cnj_second_weight: int,
+    cnj_third: str,
+    cnj_third_weight: int,
+    bodyweight: float,
+    weight_category: str,
+    session_number: int,
+    team: str,
+    lottery_number: int,
+) -> dict:
+    """Validate a lift and build the payload to create it.
+
+    Takes the same arguments as `lifter_api.LifterAPI.create_lift`, so \
+            missing or unknown fields raise `TypeError`.
+
+    Raises:
+        InvalidLiftsError: incorrect lift sequence, or wrong lift_status label used
+
+    Returns:
+        dict: Payload for the create lift endpoint.
+    """
+    verify_lifts(
+        (str(snatch_first), int(snatch_first_weight)),
+        (str(snatch_second), int(snatch_second_weight)),
+        (str(snatch_third), int(snatch_third_weight)),
+    )
+    verify_lifts(
+        (str(cnj_first), int(cnj_first_weight)),
+        (str(cnj_second), int(cnj_second_weight)),
+        (str(cnj_third), int(cnj_third_weight)),
+    )
+    return {
+        "competition": competition_id,
+        "athlete": athlete_id,
+        "snatch_first": snatch_first,
+        "snatch_first_weight": snatch_first_weight,
+        "snatch_second": snatch_second,
+        "snatch_second_weight": snatch_second_weight,
+        "snatch_third": snatch_third,
+        "snatch_third_weight": snatch_third_weight,
+        "cnj_first": cnj_first,
+        "cnj_first_weight": cnj_first_weight,
+        "cnj_second": cnj_second,
+        "cnj_second_weight": cnj_second_weight,
+        "cnj_third": cnj_third,
+        "cnj_third_weight": cnj_third_weight,
+        "bodyweight": float(bodyweight),
+        "weight_category": str(weight_category),
+        "session_number": int(session_number),
+        "team": str(team),
+        "lottery_number": int(lottery_number),
+    }
@@ -0,0 +1,181 @@
+"""In-memory indexes for matching records without asking the API."""
+
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .types import _SubAthleteList, _SubCompetitionList
+
+AthleteKey = tuple[str, str, int]
+CompetitionKey = tuple[str, str, str, str]
+
+
+def normalise_name(name: str) -> str:
+    """Normalise a name for matching.
+
+    Case, accents (e.g. macrons), hyphens and repeated spaces are ignored.
+
+    Args:
+        name (str): Name.
+
+    Returns:
+        str: Normalised name.
+
+    Examples:
+        >>> normalise_name("  Tāne  Smith-Jones ")
+        'tane smith jones'
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return " ".join(stripped.replace("-", " ").casefold().split())
+
+
+class AthleteIndex:
+    """Athletes by normalised first name, last name and birth year.
+
+    Args:
+        athletes (Iterable[_SubAthleteList]): Athletes to index, e.g. \
+                `LifterAPI.iter_athletes()`. Defaults to none.
+
+    Examples:
+        Indexing all athletes once:
+        >>> index = AthleteIndex(api.iter_athletes())
+        >>> index.match("Example", "Athlete", 1990)
+        # athletes with that name and birth year
+    """
+
+    def __init__(self, athletes: Iterable[_SubAthleteList] = ()) -> None:
+        """Init method."""
+        self._athletes: defaultdict[AthleteKey, list[_SubAthleteList]] = (
+            defaultdict(list)
+        )
+        for athlete in athletes:
+            self.add(athlete)
+
+    def __len__(self) -> int:
+        """Number of athletes indexed."""
+        return sum(len(athletes) for athletes in self._athletes.values())
+
+    @staticmethod
+    def key(first_name: str, last_name: str, yearborn: int) -> AthleteKey:
+        """Key an athlete is indexed by."""
+        return (
+            normalise_name(first_name),
+            normalise_name(last_name),
+            int(yearborn),
+        )
+
+    def add(self, athlete: _SubAthleteList) -> None:
+        """Index an athlete."""
+        self._athletes[
+            self.key(
+                athlete["first_name"],
+                athlete["last_name"],
+                athlete["yearborn"],
+            )
+        ].append(athlete)
+
+    def match(
+        self, first_name: str, last_name: str, yearborn: int
+    ) -> list[_SubAthleteList]:
+        """Find the indexed athletes with a name and birth year.
+
+        Returns:
+            list[_SubAthleteList]: Matching athletes; more than one means \
+                    the match is ambiguous.
+        """
+        return list(
+            self._athletes.get(self.key(first_name, last_name, yearborn), [])
+        )
+
+
+class CompetitionIndex:
+    """Competitions by normalised name, location and dates.
+
+    Keeps the latest `date_start` seen, so it can be refreshed with only \
+            the competitions starting on or after it.
+
+    Args:
+        competitions (Iterable[_SubCompetitionList]): Competitions to \
+                index, e.g. `LifterAPI.iter_competitions()`. Defaults to \
+                none.
+
+    Examples:
+        >>> index = CompetitionIndex(api.iter_competitions())
+        >>> index.match("Example Competition", "Example Place",
+                "2020-01-01", "2020-01-02")
+        # competitions with those details
+    """
+
+    def __init__(
+        self, competitions: Iterable[_SubCompetitionList] = ()
+    ) -> None:
+        """Init method."""
+        self._competitions: dict[str, _SubCompetitionList] = {}
+        self._keys: defaultdict[CompetitionKey, set[str]] = defaultdict(set)
+        self.latest_date_start: str | None = None
+        for competition in competitions:
+            self.add(competition)
+
+    def __len__(self) -> int:
+        """Number of competitions indexed."""
+        return len(self._competitions)
+
+    @staticmethod
+    def key(
+        name: str, location: str, date_start: str, date_end: str
+    ) -> CompetitionKey:
+        """Key a competition is indexed by."""
+        return (
+            normalise_name(name),
+            normalise_name(location),
+            str(date_start)[:10],
+            str(date_end)[:10],
+        )
+
+    def add(self, competition: _SubCompetitionList) -> None:
+        """Index a competition, replacing it if already indexed."""
+        reference_id = competition["reference_id"]
+        self.discard(reference_id)
+        self._competitions[reference_id] = competition
+        self._keys[
+            self.key(
+                competition["name"],
+                competition["location"],
+                competition["date_start"],
+                competition["date_end"],
+            )
+        ].add(reference_id)
+        date_start = str(competition["date_start"])[:10]
+        if (
+            self.latest_date_start is None
+            or date_start > self.latest_date_start
+        ):
+            self.latest_date_start = date_start
+
+    def discard(self, reference_id: str) -> None:
+        """Stop indexing a competition, e.g. after it is deleted."""
+        competition = self._competitions.pop(reference_id, None)
+        if competition is None:
+            return
+        self._keys[
+            self.key(
+                competition["name"],
+                competition["location"],
+                competition["date_start"],
+                competition["date_end"],
+            )
+        ].discard(reference_id)
+
+    def match(
+        self, name: str, location: str, date_start: str, date_end: str
+    ) -> list[_SubCompetitionList]:
+        """Find the indexed competitions with these details."""
+        return [
+            self._competitions[reference_id]
+            for reference_id in self._keys.get(
+                self.key(name, location, date_start, date_end), ()
+            )
+        ]
@@ -1,14 +1,43 @@
-"""Logger for the project."""
+"""Logger for the project.
 
-import logging
+Nothing is configured on import, and `rich` is only imported once logging \
+        or pretty printing is asked for.
+"""
 
-from rich.logging import RichHandler
+import logging
 
 FORMAT = "%(message)s"
 LEVEL = "DEBUG"
 DATEFMT = "[%X]"
 
-logging.basicConfig(
-    level=LEVEL, format=FORMAT, datefmt=DATEFMT, handlers=[RichHandler()]
-)
 log = logging.getLogger("rich")
+log.addHandler(logging.NullHandler())
+
+
+def configure_logging(level: str = LEVEL, pretty: bool = True) -> None:
+    """Configure the root logger, e.g. for debugging.
+
+    Args:
+        level (str): Logging level. Defaults to `LEVEL`.
+        pretty (bool): Log through `rich`. Defaults to `True`.
+
+    Examples:
+        Debug output:
+        >>> from lifter_api.utils.logging import configure_logging
+        >>> configure_logging()
+    """
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if pretty:
+        from rich.logging import RichHandler
+
+        handlers = [RichHandler()]
+    logging.basicConfig(
+        level=level, format=FORMAT, datefmt=DATEFMT, handlers=handlers
+    )
+
+
+def install_pretty() -> None:
+    """Make output nice to look at in the REPL, using `rich`."""
+    from rich import pretty
+
+    pretty.install()
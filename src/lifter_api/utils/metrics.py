@@ -0,0 +1,296 @@
+"""Request hooks and a metrics collector for `Transport`."""
+
+import bisect
+import contextvars
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .defaults import LATENCY_BUCKETS
+
+if TYPE_CHECKING:
+    from .transport import Transport
+
+_tag: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "lifter_api_tag", default=None
+)
+
+
+@contextmanager
+def tagged(tag: str) -> Iterator[None]:
+    """Tag every request sent in the block, e.g. "preflight".
+
+    The innermost tag wins. Tags are passed to hooks in `RequestEvent` \
+            and `ResponseEvent`.
+    """
+    token = _tag.set(tag)
+    try:
+        yield
+    finally:
+        _tag.reset(token)
+
+
+def current_tag() -> str | None:
+    """Tag of the requests sent now, if any."""
+    return _tag.get()
+
+
+class RequestEvent(NamedTuple):
+    """An attempt about to be sent, passed to `before_request` hooks."""
+
+    method: str
+    url: str
+    endpoint: str
+    tag: str | None
+    attempt: int
+
+
+class ResponseEvent(NamedTuple):
+    """Outcome of an attempt, passed to `after_request` hooks.
+
+    `cached` events were answered from the response cache, either without \
+            sending anything or after a 304, and `coalesced` events shared \
+            the response of an identical request in flight, sending \
+            nothing. `compressed` and `decompressed` are `None` for \
+            streamed responses and for both.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    tag: str | None
+    attempt: int
+    status_code: int | None
+    error: Exception | None
+    elapsed: float
+    retried: bool
+    cached: bool
+    compressed: int | None
+    decompressed: int | None
+    coalesced: bool = False
+
+
+class _EndpointMetrics:
+    """Counters of one endpoint."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Init method."""
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.retries = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.compressed = 0
+        self.decompressed = 0
+        self.latency = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+
+
+class MetricsCollector:
+    """Count requests, bytes, latency, retries, cache hits and coalesced \
+            requests by endpoint.
+
+    Endpoints are "<METHOD> <template>", with IDs replaced by \
+            placeholders, e.g. "GET /v1/competitions/{competition_id}". \
+            Requests are counted by status ("error" if none was received) \
+            and tag: "preflight" for the ID checks of `_check_id`, \
+            "token" for access token requests and "connect".
+
+    Args:
+        buckets (tuple[float, ...]): Upper bounds of the latency \
+                histogram in seconds. Defaults to `LATENCY_BUCKETS`.
+
+    Examples:
+        >>> from lifter_api import LifterAPI, MetricsCollector
+        >>> metrics = MetricsCollector()
+        >>> api = LifterAPI(metrics=metrics)
+        >>> api.lifts(competition_id="123def7")
+        >>> metrics.to_dict()["GET /v1/competitions/{competition_id}"]
+        {'requests': 1, 'statuses': {'200': 1}, 'tags': {'preflight': 1}, \
+                ...}
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Init method."""
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: dict[tuple[str, str], _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, transport: "Transport") -> None:
+        """Collect the requests sent through `transport`."""
+        transport.after_request.append(self.observe)
+
+    def observe(self, event: ResponseEvent) -> None:
+        """Add an attempt; the `after_request` hook."""
+        key = (event.method, event.endpoint)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics(self.buckets)
+            if event.cached:
+                metrics.cache_hits += 1
+                return
+            if event.coalesced:
+                metrics.coalesced += 1
+                return
+            status = (
+                "error" if event.status_code is None else event.status_code
+            )
+            metrics.requests[(str(status), event.tag or "")] += 1
+            metrics.retries += event.retried
+            metrics.compressed += event.compressed or 0
+            metrics.decompressed += event.decompressed or 0
+            metrics.latency[
+                bisect.bisect_left(self.buckets, event.elapsed)
+            ] += 1
+            metrics.latency_sum += event.elapsed
+
+    def clear(self) -> None:
+        """Reset all metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Metrics by endpoint.
+
+        Returns:
+            dict[str, dict[str, Any]]: For each endpoint, "requests" sent, \
+                    their "statuses" and "tags", "retries", "cache_hits", \
+                    "coalesced", "bytes_compressed", "bytes_decompressed" and \
+                    "latency", a histogram with "count", "sum" and \
+                    cumulative "buckets" by upper bound.
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": self._endpoint_dict(metrics)
+                for (method, endpoint), metrics in self._endpoints.items()
+            }
+
+    def _endpoint_dict(self, metrics: _EndpointMetrics) -> dict[str, Any]:
+        """Metrics of one endpoint as a dictionary."""
+        statuses: Counter[str] = Counter()
+        tags: Counter[str] = Counter()
+        for (status, tag), count in metrics.requests.items():
+            statuses[status] += count
+            if tag:
+                tags[tag] += count
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(
+            self.buckets + (float("inf"),), metrics.latency
+        ):
+            cumulative += count
+            buckets[_bound(bound)] = cumulative
+        return {
+            "requests": cumulative,
+            "statuses": dict(statuses),
+            "tags": dict(tags),
+            "retries": metrics.retries,
+            "cache_hits": metrics.cache_hits,
+            "coalesced": metrics.coalesced,
+            "bytes_compressed": metrics.compressed,
+            "bytes_decompressed": metrics.decompressed,
+            "latency": {
+                "count": cumulative,
+                "sum": metrics.latency_sum,
+                "buckets": buckets,
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "lifter_api") -> str:
+        """Metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix of the metric names. Defaults to \
+                    "lifter_api".
+
+        Returns:
+            str: Counters `<prefix>_requests_total`, \
+                    `<prefix>_retries_total`, `<prefix>_cache_hits_total`, \
+                    `<prefix>_coalesced_total` and \
+                    `<prefix>_response_bytes_total`, and the histogram \
+                    `<prefix>_request_duration_seconds`.
+        """
+        metrics = self.to_dict()
+        with self._lock:
+            requests = {
+                key: dict(endpoint.requests)
+                for key, endpoint in self._endpoints.items()
+            }
+        lines = [
+            f"# HELP {prefix}_requests_total Requests sent.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for (method, endpoint), counts in requests.items():
+            for (status, tag), count in counts.items():
+                labels = _labels(
+                    method=method, endpoint=endpoint, status=status, tag=tag
+                )
+                lines.append(f"{prefix}_requests_total{{{labels}}} {count}")
+        for name, field, help_text in (
+            ("retries_total", "retries", "Attempts that were retried."),
+            ("cache_hits_total", "cache_hits", "Responses from the cache."),
+            (
+                "coalesced_total",
+                "coalesced",
+                "Requests sharing an identical request in flight.",
+            ),
+        ):
+            lines += [
+                f"# HELP {prefix}_{name} {help_text}",
+                f"# TYPE {prefix}_{name} counter",
+            ]
+            for key, values in metrics.items():
+                labels = _endpoint_labels(key)
+                lines.append(f"{prefix}_{name}{{{labels}}} {values[field]}")
+        lines += [
+            f"# HELP {prefix}_response_bytes_total Bytes of response bodies.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+        ]
+        for key, values in metrics.items():
+            for encoding in ("compressed", "decompressed"):
+                labels = _endpoint_labels(key, encoding=encoding)
+                lines.append(
+                    f"{prefix}_response_bytes_total{{{labels}}} "
+                    f"{values[f'bytes_{encoding}']}"
+                )
+        name = f"{prefix}_request_duration_seconds"
+        lines += [
+            f"# HELP {name} Time to receive a response.",
+            f"# TYPE {name} histogram",
+        ]
+        for key, values in metrics.items():
+            latency = values["latency"]
+            for bound, count in latency["buckets"].items():
+                labels = _endpoint_labels(key, le=bound)
+                lines.append(f"{name}_bucket{{{labels}}} {count}")
+            labels = _endpoint_labels(key)
+            lines.append(f"{name}_sum{{{labels}}} {latency['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {latency['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _bound(bound: float) -> str:
+    """Upper bound of a histogram bucket, as Prometheus writes it."""
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _labels(**labels: str) -> str:
+    """Format and escape Prometheus labels."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+
+
+def _endpoint_labels(key: str, **labels: str) -> str:
+    """Labels of an endpoint key of `to_dict`, e.g. "GET /v1/athletes"."""
+    method, endpoint = key.split(" ", 1)
+    return _labels(method=method, endpoint=endpoint, **labels)
@@ -0,0 +1,137 @@
+"""Helpers for stepping through paginated results."""
+
+import math
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from typing import Any
+
+import requests
+
+from .deadline import ContextThreadPoolExecutor
+from .defaults import DEFAULT_MAX_WORKERS
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Any], prefetch: bool = True
+) -> Iterator[Any]:
+    """Step through pages until there is no `next` page.
+
+    Args:
+        fetch_page (Callable[[int], Any]): Returns the page for a page \
+                number, e.g. `LifterAPI.athletes`.
+        prefetch (bool): Fetch the next page in the background while the \
+                current one is being consumed. Defaults to `True`.
+
+    Yields:
+        Any: Each page, starting from page 1.
+    """
+    if not prefetch:
+        page_number = 1
+        while True:
+            page = fetch_page(page_number)
+            yield page
+            if not page.get("next"):
+                return
+            page_number += 1
+
+    executor = ContextThreadPoolExecutor(max_workers=1)
+    future: Future | None = executor.submit(fetch_page, 1)
+    page_number = 1
+    try:
+        while future is not None:
+            page = future.result()
+            future = None
+            if page.get("next"):
+                page_number += 1
+                future = executor.submit(fetch_page, page_number)
+            yield page
+    finally:
+        # stopped early, so the prefetched page is not needed
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_results(
+    fetch_page: Callable[[int], Any], prefetch: bool = True
+) -> Iterator[Any]:
+    """Step through the `results` of every page.
+
+    Args:
+        fetch_page (Callable[[int], Any]): Returns the page for a page \
+                number.
+        prefetch (bool): Fetch the next page in the background. Defaults \
+                to `True`.
+
+    Yields:
+        Any: Each result, one page at a time.
+    """
+    for page in iter_pages(fetch_page, prefetch=prefetch):
+        yield from page["results"]
+
+
+def _fetch_page_or_none(
+    fetch_page: Callable[[int], Any], page_number: int
+) -> Any | None:
+    """Fetch a page, or `None` if it no longer exists.
+
+    Pages past the first can disappear while they are being fetched, when \
+            items are deleted and the results shrink.
+    """
+    try:
+        return fetch_page(page_number)
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code == 404:
+            return None
+        raise
+
+
+def fetch_all_results(
+    fetch_page: Callable[[int], Any], max_workers: int = DEFAULT_MAX_WORKERS
+) -> list[Any]:
+    """Fetch the `results` of every page concurrently.
+
+    The first page gives the `count` and page size, so the remaining pages \
+            are known up front and fetched in parallel. If items are \
+            deleted meanwhile, a page that no longer exists (404) ends the \
+            results; if items are added, the extra pages are followed.
+
+    Args:
+        fetch_page (Callable[[int], Any]): Returns the page for a page \
+                number.
+        max_workers (int): Maximum number of pages fetched at once. \
+                Defaults to `DEFAULT_MAX_WORKERS`.
+
+    Returns:
+        list[Any]: Results of all pages, in page order.
+    """
+    first_page = fetch_page(1)
+    results = list(first_page["results"])
+    if not first_page.get("next") or not results:
+        return results
+
+    last_page_number = math.ceil(first_page["count"] / len(results))
+    page_numbers = range(2, last_page_number + 1)
+    page = first_page
+    with ContextThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(page_numbers)))
+    ) as executor:
+        # `map` returns pages in the order they were asked for
+        for page in executor.map(
+            lambda page_number: _fetch_page_or_none(fetch_page, page_number),
+            page_numbers,
+        ):
+            if page is None:
+                # items were deleted, so the results end sooner
+                return results
+            results.extend(page["results"])
+
+    # items added since the first page was read spill onto more pages
+    page_number = last_page_number
+    while page.get("next"):
+        page_number += 1
+        page = _fetch_page_or_none(fetch_page, page_number)
+        if page is None:
+            break
+        results.extend(page["results"])
+    return results
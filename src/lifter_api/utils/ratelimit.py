@@ -0,0 +1,163 @@
+"""Client-side limits on how fast and how many requests are sent."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .deadline import remaining
+from .defaults import READ_METHODS
+from .exceptions import DeadlineExceededError
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second on average.
+
+    Up to `burst` requests can be sent at once after a quiet spell. \
+            Callers that run out of tokens reserve the next one and wait \
+            for it, so they are served in order.
+
+    Args:
+        rate (float): Requests per second.
+        burst (int | None): Size of the bucket. Defaults to `None`, which \
+                allows one second of requests at once.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Init method."""
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> float | None:
+        """Take a token, waiting for one if needed.
+
+        Args:
+            timeout (float | None): Longest wait in seconds. Defaults to \
+                    `None`, which waits as long as needed.
+
+        Returns:
+            float | None: Seconds waited, or `None` if no token would be \
+                    free within `timeout`, in which case none is taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if timeout is not None and wait > timeout:
+                return None
+            self._tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _Budget:
+    """Rate and concurrency limit for one kind of request."""
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int | None,
+        max_concurrency: int | None,
+    ) -> None:
+        """Init method."""
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.semaphore = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency
+            else None
+        )
+
+    @contextmanager
+    def __call__(self) -> Iterator[None]:
+        """Hold a slot and a token while a request is sent.
+
+        Neither is waited for past the current deadline.
+
+        Raises:
+            DeadlineExceededError: The deadline would pass while waiting.
+        """
+        if self.semaphore is not None:
+            left = remaining()
+            if not self.semaphore.acquire(
+                timeout=None if left is None else max(left, 0)
+            ):
+                raise DeadlineExceededError(message="Deadline exceeded.")
+        try:
+            if self.bucket is not None:
+                left = remaining()
+                if (
+                    self.bucket.acquire(
+                        timeout=None if left is None else max(left, 0)
+                    )
+                    is None
+                ):
+                    raise DeadlineExceededError(message="Deadline exceeded.")
+            yield
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+
+
+class RateLimiter:
+    """Limits on requests per second and requests in flight.
+
+    Reads (GET, HEAD, OPTIONS) and writes have separate budgets, so a bulk \
+            import cannot starve lookups. Every thread sending through the \
+            same `Transport` shares the limits, including the bulk helpers.
+
+    Args:
+        reads_per_second (float | None): Average reads per second. \
+                Defaults to `None`, which does not limit the rate.
+        writes_per_second (float | None): Average writes per second. \
+                Defaults to `None`, which does not limit the rate.
+        max_concurrent_reads (int | None): Reads in flight at once. \
+                Defaults to `None`, which does not limit them.
+        max_concurrent_writes (int | None): Writes in flight at once. \
+                Defaults to `None`, which does not limit them.
+        burst (int | None): Requests that can be sent at once after a \
+                quiet spell, for both budgets. Defaults to `None`, which \
+                allows one second of requests.
+
+    Examples:
+        Staying under the API's limits:
+        >>> from lifter_api import LifterAPI, RateLimiter, Transport
+        >>> limiter = RateLimiter(
+                reads_per_second=20,
+                writes_per_second=5,
+                max_concurrent_writes=4,
+                )
+        >>> api = LifterAPI(transport=Transport(rate_limiter=limiter))
+    """
+
+    def __init__(
+        self,
+        reads_per_second: float | None = None,
+        writes_per_second: float | None = None,
+        max_concurrent_reads: int | None = None,
+        max_concurrent_writes: int | None = None,
+        burst: int | None = None,
+    ) -> None:
+        """Init method."""
+        self._reads = _Budget(reads_per_second, burst, max_concurrent_reads)
+        self._writes = _Budget(writes_per_second, burst, max_concurrent_writes)
+
+    def limit(self, method: str):
+        """Context manager holding the budget of `method` while sending.
+
+        Args:
+            method (str): HTTP method.
+
+        Examples:
+            >>> with limiter.limit("GET"):
+            ...     session.get(url)
+        """
+        if method.upper() in READ_METHODS:
+            return self._reads()
+        return self._writes()
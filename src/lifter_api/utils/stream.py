@@ -0,0 +1,121 @@
+"""Incremental decoding of large JSON responses."""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def iter_text(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode UTF-8 byte chunks, keeping characters split across chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+class _Reader:
+    """Read JSON values from text chunks, holding only the unread text."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        """Init method."""
+        self._chunks = iter(chunks)
+        self.text = ""
+        self.pos = 0
+
+    def _more(self) -> bool:
+        """Read another chunk, dropping the text already read."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next character that is not whitespace, without reading it."""
+        while True:
+            match = _WHITESPACE.match(self.text, self.pos)
+            assert match is not None  # the pattern also matches ""
+            self.pos = match.end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._more():
+                raise ValueError("Unexpected end of JSON.")
+
+    def expect(self, characters: str) -> str:
+        """Read the next character, which must be one of `characters`."""
+        character = self.peek()
+        if character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r} but got {character!r}."
+            )
+        self.pos += 1
+        return character
+
+    def value(self) -> Any:
+        """Read the next complete value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self._more():
+                    raise
+                continue
+            # a number at the end of the text may continue in the next chunk
+            if (
+                end == len(self.text)
+                and isinstance(value, (int, float))
+                and self._more()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """Yield the items of an array in a JSON object as they are decoded.
+
+    Only one item is decoded at a time, so memory does not grow with the \
+            length of the array. Other values of the object are decoded \
+            and dropped.
+
+    Args:
+        chunks (Iterable[str]): Text of a JSON object, in chunks of any size.
+        key (str): Key of the array, e.g. "lift_set".
+
+    Raises:
+        ValueError: The text is not a JSON object.
+
+    Yields:
+        Any: Each item of the array. Nothing if `key` is missing or `null`.
+    """
+    reader = _Reader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
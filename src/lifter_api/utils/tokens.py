@@ -0,0 +1,59 @@
+"""Helpers for handling access tokens locally."""
+
+import base64
+import binascii
+import json
+import time
+from typing import NamedTuple
+
+
+class AccessToken(NamedTuple):
+    """Access token together with its expiry, swapped in as one value."""
+
+    token: str | None = None
+    expiry: float | None = None
+
+
+def decode_token_expiry(token: str) -> float | None:
+    """Read the `exp` claim of a JSON Web Token.
+
+    The signature is not verified; the API does that. This is only used to
+    know when the access token needs refreshing without asking the API.
+
+    Args:
+        token (str): Encoded JSON Web Token.
+
+    Returns:
+        float | None: Expiry as a UNIX timestamp, or `None` if the token \
+                cannot be decoded or has no `exp` claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        # restore the base64 padding stripped by the JWT encoding
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (
+        IndexError,
+        KeyError,
+        TypeError,
+        ValueError,
+        binascii.Error,
+    ):
+        return None
+
+
+def token_is_fresh(expiry: float | None, skew: float) -> bool:
+    """Check if a token expiring at `expiry` can still be used.
+
+    Args:
+        expiry (float | None): Expiry as a UNIX timestamp.
+        skew (float): Seconds before expiry at which the token is \
+                considered stale.
+
+    Returns:
+        bool: `True` if the token will still be valid in `skew` seconds.
+    """
+    if expiry is None:
+        return False
+    return time.time() + skew < expiry
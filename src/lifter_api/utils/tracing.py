@@ -0,0 +1,271 @@
+"""Tracing of `LifterAPI` calls and the requests they send."""
+
+import contextvars
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from .metrics import ResponseEvent
+
+if TYPE_CHECKING:
+    from .transport import Transport
+
+_T = TypeVar("_T")
+_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "lifter_api_span", default=None
+)
+
+
+class Span:
+    """A timed operation, part of a trace.
+
+    Spans follow OpenTelemetry naming, so they can be copied into it by an \
+            exporter: IDs are hex strings, times are seconds since the \
+            epoch and attributes are flat key/values.
+
+    Args:
+        name (str): e.g. "LifterAPI.create_lift" or "GET \
+                /v1/competitions/{competition_id}".
+        parent (Span | None): Span this one is part of. Defaults to \
+                `None`, which starts a new trace.
+        attributes (dict[str, Any] | None): Initial attributes. Defaults \
+                to `None`.
+        start (float | None): Start time. Defaults to `None`, which is now.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start",
+        "end",
+        "attributes",
+        "status",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: "Span | None" = None,
+        attributes: dict[str, Any] | None = None,
+        start: float | None = None,
+    ) -> None:
+        """Init method."""
+        self.name = name
+        self.trace_id: str = (
+            f"{random.getrandbits(128):032x}"
+            if parent is None
+            else parent.trace_id
+        )
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = None if parent is None else parent.span_id
+        self.start = time.time() if start is None else start
+        self.end: float | None = None
+        self.attributes = dict(attributes or {})
+        self.status = "ok"
+        self.error: BaseException | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Seconds from start to end, `None` while running."""
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute."""
+        self.attributes[key] = value
+
+    def __repr__(self) -> str:
+        """Show the name and duration."""
+        return f"Span(name={self.name!r}, duration={self.duration!r})"
+
+
+class SpanExporter(Protocol):
+    """Receives every span once it has ended."""
+
+    def export(self, span: Span) -> None:
+        """Export a finished span."""
+
+
+class InMemorySpanExporter:
+    """Keep finished spans in a list, e.g. for tests.
+
+    Attributes:
+        spans (list[Span]): Finished spans, in the order they ended.
+    """
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Keep a finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def children(self, span: Span) -> list[Span]:
+        """Spans directly under `span`."""
+        with self._lock:
+            return [
+                child
+                for child in self.spans
+                if child.parent_id == span.span_id
+            ]
+
+    def clear(self) -> None:
+        """Drop all spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class Tracer:
+    """Create spans and hand them to an exporter once they end.
+
+    `LifterAPI(tracer=...)` opens a span for every public call, e.g. \
+            "LifterAPI.create_lift", with a child span for every HTTP \
+            exchange it sends, including its ID checks, token requests \
+            and retries, also from worker threads. The HTTP spans have \
+            "http.*" timing and size attributes and a "lifter.tag" of \
+            "preflight", "token" or "connect" for requests sent behind \
+            the scenes.
+
+    Args:
+        exporter (SpanExporter): Receives every finished span.
+
+    Examples:
+        >>> from lifter_api import InMemorySpanExporter, LifterAPI, Tracer
+        >>> exporter = InMemorySpanExporter()
+        >>> api = LifterAPI(auth_token=os.getenv("API_TOKEN"),
+                tracer=Tracer(exporter))
+        >>> api.create_lift(...)
+        >>> [(span.name, span.duration) for span in exporter.spans]
+        [('POST /api/token/refresh/', 0.08), \
+                ('HEAD /v1/competitions/{competition_id}', 0.05), ..., \
+                ('LifterAPI.create_lift', 0.31)]
+    """
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        """Init method."""
+        self.exporter = exporter
+
+    def attach(self, transport: "Transport") -> None:
+        """Record a child span for every attempt sent through `transport`."""
+        transport.after_request.append(self._record_exchange)
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> Iterator[Span]:
+        """Run the block in a span, under the current span if there is one.
+
+        The span ends, and is exported, when the block exits. An \
+                exception marks it as an error and is raised again.
+
+        Args:
+            name (str): Name of the span.
+            attributes (dict[str, Any] | None): Initial attributes. \
+                    Defaults to `None`.
+
+        Yields:
+            Span: The span.
+        """
+        span = Span(name, _span.get(), attributes)
+        token = _span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.status = "error"
+            span.error = error
+            raise
+        finally:
+            _span.reset(token)
+            span.end = time.time()
+            self.exporter.export(span)
+
+    def iterate(
+        self,
+        name: str,
+        iterator: Iterator[_T],
+        attributes: dict[str, Any] | None = None,
+    ) -> Iterator[_T]:
+        """Iterate in a span, e.g. over a paginated or streamed call.
+
+        The span starts when iteration does and ends, and is exported, \
+                when `iterator` is exhausted, raises or is closed. It is \
+                only the current span while an item is being produced, so \
+                the code consuming the items is not traced under it.
+
+        Args:
+            name (str): Name of the span.
+            iterator (Iterator[_T]): Items, e.g. from a generator.
+            attributes (dict[str, Any] | None): Initial attributes. \
+                    Defaults to `None`.
+
+        Yields:
+            _T: The items of `iterator`.
+        """
+        span = Span(name, _span.get(), attributes)
+        try:
+            while True:
+                token = _span.set(span)
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    _span.reset(token)
+                yield item
+        except GeneratorExit:
+            # stopped early by the consumer, which is not an error
+            raise
+        except BaseException as error:
+            span.status = "error"
+            span.error = error
+            raise
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                token = _span.set(span)
+                try:
+                    close()
+                finally:
+                    _span.reset(token)
+            span.end = time.time()
+            self.exporter.export(span)
+
+    def _record_exchange(self, event: ResponseEvent) -> None:
+        """Export an attempt as a finished span; the `after_request` hook."""
+        end = time.time()
+        span = Span(
+            f"{event.method} {event.endpoint}",
+            _span.get(),
+            {
+                "http.method": event.method,
+                "http.url": event.url,
+                "http.route": event.endpoint,
+                "http.status_code": event.status_code,
+                "http.attempt": event.attempt,
+                "http.retried": event.retried,
+                "http.cached": event.cached,
+                "http.coalesced": event.coalesced,
+                "http.response_bytes": event.compressed,
+                "http.response_bytes_decompressed": event.decompressed,
+                "lifter.tag": event.tag,
+            },
+            start=end - event.elapsed,
+        )
+        span.end = end
+        if event.error is not None:
+            span.status = "error"
+            span.error = event.error
+        self.exporter.export(span)
+
+
+def current_span() -> Span | None:
+    """Span of the code running now, if any."""
+    return _span.get()
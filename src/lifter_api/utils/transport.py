@@ -0,0 +1,559 @@
+"""HTTP transport shared by all `LifterAPI` calls."""
+
+import random
+import threading
+import time
+from collections.abc import Callable, Collection
+from contextlib import nullcontext
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .deadline import Timeout, remaining, request_timeout
+from .defaults import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    IDEMPOTENT_METHODS,
+    PREFERRED_ENCODINGS,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_MAX_BACKOFF,
+    RETRY_STATUS_CODES,
+)
+from .metrics import RequestEvent, ResponseEvent, current_tag
+from .ratelimit import RateLimiter
+
+
+class RetryAttempt(NamedTuple):
+    """Outcome of one attempt at a request, passed to `on_attempt`."""
+
+    method: str
+    url: str
+    attempt: int
+    status_code: int | None
+    error: Exception | None
+    elapsed: float
+    delay: float | None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Read a `Retry-After` header as seconds from now.
+
+    Args:
+        value (str | None): Header value, either seconds or an HTTP date.
+
+    Returns:
+        float | None: Seconds to wait, or `None` if missing or not valid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _not_sent(error: requests.RequestException) -> bool:
+    """Whether a request failed before it could reach the API."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a failed request again.
+
+    Idempotent methods are retried after connection errors, timeouts and \
+            the `status_codes`. POST is only retried when it cannot have \
+            been processed: the connection was never made, or the API \
+            answered 429 (too many requests).
+
+    Args:
+        max_attempts (int): Attempts per request, including the first. \
+                Defaults to `RETRY_ATTEMPTS`.
+        backoff_factor (float): Seconds to wait before the first retry, \
+                doubled for every retry after it. Defaults to \
+                `RETRY_BACKOFF_FACTOR`.
+        max_backoff (float): Longest wait in seconds. A `Retry-After` \
+                longer than this is not waited for. Defaults to \
+                `RETRY_MAX_BACKOFF`.
+        jitter (bool): Wait a random time up to the backoff ("full \
+                jitter"), so clients do not retry in lockstep. Defaults to \
+                `True`.
+        status_codes (Collection[int]): Statuses that are retried. Defaults \
+                to `RETRY_STATUS_CODES`.
+        methods (Collection[str]): Methods that are safe to retry. Defaults \
+                to `IDEMPOTENT_METHODS`.
+        on_attempt (Callable[[RetryAttempt], None] | None): Called after \
+                every attempt, e.g. to record metrics. Defaults to `None`.
+
+    Examples:
+        Retrying a long import:
+        >>> from lifter_api import LifterAPI, RetryPolicy, Transport
+        >>> api = LifterAPI(
+                transport=Transport(retry=RetryPolicy(max_attempts=5))
+                )
+
+        Logging every attempt:
+        >>> policy = RetryPolicy(on_attempt=print)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_ATTEMPTS,
+        backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        max_backoff: float = RETRY_MAX_BACKOFF,
+        jitter: bool = True,
+        status_codes: Collection[int] = RETRY_STATUS_CODES,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        on_attempt: Callable[[RetryAttempt], None] | None = None,
+    ) -> None:
+        """Init method."""
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.on_attempt = on_attempt
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after a failed `attempt` (1 for the first)."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def delay(
+        self,
+        method: str,
+        attempt: int,
+        response: requests.Response | None = None,
+        error: requests.RequestException | None = None,
+    ) -> float | None:
+        """Seconds to wait before retrying, or `None` to give up.
+
+        Args:
+            method (str): HTTP method.
+            attempt (int): Attempt that failed, 1 for the first.
+            response (requests.Response | None): Response, if any.
+            error (requests.RequestException | None): Error, if no response.
+
+        Returns:
+            float | None: Seconds to wait, or `None` if not retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        idempotent = method.upper() in self.methods
+        if error is not None:
+            if idempotent or _not_sent(error):
+                return self.backoff(attempt)
+            return None
+        if response is None or response.status_code not in self.status_codes:
+            return None
+        if not idempotent and response.status_code != 429:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_backoff:
+            return None
+        return retry_after
+
+
+def best_accept_encoding() -> str:
+    """Best `Accept-Encoding` this environment can decode.
+
+    gzip and deflate are always available; brotli and zstd are added, \
+            ahead of them, when urllib3 can decode them, e.g. after \
+            `pip install lifter-api-wrapper[compression]`.
+
+    Returns:
+        str: e.g. "zstd, br, gzip, deflate".
+    """
+    available = ACCEPT_ENCODING.split(",")
+    return ", ".join(
+        encoding for encoding in PREFERRED_ENCODINGS if encoding in available
+    )
+
+
+_COLLECTIONS = ("athletes", "competitions", "lifts")
+
+
+def endpoint_template(url: str) -> str:
+    """Path of a URL with its IDs replaced by placeholders.
+
+    Args:
+        url (str): Full URL.
+
+    Returns:
+        str: e.g. "/v1/competitions/{competition_id}/lifts/{lift_id}". \
+                The query string is dropped.
+    """
+    segments = urlsplit(url).path.split("/")
+    for number in range(1, len(segments)):
+        collection = segments[number - 1]
+        if collection in _COLLECTIONS and segments[number]:
+            segments[number] = f"{{{collection[:-1]}_id}}"
+    return "/".join(segments)
+
+
+class TransferTotals(NamedTuple):
+    """Bytes received for an endpoint."""
+
+    responses: int
+    compressed: int
+    decompressed: int
+
+    @property
+    def ratio(self) -> float:
+        """Decompressed bytes per byte received, 1.0 if nothing was."""
+        return self.decompressed / self.compressed if self.compressed else 1.0
+
+
+def transfer_sizes(response: requests.Response) -> tuple[int, int]:
+    """Bytes of a fully read response, as sent and once decompressed."""
+    decompressed = len(response.content)
+    try:
+        # bytes read from the socket, before decoding
+        compressed = response.raw.tell()
+    except AttributeError:
+        compressed = decompressed
+    return compressed, decompressed
+
+
+class TransferStats:
+    """Compressed and decompressed bytes received, by endpoint.
+
+    Endpoints are "<METHOD> <template>", where the template is the path \
+            with IDs replaced, see `endpoint_template`.
+
+    Examples:
+        >>> api.fetch_all_athletes()
+        >>> api.transfer_stats.totals()
+        {'GET /v1/athletes': TransferTotals(responses=12, \
+                compressed=40960, decompressed=389120), ...}
+    """
+
+    def __init__(self) -> None:
+        """Init method."""
+        self._totals: dict[str, TransferTotals] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, method: str, url: str, compressed: int, decompressed: int
+    ) -> None:
+        """Add a response to the totals of its endpoint."""
+        endpoint = f"{method} {endpoint_template(url)}"
+        with self._lock:
+            responses, total_compressed, total_decompressed = self._totals.get(
+                endpoint, (0, 0, 0)
+            )
+            self._totals[endpoint] = TransferTotals(
+                responses + 1,
+                total_compressed + compressed,
+                total_decompressed + decompressed,
+            )
+
+    def totals(self) -> dict[str, TransferTotals]:
+        """Totals by endpoint."""
+        with self._lock:
+            return dict(self._totals)
+
+    def total(self) -> TransferTotals:
+        """Totals over all endpoints."""
+        totals = self.totals().values()
+        return TransferTotals(
+            *(sum(column) for column in zip((0, 0, 0), *totals))
+        )
+
+    def clear(self) -> None:
+        """Reset the totals."""
+        with self._lock:
+            self._totals.clear()
+
+
+class Transport:
+    """Pooled, keep-alive HTTP transport.
+
+    A single `requests.Session` is used so that TCP and TLS connections are
+    reused between calls instead of being opened for every request.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache. \
+                Defaults to `DEFAULT_POOL_CONNECTIONS`.
+        pool_maxsize (int): Maximum number of connections kept alive per \
+                host. Defaults to `DEFAULT_POOL_MAXSIZE`.
+        pool_block (bool): Block when all connections to a host are in use \
+                rather than opening a throwaway connection. Defaults to \
+                `False`.
+        keep_alive (bool): Keep connections open between requests. Defaults \
+                to `True`.
+        timeout (float | tuple[float, float] | None): Default timeout in \
+                seconds, either a single value or `(connect, read)`. \
+                Defaults to `DEFAULT_TIMEOUT`.
+        session (requests.Session | None): Use an existing session instead \
+                of creating one. Defaults to `None`.
+        retry (RetryPolicy | None): Retry failed requests. Defaults to \
+                `None`, which sends every request once.
+        rate_limiter (RateLimiter | None): Limit requests per second and \
+                in flight, for every attempt. Defaults to `None`, which does \
+                not limit them.
+        accept_encoding (str | None): `Accept-Encoding` sent with every \
+                request, e.g. "identity" to turn compression off. Defaults \
+                to `None`, which asks for the best compression that can be \
+                decoded, see `best_accept_encoding`.
+
+    Attributes:
+        transfer_stats (TransferStats): Bytes received by endpoint, as sent \
+                and once decompressed.
+        before_request (list[Callable[[RequestEvent], None]]): Called \
+                before every attempt is sent, after any wait for the rate \
+                limiter.
+        after_request (list[Callable[[ResponseEvent], None]]): Called \
+                after every attempt, and for every response served from \
+                the response cache of `LifterAPI`.
+
+    Examples:
+        Bigger pool for many threads:
+        >>> from lifter_api import LifterAPI, Transport
+        >>> api = LifterAPI(transport=Transport(pool_maxsize=32))
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float | tuple[float, float] | None = DEFAULT_TIMEOUT,
+        session: requests.Session | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        accept_encoding: str | None = None,
+    ) -> None:
+        """Init method."""
+        self.timeout = timeout
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.transfer_stats = TransferStats()
+        self.before_request: list[Callable[[RequestEvent], None]] = []
+        self.after_request: list[Callable[[ResponseEvent], None]] = []
+        self.session = session if session is not None else requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.session.headers["Accept-Encoding"] = (
+            accept_encoding
+            if accept_encoding is not None
+            else best_accept_encoding()
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session.
+
+        The request is retried according to the retry policy, if any. \
+                Each attempt is sent with the timeout cut to the time left \
+                before the current deadline, and no retry waits past it. \
+                The bytes of the response are added to `transfer_stats`, \
+                unless it is streamed.
+
+        Args:
+            method (str): HTTP method, e.g. "GET".
+            url (str): Full URL.
+            **kwargs: Passed on to `requests.Session.request`.
+
+        Raises:
+            requests.RequestException: The last attempt failed without a \
+                    response.
+            DeadlineExceededError: The deadline passed before an attempt.
+
+        Returns:
+            requests.Response: The response of the last attempt.
+        """
+        response = self._send_with_retries(method, url, **kwargs)
+        if not kwargs.get("stream"):
+            # streamed bodies are recorded by whoever reads them
+            self.transfer_stats.record(method, url, *transfer_sizes(response))
+        return response
+
+    def _send_with_retries(
+        self, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Send a request, retrying according to the retry policy."""
+        default_timeout = kwargs.pop("timeout", self.timeout)
+        attempt = 0
+        while True:
+            attempt += 1
+            response, error, elapsed = self._attempt(
+                method, url, attempt, default_timeout, **kwargs
+            )
+            delay = None
+            if self.retry is not None:
+                delay = self.retry.delay(method, attempt, response, error)
+                left = remaining()
+                if delay is not None and left is not None and delay >= left:
+                    # the retry could not finish before the deadline
+                    delay = None
+                if self.retry.on_attempt is not None:
+                    self.retry.on_attempt(
+                        RetryAttempt(
+                            method,
+                            url,
+                            attempt,
+                            None if response is None else response.status_code,
+                            error,
+                            elapsed,
+                            delay,
+                        )
+                    )
+            if self.after_request:
+                self._notify_after(
+                    method,
+                    url,
+                    attempt,
+                    response,
+                    error,
+                    elapsed,
+                    retried=delay is not None,
+                    streamed=kwargs.get("stream", False),
+                )
+            if delay is None:
+                if response is None:
+                    # an attempt gives either a response or an error
+                    assert error is not None
+                    raise error
+                return response
+            if response is not None and response.raw is not None:
+                # release the connection back to the pool
+                response.close()
+            time.sleep(delay)
+
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        default_timeout: Timeout,
+        **kwargs,
+    ) -> tuple[
+        requests.Response | None, requests.RequestException | None, float
+    ]:
+        """Send one attempt within the rate limits, if any.
+
+        The timeout is worked out once the limits have let the attempt \
+                through, so time spent waiting for them counts against \
+                the deadline.
+
+        Raises:
+            DeadlineExceededError: The deadline passed before the attempt \
+                    could be sent.
+
+        Returns:
+            tuple[requests.Response | None, requests.RequestException | \
+                    None, float]: The response or the error, and the \
+                    seconds it took.
+        """
+        limit = (
+            nullcontext()
+            if self.rate_limiter is None
+            else self.rate_limiter.limit(method)
+        )
+        with limit:
+            kwargs["timeout"] = request_timeout(default_timeout)
+            if self.before_request:
+                event = RequestEvent(
+                    method, url, endpoint_template(url), current_tag(), attempt
+                )
+                for hook in self.before_request:
+                    hook(event)
+            start = time.perf_counter()
+            try:
+                response = self._send(method, url, **kwargs)
+            except requests.RequestException as error:
+                return None, error, time.perf_counter() - start
+            return response, None, time.perf_counter() - start
+
+    def _notify_after(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        response: requests.Response | None,
+        error: Exception | None,
+        elapsed: float,
+        retried: bool,
+        streamed: bool,
+    ) -> None:
+        """Call the `after_request` hooks for an attempt."""
+        sizes = (
+            (None, None)
+            if response is None or streamed
+            else transfer_sizes(response)
+        )
+        self.notify(
+            ResponseEvent(
+                method,
+                url,
+                endpoint_template(url),
+                current_tag(),
+                attempt,
+                None if response is None else response.status_code,
+                error,
+                elapsed,
+                retried,
+                False,
+                *sizes,
+            )
+        )
+
+    def notify(self, event: ResponseEvent) -> None:
+        """Call the `after_request` hooks, e.g. for a cached response."""
+        for hook in self.after_request:
+            hook(event)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a single request over the wire.
+
+        Override this to swap in a stand-in server for testing.
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        """Send a PATCH request."""
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send a HEAD request."""
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
@@ -1,4 +1,5 @@
 """This file contains all custom types."""
+
 from collections.abc import Iterable
 from typing import TypedDict
 
@@ -9,6 +10,15 @@ class DetailResponse(TypedDict):
     detail: str
 
 
+class BulkLiftResult(TypedDict):
+    """Type for one row of a bulk lift creation."""
+
+    row: int
+    athlete_id: str | None
+    lift: "LiftDetail | None"
+    detail: str | None
+
+
 class _AgeCategories(TypedDict):
     """Sub-Type for age categories."""
 
@@ -40,7 +50,7 @@ class LiftDetail(TypedDict):
     url: str
     reference_id: str
     lottery_number: str
-    athelte: str
+    athlete: str
     athlete_name: str
     athlete_yearborn: str
     competition: str
@@ -95,7 +105,7 @@ class CompetitionList(TypedDict):
 class CompetitionDetail(_SubCompetitionList):
     """Type for competition detail."""
 
-    lift_set: list[LiftDetail | None]
+    lift_set: list[LiftDetail]
 
 
 class _SubAthleteList(TypedDict):
@@ -122,4 +132,13 @@ class AthleteList(TypedDict):
 class AthleteDetail(_SubAthleteList):
     """Type for athlete detail view."""
 
-    lift_set: LiftDetail | None
+    lift_set: list[LiftDetail]
+
+
+class AthleteUpsertResult(TypedDict):
+    """Type for the outcome of a bulk athlete upsert, by row number."""
+
+    created: dict[int, AthleteDetail]
+    matched: dict[int, _SubAthleteList]
+    ambiguous: dict[int, list[_SubAthleteList]]
+    failed: dict[int, str]
@@ -1,19 +1,94 @@
 """Contains all the fixtures and test cases."""
 
+import json
 import os
 import random
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 
 import pytest
 import requests
 from faker import Faker
 
-from lifter_api import LifterAPI
+from lifter_api import LifterAPI, Transport
 from lifter_api.utils.defaults import VERSION
 from lifter_api.utils.helpers import load_url
-from lifter_api.utils.logging import log
+from lifter_api.utils.logging import configure_logging, log
 
 URL = load_url()
+STUB_URL = "http://stub.lifter"
+
+
+def make_response(
+    status_code: int = 200,
+    body=None,
+    headers: dict | None = None,
+    url: str = STUB_URL,
+) -> requests.Response:
+    """Build a `requests.Response` without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.reason = "Stub"
+    response.headers.update(headers or {})
+    response._content = b"" if body is None else json.dumps(body).encode()
+    return response
+
+
+class StubTransport(Transport):
+    """Stand-in server answering requests from registered routes.
+
+    Routes are keyed by `(method, path)`, and the value is either a
+    `(status_code, body)` tuple or a callable taking `(method, url, kwargs)`
+    and returning a `requests.Response`. Every request is recorded in
+    `calls`.
+    """
+
+    def __init__(self, routes: dict | None = None, **kwargs):
+        """Construct."""
+        super().__init__(**kwargs)
+        self.routes = {
+            ("GET", f"/{VERSION}"): (200, {}),
+            ("HEAD", f"/{VERSION}"): (200, None),
+        }
+        self.routes.update(routes or {})
+        self.calls: list[tuple[str, str, dict]] = []
+
+    def _send(self, method, url, **kwargs):
+        """Answer from the routes instead of the network."""
+        self.calls.append((method, url, kwargs))
+        route = self.routes.get((method, urlsplit(url).path))
+        if route is None:
+            return make_response(404, {"detail": "Not found."}, url=url)
+        if callable(route):
+            return route(method, url, kwargs)
+        return make_response(*route, url=url)
+
+    def count(self, method: str, path: str) -> int:
+        """Count requests made to `path`."""
+        return sum(
+            1
+            for call_method, url, _ in self.calls
+            if call_method == method and urlsplit(url).path == path
+        )
+
+
+@pytest.fixture
+def stub_transport():
+    """Offline stand-in for the API."""
+    return StubTransport()
+
+
+@pytest.fixture
+def stub_api(stub_transport):
+    """Unauthenticated user talking to the stand-in server."""
+    return LifterAPI(url=STUB_URL, transport=stub_transport)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def debug_logging():
+    """Log debug output through `rich` for the test session."""
+    configure_logging()
 
 
 @pytest.fixture(scope="session")
@@ -9,6 +9,8 @@ from requests.exceptions import HTTPError
 from lifter_api import LifterAPI
 from lifter_api.utils.exceptions import TokenNotValidError
 
+from .conftest import STUB_URL
+
 
 class TestLifterAPI:
     """Test for LifterAPI."""
@@ -47,3 +49,33 @@ class TestLifterAPI:
         """Ensuring users load correctly."""
         with expected:
             LifterAPI(**test_input)
+
+
+class TestLazyLifterAPI:
+    """Test deferring the endpoint check and token exchange."""
+
+    def test_lazy_construction_is_offline(self, stub_transport):
+        """Nothing is sent until the first call."""
+        LifterAPI(
+            url=STUB_URL, auth_token="x", transport=stub_transport, lazy=True
+        )
+        assert stub_transport.calls == []
+
+    def test_lazy_connects_once(self, stub_transport):
+        """The first call connects, later calls do not."""
+        api = LifterAPI(url=STUB_URL, transport=stub_transport, lazy=True)
+        api.get_athlete("doesnotexist")
+        api.get_athlete("doesnotexist")
+        api.connect()
+        assert stub_transport.count("GET", "/v1") == 1
+
+    def test_lazy_wrong_version(self, stub_transport):
+        """A wrong version is raised by `connect` instead."""
+        api = LifterAPI(
+            url=STUB_URL,
+            version="wrongVersion",
+            transport=stub_transport,
+            lazy=True,
+        )
+        with pytest.raises(HTTPError):
+            api.connect()
@@ -0,0 +1,235 @@
+"""Test the asyncio client."""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from lifter_api import AsyncLifterAPI
+from lifter_api.utils.deadline import deadline, timeout
+from lifter_api.utils.exceptions import (
+    DeadlineExceededError,
+    TokenNotProvidedError,
+    TokenNotValidError,
+)
+from lifter_api.utils.tokens import AccessToken
+
+from .conftest import STUB_URL
+from .test_bulk import make_lift
+from .test_tokens import make_token
+
+
+class AsyncStubServer:
+    """Stand-in server for `httpx.MockTransport`, recording requests."""
+
+    def __init__(self):
+        """Construct."""
+        self.calls: list[tuple[str, str]] = []
+        self.athletes = [{"reference_id": f"a{i}"} for i in range(5)]
+        self.refresh_status = 200
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request."""
+        path = request.url.path
+        self.calls.append((request.method, path))
+        if path == "/v1":
+            return httpx.Response(200, json={})
+        if path == "/api/token/refresh/":
+            return httpx.Response(
+                self.refresh_status, json={"access": make_token(exp=2e9)}
+            )
+        if path == "/v1/competitions/c1" and request.method == "GET":
+            return httpx.Response(200, json={"lift_set": [{"athlete": "a0"}]})
+        if path == "/v1/competitions/c1/lifts" and request.method == "POST":
+            return httpx.Response(400, json={"detail": "Bad request."})
+        if path == "/v1/athletes" and request.method == "GET":
+            page = int(parse_qs(request.url.query.decode())["page"][0])
+            start = (page - 1) * 2
+            if start >= len(self.athletes) and page != 1:
+                return httpx.Response(404, json={"detail": "Invalid page."})
+            has_next = start + 2 < len(self.athletes)
+            return httpx.Response(
+                200,
+                json={
+                    "count": len(self.athletes),
+                    "next": "more" if has_next else None,
+                    "previous": None,
+                    "results": self.athletes[start : start + 2],
+                },
+            )
+        if path == "/v1/athletes" and request.method == "POST":
+            return httpx.Response(
+                201,
+                json={"reference_id": "new", **json.loads(request.content)},
+            )
+        if path.startswith("/v1/athletes/a"):
+            return httpx.Response(
+                200, json={"reference_id": path.rsplit("/", 1)[-1]}
+            )
+        return httpx.Response(404, json={"detail": "Not found."})
+
+    def count(self, method: str, path: str) -> int:
+        """Count requests made to `path`."""
+        return self.calls.count((method, path))
+
+
+@pytest.fixture
+def server():
+    """Offline stand-in for the API."""
+    return AsyncStubServer()
+
+
+def make_api(server, **kwargs) -> AsyncLifterAPI:
+    """Async client talking to the stand-in server."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return AsyncLifterAPI(url=STUB_URL, client=client, **kwargs)
+
+
+def test_construction_is_offline(server):
+    """Nothing is sent until the first call."""
+    make_api(server, auth_token="x")
+    assert server.calls == []
+
+
+def test_get_athletes_gathered(server):
+    """Bulk helpers return results in the order asked for."""
+
+    async def _run():
+        async with make_api(server) as api:
+            return await api.get_athletes(["a3", "a1", "b2"])
+
+    results = asyncio.run(_run())
+    assert results[0]["reference_id"] == "a3"
+    assert results[1]["reference_id"] == "a1"
+    assert results[2] == {"detail": "Athlete ID: 'b2' does not exist."}
+    assert server.count("GET", "/v1") == 1
+
+
+def test_fetch_all_and_iter_athletes(server):
+    """Pages are streamed and fetched concurrently in order."""
+
+    async def _run():
+        async with make_api(server) as api:
+            streamed = [athlete async for athlete in api.iter_athletes()]
+            fetched = await api.fetch_all_athletes()
+        return streamed, fetched
+
+    streamed, fetched = asyncio.run(_run())
+    assert streamed == server.athletes
+    assert fetched == server.athletes
+
+
+def test_fetch_all_athletes_shrinks(server):
+    """A page deleted while fetching ends the results early."""
+
+    async def _run():
+        async with make_api(server) as api:
+            first_page = api.athletes
+
+            async def _athletes(page=1):
+                result = await first_page(page=page)
+                if page == 1:
+                    del server.athletes[-2:]
+                return result
+
+            api.athletes = _athletes
+            return await api.fetch_all_athletes()
+
+    fetched = asyncio.run(_run())
+    assert fetched == [{"reference_id": f"a{i}"} for i in range(3)]
+
+
+def test_concurrent_writes_share_token(server):
+    """Concurrent writes refresh the access token once."""
+
+    async def _run():
+        async with make_api(server, auth_token="x") as api:
+            return await asyncio.gather(
+                *(
+                    api.create_athlete(
+                        first_name="A", last_name="B", yearborn=1990
+                    )
+                    for _ in range(10)
+                )
+            )
+
+    results = asyncio.run(_run())
+    assert len(results) == 10
+    assert server.count("POST", "/api/token/refresh/") == 1
+
+
+def test_missing_ids_and_tokens(server):
+    """Missing IDs and tokens are reported like the sync client."""
+
+    async def _run():
+        async with make_api(server, check_ids="head") as api:
+            response = await api.lifts(competition_id="wrong")
+            with pytest.raises(TokenNotProvidedError):
+                await api.create_athlete(
+                    first_name="A", last_name="B", yearborn=1990
+                )
+        return response
+
+    response = asyncio.run(_run())
+    assert response == {"detail": "Competition ID: 'wrong' does not exist."}
+    assert server.count("HEAD", "/v1/competitions/wrong") == 1
+
+
+def test_connect_needs_a_valid_token(server):
+    """A client is only connected once its access token is obtained."""
+
+    async def _run():
+        async with make_api(server, auth_token="x") as api:
+            server.refresh_status = 401
+            with pytest.raises(TokenNotValidError):
+                await api.connect()
+            connected = api._connected
+            server.refresh_status = 200
+            await api.connect()
+            return connected, api._connected
+
+    assert asyncio.run(_run()) == (False, True)
+    assert server.count("POST", "/api/token/refresh/") == 2
+
+
+def test_create_lift_already_entered(server):
+    """A lift for an athlete already in the competition is reported."""
+
+    async def _run():
+        async with make_api(server, auth_token="x", check_ids="off") as api:
+            return await api.create_lift(
+                competition_id="c1", **make_lift("a0")
+            )
+
+    assert asyncio.run(_run()) == {
+        "detail": "Error: athlete, 'a0', already in competition, 'c1'"
+    }
+
+
+def test_token_requests_keep_to_deadline(server):
+    """Token requests are sent within the deadline and timeout."""
+    timeouts = []
+
+    async def _slow(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        if request.url.path == "/api/token/refresh/":
+            await asyncio.sleep(0.2)
+        return server(request)
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_slow))
+        async with AsyncLifterAPI(
+            url=STUB_URL, client=client, auth_token="x"
+        ) as api:
+            with timeout(None):
+                await api.connect()
+            api._connected = False
+            api._AsyncLifterAPI__access_token = AccessToken()
+            with deadline(0.05), pytest.raises(DeadlineExceededError):
+                await api.connect()
+
+    asyncio.run(_run())
+    assert timeouts[:2] == [None, None]
+    assert 0 < timeouts[2] <= 0.05
@@ -0,0 +1,159 @@
+"""Test bulk lift creation."""
+
+import time
+
+import pytest
+
+from lifter_api import LifterAPI
+
+from .conftest import STUB_URL, make_response
+from .test_tokens import make_token
+
+COMPETITION_PATH = "/v1/competitions/123def7"
+
+
+def make_lift(athlete_id: str, **changes) -> dict:
+    """Row for `create_lifts`."""
+    lift = {
+        "athlete_id": athlete_id,
+        "snatch_first": "LIFT",
+        "snatch_first_weight": 90,
+        "snatch_second": "NOLIFT",
+        "snatch_second_weight": 95,
+        "snatch_third": "LIFT",
+        "snatch_third_weight": 95,
+        "cnj_first": "LIFT",
+        "cnj_first_weight": 120,
+        "cnj_second": "DNA",
+        "cnj_second_weight": 0,
+        "cnj_third": "DNA",
+        "cnj_third_weight": 0,
+        "bodyweight": 88.5,
+        "weight_category": "M89",
+        "session_number": 1,
+        "team": "TEAM",
+        "lottery_number": 1,
+    }
+    lift.update(changes)
+    return lift
+
+
+@pytest.fixture
+def bulk_api(stub_transport):
+    """Authenticated client with a competition holding athlete "a0"."""
+
+    def _create(method, url, kwargs):
+        return make_response(201, {"athlete": kwargs["json"]["athlete"]})
+
+    stub_transport.routes.update(
+        {
+            ("POST", "/api/token/refresh/"): (
+                200,
+                {"access": make_token(exp=time.time() + 300)},
+            ),
+            ("GET", COMPETITION_PATH): (
+                200,
+                {"lift_set": [{"athlete": "a0"}]},
+            ),
+            ("HEAD", "/v1/athletes/a0"): (200, None),
+            ("HEAD", "/v1/athletes/a1"): (200, None),
+            ("HEAD", "/v1/athletes/a2"): (200, None),
+            ("POST", f"{COMPETITION_PATH}/lifts"): _create,
+        }
+    )
+    return LifterAPI(
+        url=STUB_URL,
+        transport=stub_transport,
+        auth_token="RefreshToken",
+        check_ids="head",
+    )
+
+
+def test_create_lifts(bulk_api, stub_transport):
+    """Valid rows are created, and every row is reported."""
+    report = bulk_api.create_lifts(
+        competition_id="123def7",
+        lifts=[
+            make_lift("a1"),
+            make_lift("a2"),
+            make_lift("a1"),
+            make_lift("a0"),
+            make_lift("a3"),
+            make_lift("a2", snatch_first="MISS"),
+        ],
+    )
+    assert [row["row"] for row in report] == list(range(6))
+    assert report[0]["lift"] == {"athlete": "a1"}
+    assert report[1]["lift"] == {"athlete": "a2"}
+    assert "already in competition" in report[2]["detail"]
+    assert "already in competition" in report[3]["detail"]
+    assert report[4]["detail"] == "Athlete ID: 'a3' does not exist."
+    assert "lift status" in report[5]["detail"]
+    assert stub_transport.count("GET", COMPETITION_PATH) == 1
+    assert stub_transport.count("HEAD", "/v1/athletes/a1") == 1
+    assert stub_transport.count("POST", f"{COMPETITION_PATH}/lifts") == 2
+
+
+def test_create_lifts_missing_competition(bulk_api, stub_transport):
+    """Every row reports a missing competition."""
+    del stub_transport.routes[("GET", COMPETITION_PATH)]
+    report = bulk_api.create_lifts(
+        competition_id="123def7", lifts=[make_lift("a1"), make_lift("a2")]
+    )
+    assert {row["detail"] for row in report} == {
+        "Competition ID: '123def7' does not exist."
+    }
+    assert stub_transport.count("POST", f"{COMPETITION_PATH}/lifts") == 0
+
+
+def test_create_lifts_checks_athletes_with_head(bulk_api, stub_transport):
+    """Athletes are checked with HEAD requests even with the "get" policy."""
+    bulk_api._check_ids = "get"
+    report = bulk_api.create_lifts(
+        competition_id="123def7", lifts=[make_lift("a1"), make_lift("a3")]
+    )
+    assert report[0]["lift"] == {"athlete": "a1"}
+    assert report[1]["detail"] == "Athlete ID: 'a3' does not exist."
+    assert stub_transport.count("HEAD", "/v1/athletes/a1") == 1
+    assert stub_transport.count("GET", "/v1/athletes/a1") == 0
+
+
+def test_create_lifts_rejected(bulk_api, stub_transport):
+    """A row rejected by the API is explained like `create_lift` does."""
+
+    def _create(method, url, kwargs):
+        # entered by someone else since the competition was fetched
+        stub_transport.routes[("GET", COMPETITION_PATH)] = (
+            200,
+            {
+                "lift_set": [
+                    {"athlete": "a0"},
+                    {"athlete": "a1"},
+                    {"athlete": "a2"},
+                ]
+            },
+        )
+        return make_response(400, {"detail": "Bad request."})
+
+    stub_transport.routes[("POST", f"{COMPETITION_PATH}/lifts")] = _create
+    report = bulk_api.create_lifts(
+        competition_id="123def7", lifts=[make_lift("a1"), make_lift("a2")]
+    )
+    assert [row["detail"] for row in report] == [
+        "Error: athlete, 'a1', already in competition, '123def7'",
+        "Error: athlete, 'a2', already in competition, '123def7'",
+    ]
+    # once to check the rows, and once to explain both rejections
+    assert stub_transport.count("GET", COMPETITION_PATH) == 2
+
+
+def test_create_lifts_invalid_rows(bulk_api, stub_transport):
+    """Rows that are not dictionaries or have no athlete are reported."""
+    report = bulk_api.create_lifts(
+        competition_id="123def7",
+        lifts=[["a1"], {"snatch_first": "LIFT"}, make_lift("a1")],
+    )
+    assert [row["athlete_id"] for row in report] == [None, None, "a1"]
+    assert report[0]["detail"] == report[1]["detail"]
+    assert "athlete_id" in report[0]["detail"]
+    assert report[2]["lift"] == {"athlete": "a1"}
@@ -0,0 +1,117 @@
+"""Test the response cache."""
+
+import time
+
+import pytest
+
+from lifter_api import LifterAPI, ResponseCache
+from lifter_api.utils.cache import (
+    CacheEntry,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+)
+
+from .conftest import STUB_URL, make_response
+from .test_tokens import make_token
+
+ATHLETE_PATH = "/v1/athletes/abc123"
+ETAG = '"v1"'
+
+
+@pytest.fixture
+def athlete_route(stub_transport):
+    """Athlete detail answering 304 when the ETag matches."""
+
+    def _athlete(method, url, kwargs):
+        if kwargs.get("headers", {}).get("If-None-Match") == ETAG:
+            return make_response(304, url=url)
+        return make_response(
+            200, {"reference_id": "abc123"}, {"ETag": ETAG}, url=url
+        )
+
+    stub_transport.routes[("GET", ATHLETE_PATH)] = _athlete
+    return stub_transport
+
+
+@pytest.fixture
+def cached_api(athlete_route):
+    """Client with an in-memory response cache."""
+    return LifterAPI(
+        url=STUB_URL, transport=athlete_route, cache=ResponseCache()
+    )
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        pytest.param("/v1/athletes/abc", "athlete", id="Athlete"),
+        pytest.param("/v1/competitions/abc", "competition", id="Competition"),
+        pytest.param("/v1/competitions/abc/lifts", "lift", id="Lifts"),
+        pytest.param("/v1/athletes?page=2", "list", id="List"),
+        pytest.param("/v1/athletes?page=1&search=a", "search", id="Search"),
+    ],
+)
+def test_endpoint_type(test_input, expected):
+    """TTLs are chosen by endpoint type."""
+    assert ResponseCache.endpoint_type(STUB_URL + test_input) == expected
+
+
+def test_cache_hit(cached_api, stub_transport):
+    """Fresh responses are served without a request."""
+    first = cached_api.get_athlete(athlete_id="abc123")
+    second = cached_api.get_athlete(athlete_id="abc123")
+    assert first == second == {"reference_id": "abc123"}
+    assert stub_transport.count("GET", ATHLETE_PATH) == 1
+
+
+def test_cache_revalidate(athlete_route):
+    """Expired responses are revalidated with their ETag."""
+    api = LifterAPI(
+        url=STUB_URL,
+        transport=athlete_route,
+        cache=ResponseCache(ttls={"athlete": 0}),
+    )
+    api.get_athlete(athlete_id="abc123")
+    assert api.get_athlete(athlete_id="abc123") == {"reference_id": "abc123"}
+    _, url, kwargs = athlete_route.calls[-1]
+    assert kwargs["headers"]["If-None-Match"] == ETAG
+
+
+def test_cache_invalidated_by_write(cached_api, stub_transport):
+    """Writes drop the responses they may have changed."""
+    stub_transport.routes[("POST", "/api/token/refresh/")] = (
+        200,
+        {"access": make_token(exp=time.time() + 300)},
+    )
+    stub_transport.routes[("PATCH", ATHLETE_PATH)] = (200, {})
+    cached_api._auth_token = "RefreshToken"
+    cached_api.get_athlete(athlete_id="abc123")
+    cached_api.edit_athlete(athlete_id="abc123", first_name="New")
+    cached_api.get_athlete(athlete_id="abc123")
+    # the ID check before the edit is served from the cache
+    assert stub_transport.count("GET", ATHLETE_PATH) == 2
+    assert stub_transport.calls[-1][0] == "GET"
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(lambda tmp_path: MemoryCacheBackend(2), id="Memory"),
+        pytest.param(
+            lambda tmp_path: DiskCacheBackend(tmp_path / "cache.sqlite", 2),
+            id="Disk",
+        ),
+    ],
+)
+def test_backend_lru(backend, tmp_path):
+    """The least recently used entry is evicted first."""
+    backend = backend(tmp_path)
+    entry = CacheEntry(b"{}", None, None, time.time())
+    backend.set("a", entry)
+    backend.set("b", entry)
+    backend.get("a")
+    backend.set("c", entry)
+    assert backend.get("b") is None
+    assert backend.get("a") == entry
+    backend.delete_prefix("a")
+    assert backend.get("a") is None
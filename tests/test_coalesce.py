@@ -0,0 +1,111 @@
+"""Test coalescing of identical concurrent requests."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lifter_api import LifterAPI, MetricsCollector
+from lifter_api.utils.coalesce import RequestCoalescer
+from lifter_api.utils.deadline import deadline
+from lifter_api.utils.exceptions import DeadlineExceededError
+
+from .conftest import STUB_URL, make_response
+
+THREADS = 50
+
+
+def wait_for(condition, seconds: float = 5.0) -> None:
+    """Wait until `condition()` is true."""
+    end = time.monotonic() + seconds
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.001)
+
+
+def test_concurrent_gets_share_one_request(stub_transport):
+    """Fifty threads asking for one competition send one request."""
+    metrics = MetricsCollector()
+    api = LifterAPI(url=STUB_URL, transport=stub_transport, metrics=metrics)
+
+    def route(method, url, kwargs):
+        # hold the request until every other thread is waiting for it
+        wait_for(lambda: api._coalescer.shared == THREADS - 1)
+        return make_response(200, {"reference_id": "c1", "lift_set": []})
+
+    stub_transport.routes[("GET", "/v1/competitions/c1")] = route
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(
+            executor.map(
+                lambda _: api.get_competition(competition_id="c1"),
+                range(THREADS),
+            )
+        )
+    assert stub_transport.count("GET", "/v1/competitions/c1") == 1
+    assert all(result is results[0] for result in results)
+    competition = metrics.to_dict()["GET /v1/competitions/{competition_id}"]
+    assert (competition["requests"], competition["coalesced"]) == (
+        1,
+        THREADS - 1,
+    )
+    assert api.get_competition(competition_id="c1") is not results[0]
+    assert stub_transport.count("GET", "/v1/competitions/c1") == 2
+
+
+def test_coalesce_off(stub_transport):
+    """Every call sends its own request without coalescing."""
+    stub_transport.routes[("GET", "/v1/athletes/a1")] = (200, {})
+    api = LifterAPI(url=STUB_URL, transport=stub_transport, coalesce=False)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(lambda _: api.get_athlete(athlete_id="a1"), range(4))
+        )
+    assert stub_transport.count("GET", "/v1/athletes/a1") == 4
+
+
+def test_coalescer_shares_errors():
+    """Waiting calls get the exception of the call they waited for."""
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        wait_for(lambda: coalescer.shared == 1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(coalescer.do, "key", fail)
+        started.wait()
+        second = executor.submit(coalescer.do, "key", lambda: "unused")
+        for future in (first, second):
+            with pytest.raises(ValueError):
+                future.result()
+    assert coalescer.do("key", lambda: "again") == "again"
+
+
+def test_coalescer_wait_within_deadline():
+    """Waiting for another call stops at the deadline."""
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(coalescer.do, "key", release.wait)
+        wait_for(lambda: "key" in coalescer._calls)
+        with pytest.raises(DeadlineExceededError):
+            with deadline(0.01):
+                coalescer.do("key", lambda: None)
+        release.set()
+
+
+def test_responses_decoded_in_parallel(stub_transport):
+    """Decoding one response does not wait for another to be decoded."""
+    api = LifterAPI(url=STUB_URL, transport=stub_transport)
+    second_decoded = threading.Event()
+    first, second = make_response(200, {}), make_response(200, {})
+    first.json = lambda: second_decoded.wait(5) and {"first": True}
+    second.json = lambda: second_decoded.set() or {"second": True}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        decoded = executor.submit(api._json, first, None)
+        wait_for(lambda: "_decode_lock" in vars(first))
+        assert api._json(second, None) == {"second": True}
+        assert decoded.result() == {"first": True}
+    assert api._json(first, None) is decoded.result()
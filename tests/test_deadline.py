@@ -0,0 +1,63 @@
+"""Test deadlines and per-call timeouts."""
+
+import time
+
+import pytest
+
+from lifter_api import LifterAPI, RetryPolicy
+from lifter_api.utils.deadline import deadline, request_timeout, timeout
+from lifter_api.utils.exceptions import DeadlineExceededError
+
+from .conftest import STUB_URL
+from .test_pagination import paginated_route
+
+
+def test_request_timeout():
+    """Timeouts are overridden, then cut to the time left."""
+    assert request_timeout((5.0, 30.0)) == (5.0, 30.0)
+    with timeout(2.0):
+        assert request_timeout((5.0, 30.0)) == 2.0
+    with timeout(None):
+        assert request_timeout((5.0, 30.0)) is None
+        with deadline(10):
+            assert 9 < request_timeout((5.0, 30.0)) <= 10
+    with deadline(10):
+        connect, read = request_timeout((5.0, 30.0))
+        assert connect == 5.0 and 9 < read <= 10
+        with deadline(60):
+            # an inner deadline cannot extend an outer one
+            assert request_timeout(None) <= 10
+
+
+def test_deadline_exceeded(stub_api):
+    """Nothing is sent once the deadline has passed."""
+    with pytest.raises(DeadlineExceededError):
+        with stub_api.deadline(0.01):
+            time.sleep(0.02)
+            stub_api.get_athlete(athlete_id="a1")
+
+
+def test_deadline_in_worker_threads(stub_api, stub_transport):
+    """Deadlines apply to requests sent by worker threads."""
+    stub_transport.routes[("GET", "/v1/athletes")] = paginated_route(
+        [{"reference_id": f"a{i}"} for i in range(10)]
+    )
+    with stub_api.deadline(5), stub_api.timeout(20):
+        assert len(stub_api.fetch_all_athletes(max_workers=4)) == 10
+    pages = [
+        kwargs for _, url, kwargs in stub_transport.calls if "page" in url
+    ]
+    assert len(pages) == 4
+    assert all(kwargs["timeout"] <= 5 for kwargs in pages)
+
+
+def test_deadline_stops_retries(stub_transport, monkeypatch):
+    """Retries that would wait past the deadline are not attempted."""
+    monkeypatch.setattr("lifter_api.utils.transport.time.sleep", pytest.fail)
+    stub_transport.retry = RetryPolicy(backoff_factor=10, jitter=False)
+    stub_transport.routes[("GET", "/v1/athletes")] = (503, None)
+    api = LifterAPI(url=STUB_URL, transport=stub_transport)
+    with api.deadline(5):
+        response = stub_transport.get(f"{STUB_URL}/v1/athletes")
+    assert response.status_code == 503
+    assert stub_transport.count("GET", "/v1/athletes") == 1
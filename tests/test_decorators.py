@@ -0,0 +1,70 @@
+"""Test the `_check_id` policies."""
+
+import pytest
+
+from lifter_api import LifterAPI
+from lifter_api.utils.exceptions import NotAllowedError
+
+from .conftest import STUB_URL
+
+COMPETITION_PATH = "/v1/competitions/123def7"
+
+
+@pytest.fixture
+def checked_api(stub_transport):
+    """Build a client with a given `check_ids` policy."""
+    stub_transport.routes[("HEAD", COMPETITION_PATH)] = (200, None)
+    stub_transport.routes[("GET", f"{COMPETITION_PATH}/lifts")] = (200, [])
+
+    def _checked_api(check_ids: str) -> LifterAPI:
+        return LifterAPI(
+            url=STUB_URL, transport=stub_transport, check_ids=check_ids
+        )
+
+    return _checked_api
+
+
+def test_check_ids_wrong_policy(stub_transport):
+    """Only known policies are accepted."""
+    with pytest.raises(NotAllowedError):
+        LifterAPI(url=STUB_URL, transport=stub_transport, check_ids="wrong")
+
+
+def test_check_ids_get(checked_api, stub_transport):
+    """The default policy fetches the full record first."""
+    checked_api("get").lifts(competition_id="123def7")
+    assert stub_transport.count("GET", COMPETITION_PATH) == 1
+
+
+def test_check_ids_head(checked_api, stub_transport):
+    """The head policy probes without downloading the record."""
+    api = checked_api("head")
+    assert api.lifts(competition_id="123def7") == []
+    api.lifts(competition_id="123def7")
+    assert stub_transport.count("GET", COMPETITION_PATH) == 0
+    assert stub_transport.count("HEAD", COMPETITION_PATH) == 2
+
+
+def test_check_ids_cache(checked_api, stub_transport):
+    """The cache policy probes each ID once."""
+    api = checked_api("cache")
+    api.lifts(competition_id="123def7")
+    api.lifts(competition_id="123def7")
+    assert stub_transport.count("HEAD", COMPETITION_PATH) == 1
+
+
+def test_check_ids_missing(checked_api):
+    """Missing IDs are reported the same way for every policy."""
+    for check_ids in ["get", "head", "cache", "off"]:
+        response = checked_api(check_ids).lifts(competition_id="wrong")
+        assert (
+            response.get("detail") == "Competition ID: 'wrong' does not exist."
+        )
+
+
+def test_check_ids_off(checked_api, stub_transport):
+    """Without checks, only the real call is made."""
+    checked_api("off").lifts(competition_id="123def7")
+    assert stub_transport.count("HEAD", COMPETITION_PATH) == 0
+    assert stub_transport.count("GET", COMPETITION_PATH) == 0
+    assert stub_transport.count("GET", f"{COMPETITION_PATH}/lifts") == 1
@@ -1,4 +1,6 @@
 """Test for helper functions."""
+
+import random
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime
 
@@ -16,6 +18,7 @@ from lifter_api.utils.helpers import (
     verify_date,
     verify_edit_kwargs,
     verify_lifts,
+    verify_lifts_batch,
 )
 
 
@@ -225,3 +228,50 @@ def test_verify_lifts(test_input, expected):
         verify_lifts(**test_input)
     if excinfo is not None:
         assert expected[1] in str(excinfo.value)
+
+
+def test_verify_lifts_batch():
+    """Batch validation matches `verify_lifts` row by row."""
+    np = pytest.importorskip("numpy")
+    rng = random.Random(42)
+    statuses = ["LIFT", "NOLIFT", "DNA", "FAKE"]
+    sheet = [
+        [(rng.choice(statuses), rng.randint(60, 70)) for _ in range(6)]
+        for _ in range(500)
+    ]
+
+    expected = []
+    for row in sheet:
+        try:
+            verify_lifts(*row[:3])
+            verify_lifts(*row[3:])
+            expected.append("")
+        except InvalidLiftsError as error:
+            expected.append(error.message)
+
+    invalid, reasons = verify_lifts_batch(
+        [[status for status, _ in row[:3]] for row in sheet],
+        [[weight for _, weight in row[:3]] for row in sheet],
+        [[status for status, _ in row[3:]] for row in sheet],
+        [[weight for _, weight in row[3:]] for row in sheet],
+    )
+    assert list(reasons) == expected
+    assert list(invalid) == [bool(reason) for reason in expected]
+    assert np.any(invalid) and not np.all(invalid)
+
+
+def test_verify_lifts_batch_codes():
+    """Statuses can be given as their codes."""
+    pytest.importorskip("numpy")
+    weights = [[1, 2, 3], [1, 2, 3]]
+    invalid, _ = verify_lifts_batch(
+        [[0, 0, 0], [0, 0, 5]], weights, [[2, 2, 2]] * 2, weights
+    )
+    assert list(invalid) == [False, True]
+
+
+def test_verify_lifts_batch_empty():
+    """An empty sheet gives empty results."""
+    pytest.importorskip("numpy")
+    invalid, reasons = verify_lifts_batch([], [], [], [])
+    assert invalid.shape == reasons.shape == (0,)
@@ -0,0 +1,59 @@
+"""Test the cost and side effects of importing the package."""
+
+import json
+import subprocess
+import sys
+
+# generous, so only a regression such as importing `rich` again trips it
+IMPORT_TIME_BUDGET = 1.0
+
+IMPORT_SCRIPT = """
+import json, logging, sys, time
+displayhook = sys.displayhook
+start = time.perf_counter()
+import lifter_api
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": [m for m in ("rich", "httpx", "asyncio") if m in sys.modules],
+    "root_handlers": len(logging.getLogger().handlers),
+    "displayhook": sys.displayhook is displayhook,
+}))
+"""
+
+
+def test_import_is_lightweight():
+    """Importing `lifter_api` is quick and changes nothing globally."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    result = json.loads(output)
+    assert result["modules"] == []
+    assert result["root_handlers"] == 0
+    assert result["displayhook"]
+    assert result["elapsed"] < IMPORT_TIME_BUDGET
+
+
+WITHOUT_HTTPX_SCRIPT = """
+import sys
+sys.modules["httpx"] = None
+from lifter_api import *
+try:
+    from lifter_api import AsyncLifterAPI
+except ImportError as error:
+    print(error)
+"""
+
+
+def test_import_without_httpx():
+    """Only `AsyncLifterAPI` needs the optional `httpx`."""
+    output = subprocess.run(
+        [sys.executable, "-c", WITHOUT_HTTPX_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    assert "pip install lifter-api-wrapper[async]" in output
@@ -0,0 +1,257 @@
+"""Test local indexes and the bulk athlete upsert."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from lifter_api import LifterAPI
+from lifter_api.utils.index import AthleteIndex, normalise_name
+
+from .conftest import STUB_URL, make_response
+from .test_tokens import make_token
+
+
+def make_athlete(reference_id: str, first_name: str, last_name: str) -> dict:
+    """Athlete as listed by the API."""
+    return {
+        "reference_id": reference_id,
+        "first_name": first_name,
+        "last_name": last_name,
+        "yearborn": 1990,
+    }
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        pytest.param("Tāne", "tane", id="Macron"),
+        pytest.param(" Smith-Jones ", "smith jones", id="Hyphen"),
+        pytest.param("Mary  ANNE", "mary anne", id="Spaces and case"),
+    ],
+)
+def test_normalise_name(test_input, expected):
+    """Names are compared loosely."""
+    assert normalise_name(test_input) == expected
+
+
+def test_athlete_index():
+    """Athletes are matched by name and birth year."""
+    index = AthleteIndex(
+        [
+            make_athlete("a1", "Tāne", "Smith"),
+            make_athlete("a2", "Mary", "Jones"),
+            make_athlete("a3", "mary", "jones"),
+        ]
+    )
+    assert len(index) == 3
+    assert [a["reference_id"] for a in index.match("tane", "SMITH", 1990)] == [
+        "a1"
+    ]
+    assert len(index.match("Mary", "Jones", "1990")) == 2
+    assert index.match("Tāne", "Smith", 1991) == []
+
+
+@pytest.fixture
+def upsert_api(stub_transport):
+    """Authenticated client with three athletes."""
+    athletes = [
+        make_athlete("a1", "Tāne", "Smith"),
+        make_athlete("a2", "Mary", "Jones"),
+        make_athlete("a3", "Mary", "Jones"),
+    ]
+
+    def _create(method, url, kwargs):
+        return make_response(201, {"reference_id": "new", **kwargs["json"]})
+
+    stub_transport.routes.update(
+        {
+            ("POST", "/api/token/refresh/"): (
+                200,
+                {"access": make_token(exp=time.time() + 300)},
+            ),
+            ("GET", "/v1/athletes"): (
+                200,
+                {"count": 3, "next": None, "results": athletes},
+            ),
+            ("POST", "/v1/athletes"): _create,
+        }
+    )
+    return LifterAPI(
+        url=STUB_URL, transport=stub_transport, auth_token="RefreshToken"
+    )
+
+
+def test_upsert_athletes(upsert_api, stub_transport):
+    """Only athletes without a match are created, once each."""
+    new = {"first_name": "New", "last_name": "Athlete", "yearborn": 2000}
+    result = upsert_api.upsert_athletes(
+        [
+            {"first_name": "tane", "last_name": "smith", "yearborn": 1990},
+            {"first_name": "Mary", "last_name": "Jones", "yearborn": 1990},
+            new,
+            dict(new, first_name="NEW"),
+        ]
+    )
+    assert result["matched"][0]["reference_id"] == "a1"
+    assert len(result["ambiguous"][1]) == 2
+    assert result["created"][2] is result["created"][3]
+    assert result["failed"] == {}
+    assert stub_transport.count("GET", "/v1/athletes") == 1
+    assert stub_transport.count("POST", "/v1/athletes") == 1
+
+
+def test_upsert_athletes_invalid_rows(upsert_api, stub_transport):
+    """Rows that cannot be matched are reported without stopping others."""
+    new = {"first_name": "New", "last_name": "Athlete", "yearborn": 2000}
+    result = upsert_api.upsert_athletes(
+        [
+            {"first_name": "New", "last_name": "Athlete"},
+            dict(new, yearborn="unknown"),
+            ["New", "Athlete", 2000],
+            new,
+        ]
+    )
+    assert result["failed"][0] == "Missing field: 'yearborn'."
+    assert "unknown" in result["failed"][1]
+    assert 2 in result["failed"]
+    assert result["created"][3]["reference_id"] == "new"
+    assert stub_transport.count("POST", "/v1/athletes") == 1
+
+
+def make_competition(reference_id: str, name: str, date_start: str) -> dict:
+    """Competition as listed by the API."""
+    return {
+        "reference_id": reference_id,
+        "name": name,
+        "location": "Auckland",
+        "date_start": date_start,
+        "date_end": date_start,
+    }
+
+
+@pytest.fixture
+def competitions():
+    """Competitions held by the stand-in server."""
+    return [make_competition("c1", "Nationals", "2022-06-01")]
+
+
+@pytest.fixture
+def competition_api(stub_transport, competitions):
+    """Authenticated client with the competitions of `competitions`."""
+
+    def _list(method, url, kwargs):
+        after = parse_qs(urlsplit(url).query).get("date_start_after")
+        found = [
+            competition
+            for competition in competitions
+            if after is None or competition["date_start"] >= after[0]
+        ]
+        return make_response(
+            200, {"count": len(found), "next": None, "results": found}
+        )
+
+    def _create(method, url, kwargs):
+        time.sleep(0.05)
+        competition = {
+            "reference_id": f"new{len(competitions)}",
+            **kwargs["json"],
+        }
+        competitions.append(competition)
+        return make_response(201, competition)
+
+    stub_transport.routes.update(
+        {
+            ("POST", "/api/token/refresh/"): (
+                200,
+                {"access": make_token(exp=time.time() + 300)},
+            ),
+            ("GET", "/v1/competitions"): _list,
+            ("POST", "/v1/competitions"): _create,
+        }
+    )
+    return LifterAPI(
+        url=STUB_URL, transport=stub_transport, auth_token="RefreshToken"
+    )
+
+
+def test_get_or_create_competition(
+    competition_api, stub_transport, competitions
+):
+    """Existing competitions are found locally, and others created."""
+    competition, created = competition_api.get_or_create_competition(
+        "2022-06-01", "2022-06-01", "auckland", "NATIONALS"
+    )
+    assert (competition["reference_id"], created) == ("c1", False)
+
+    # added by someone else since the first scan
+    competitions.append(make_competition("c2", "Open", "2022-07-01"))
+
+    competition, created = competition_api.get_or_create_competition(
+        "2022-07-01", "2022-07-01", "Auckland", "Open"
+    )
+    assert (competition["reference_id"], created) == ("c2", False)
+
+    competition, created = competition_api.get_or_create_competition(
+        "2023-01-01", "2023-01-01", "Auckland", "Open", refresh=False
+    )
+    assert (competition["reference_id"], created) == ("new2", True)
+    assert competition_api.refresh_competition_index().match(
+        "Open", "Auckland", "2023-01-01", "2023-01-01"
+    ) == [competition]
+    assert stub_transport.count("POST", "/v1/competitions") == 1
+
+
+def test_get_or_create_competition_refreshes_on_miss(
+    competition_api, stub_transport
+):
+    """A match in the index sends no requests; a miss refreshes it."""
+    competition_api.refresh_competition_index()
+    sent = len(stub_transport.calls)
+    competition, created = competition_api.get_or_create_competition(
+        "2022-06-01", "2022-06-01", "Auckland", "Nationals"
+    )
+    assert (competition["reference_id"], created) == ("c1", False)
+    assert len(stub_transport.calls) == sent
+
+    competition_api.get_or_create_competition(
+        "2022-06-01", "2022-06-01", "Auckland", "Nationals", refresh=True
+    )
+    assert len(stub_transport.calls) > sent
+
+
+def test_refresh_competition_index_backfilled(
+    competition_api, stub_transport, competitions
+):
+    """Competitions added before the latest one indexed are found."""
+    competition_api.refresh_competition_index()
+    competitions.append(make_competition("c0", "Masters", "2021-03-01"))
+    competition, created = competition_api.get_or_create_competition(
+        "2021-03-01", "2021-03-01", "Auckland", "Masters"
+    )
+    assert (competition["reference_id"], created) == ("c0", False)
+    assert stub_transport.count("POST", "/v1/competitions") == 0
+
+
+def test_get_or_create_competition_concurrently(
+    competition_api, stub_transport
+):
+    """Concurrent calls for the same competition only create it once."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda name: competition_api.get_or_create_competition(
+                    "2023-01-01", "2023-01-01", "Auckland", name
+                ),
+                ["Open", "open", "OPEN", "Nationals"],
+            )
+        )
+    assert sorted(created for _, created in results) == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert len({result["reference_id"] for result, _ in results[:3]}) == 1
+    assert stub_transport.count("POST", "/v1/competitions") == 2
@@ -0,0 +1,119 @@
+"""Test request hooks and metrics."""
+
+import time
+
+import pytest
+
+from lifter_api import (
+    LifterAPI,
+    MetricsCollector,
+    ResponseCache,
+    RetryPolicy,
+)
+
+from .conftest import STUB_URL, make_response
+from .test_tokens import make_token
+
+COMPETITION = "GET /v1/competitions/{competition_id}"
+
+
+@pytest.fixture
+def metrics():
+    """Collector with a small histogram."""
+    return MetricsCollector(buckets=(0.5, 1.0))
+
+
+@pytest.fixture
+def metrics_api(stub_transport, metrics):
+    """Authenticated client collecting metrics."""
+    stub_transport.routes.update(
+        {
+            ("POST", "/api/token/refresh/"): (
+                200,
+                {"access": make_token(exp=time.time() + 300)},
+            ),
+            ("HEAD", "/v1/competitions/c1"): (200, None),
+            ("GET", "/v1/competitions/c1"): (200, {"reference_id": "c1"}),
+            ("GET", "/v1/competitions/c1/lifts"): (200, []),
+        }
+    )
+    return LifterAPI(
+        url=STUB_URL,
+        transport=stub_transport,
+        auth_token="RefreshToken",
+        check_ids="head",
+        metrics=metrics,
+    )
+
+
+def test_hooks(metrics_api, stub_transport):
+    """Hooks see every attempt, tagged by why it was sent."""
+    before, after = [], []
+    stub_transport.before_request.append(before.append)
+    stub_transport.after_request.append(after.append)
+    metrics_api.lifts(competition_id="c1")
+    assert [(event.method, event.tag) for event in before] == [
+        ("HEAD", "preflight"),
+        ("GET", None),
+    ]
+    assert after[1].endpoint == "/v1/competitions/{competition_id}/lifts"
+    assert after[1].status_code == 200
+    assert after[1].decompressed == 2
+
+
+def test_metrics_to_dict(metrics_api, metrics):
+    """Requests are counted by endpoint template, status and tag."""
+    metrics_api.lifts(competition_id="c1")
+    metrics_api.lifts(competition_id="c1")
+    exported = metrics.to_dict()
+    assert exported["POST /api/token/refresh/"]["tags"] == {"token": 1}
+    assert exported["GET /v1"]["tags"] == {"connect": 1}
+    head = exported["HEAD /v1/competitions/{competition_id}"]
+    assert head["requests"] == 2
+    assert head["tags"] == {"preflight": 2}
+    lifts = exported["GET /v1/competitions/{competition_id}/lifts"]
+    assert lifts["statuses"] == {"200": 2}
+    assert lifts["tags"] == {}
+    assert lifts["latency"]["buckets"] == {"0.5": 2, "1.0": 2, "+Inf": 2}
+    metrics.clear()
+    assert metrics.to_dict() == {}
+
+
+def test_metrics_retries_and_cache_hits(stub_transport, metrics, monkeypatch):
+    """Retries and cache hits are counted."""
+    monkeypatch.setattr(
+        "lifter_api.utils.transport.time.sleep", lambda seconds: None
+    )
+    statuses = iter([503, 200])
+    stub_transport.routes[("GET", "/v1/competitions/c1")] = (
+        lambda method, url, kwargs: make_response(next(statuses), {}, url=url)
+    )
+    stub_transport.retry = RetryPolicy(jitter=False)
+    api = LifterAPI(
+        url=STUB_URL,
+        transport=stub_transport,
+        cache=ResponseCache(),
+        metrics=metrics,
+    )
+    api.get_competition(competition_id="c1")
+    api.get_competition(competition_id="c1")
+    competition = metrics.to_dict()[COMPETITION]
+    assert competition["statuses"] == {"503": 1, "200": 1}
+    assert competition["retries"] == 1
+    assert competition["cache_hits"] == 1
+
+
+def test_metrics_to_prometheus(metrics_api, metrics):
+    """Metrics are exported in the Prometheus text format."""
+    metrics_api.get_competition(competition_id="c1")
+    text = metrics.to_prometheus()
+    assert "# TYPE lifter_api_requests_total counter" in text
+    assert (
+        'lifter_api_requests_total{method="GET",'
+        'endpoint="/v1/competitions/{competition_id}",status="200",tag=""} 1'
+    ) in text
+    assert (
+        'lifter_api_request_duration_seconds_bucket{method="GET",'
+        'endpoint="/v1/competitions/{competition_id}",le="+Inf"} 1'
+    ) in text
+    assert text.endswith("\n")
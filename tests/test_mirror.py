@@ -0,0 +1,132 @@
+"""Test the local SQLite mirror."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from lifter_api import LifterMirror
+
+from .conftest import make_response
+from .test_pagination import paginated_route
+
+
+def make_lift(reference_id: str, athlete: str, lottery_number: int) -> dict:
+    """Lift as listed in a competition's `lift_set`."""
+    return {
+        "reference_id": reference_id,
+        "athlete": athlete,
+        "lottery_number": lottery_number,
+    }
+
+
+@pytest.fixture
+def dataset(stub_transport):
+    """Two athletes and two competitions served by the stub."""
+    athletes = [
+        {"reference_id": "a1", "first_name": "Mary", "last_name": "Jones"},
+        {"reference_id": "a2", "first_name": "Tane", "last_name": "Smith"},
+    ]
+    competitions = {
+        "c1": {
+            "reference_id": "c1",
+            "name": "Nationals",
+            "location": "Auckland",
+            "date_start": "2022-06-01",
+            "lift_set": [make_lift("l2", "a2", 2), make_lift("l1", "a1", 1)],
+        },
+        "c2": {
+            "reference_id": "c2",
+            "name": "Open",
+            "location": "Wellington",
+            "date_start": "2022-07-01",
+            "lift_set": [make_lift("l3", "a1", 1)],
+        },
+    }
+
+    def _listed(method, url, kwargs):
+        listed = [
+            {k: v for k, v in competition.items() if k != "lift_set"}
+            for competition in competitions.values()
+        ]
+        return paginated_route(listed)(method, url, kwargs)
+
+    def _detail(method, url, kwargs):
+        return make_response(200, competitions[url.rsplit("/", 1)[1]])
+
+    stub_transport.routes.update(
+        {
+            ("GET", "/v1/athletes"): paginated_route(athletes),
+            ("GET", "/v1/competitions"): _listed,
+            ("GET", "/v1/competitions/c1"): _detail,
+            ("GET", "/v1/competitions/c2"): _detail,
+        }
+    )
+    return athletes, competitions
+
+
+@pytest.fixture
+def mirror(stub_api, dataset):
+    """Mirror after a full sync."""
+    mirror = LifterMirror(stub_api, page_size=1)
+    assert mirror.sync() == {"athletes": 2, "competitions": 2, "lifts": 3}
+    return mirror
+
+
+def test_mirror_reads(mirror, stub_transport):
+    """Reads come from the mirror, shaped like the API's."""
+    sent = len(stub_transport.calls)
+    competition = mirror.get_competition(competition_id="c1")
+    assert [lift["reference_id"] for lift in competition["lift_set"]] == [
+        "l1",
+        "l2",
+    ]
+    assert "lift_set" not in mirror.competitions()["results"][0]
+    assert [
+        lift["reference_id"]
+        for lift in mirror.get_athlete(athlete_id="a1")["lift_set"]
+    ] == ["l1", "l3"]
+    assert mirror.athletes()["next"] is not None
+    assert [a["reference_id"] for a in mirror.iter_athletes()] == ["a1", "a2"]
+    assert mirror.find_athlete("smith")["count"] == 1
+    assert (
+        mirror.find_competition(
+            search="open", date_before="2023-01-01", date_after="2022-06-15"
+        )["count"]
+        == 1
+    )
+    assert mirror.get_lift(competition_id="c2", lift_id="l1") == {
+        "detail": "Lift ID: 'l1' does not exist."
+    }
+    assert mirror.lifts(competition_id="nope") == {
+        "detail": "Competition ID: 'nope' does not exist."
+    }
+    assert len(stub_transport.calls) == sent
+
+
+def test_mirror_incremental_sync(mirror, dataset, stub_transport):
+    """Later syncs only fetch recent competitions and new athletes."""
+    _, competitions = dataset
+    competitions["c2"]["lift_set"].append(make_lift("l4", "a3", 2))
+    stub_transport.routes[("GET", "/v1/athletes/a3")] = (
+        200,
+        {"reference_id": "a3", "first_name": "New", "last_name": "Athlete"},
+    )
+    assert mirror.last_sync == date.today()
+    counts = mirror.sync()
+    assert counts["athletes"] == 1
+    lift_set = mirror.get_athlete(athlete_id="a3")["lift_set"]
+    assert [lift["reference_id"] for lift in lift_set] == ["l4"]
+    after = (date.today() - timedelta(days=mirror.lookback_days)).isoformat()
+    assert any(
+        f"date_start_after={after}" in url
+        for _, url, _ in stub_transport.calls
+    )
+
+
+@pytest.mark.parametrize("page", [0, -1])
+def test_mirror_rejects_pages_before_first(mirror, page):
+    """Pages start at 1, as with the API."""
+    with pytest.raises(ValueError):
+        mirror.athletes(page=page)
+    with pytest.raises(ValueError):
+        mirror.find_competition(page=page)
@@ -0,0 +1,110 @@
+"""Test compact models."""
+
+from lifter_api import (
+    Athlete,
+    Attempt,
+    Competition,
+    Lift,
+    LifterAPI,
+    LiftStatus,
+    LiftTable,
+)
+
+from .conftest import STUB_URL
+
+LIFT = {
+    "reference_id": "l1",
+    "athlete": "a1",
+    "athlete_name": "Mary Jones",
+    "competition": "c1",
+    "snatches": {
+        "1st": {"lift_status": "LIFT", "weight": 90},
+        "2nd": {"lift_status": "NOLIFT", "weight": 95},
+        "3rd": {"lift_status": "LIFT", "weight": 95},
+    },
+    "snatch_first": "LIFT",
+    "snatch_first_weight": 90,
+    "snatch_second": "NOLIFT",
+    "snatch_second_weight": 95,
+    "snatch_third": "LIFT",
+    "snatch_third_weight": 95,
+    "cnjs": {
+        "1st": {"lift_status": "LIFT", "weight": 120},
+        "2nd": {"lift_status": "DNA", "weight": 0},
+        "3rd": {"lift_status": "DNA", "weight": 0},
+    },
+    "cnj_first": "LIFT",
+    "cnj_first_weight": 120,
+    "cnj_second": "DNA",
+    "cnj_second_weight": 0,
+    "cnj_third": "DNA",
+    "cnj_third_weight": 0,
+    "age_categories": {"is_senior": True},
+    "weight_category": "M89",
+    "team": "TEAM",
+}
+COMPETITION = {
+    "reference_id": "c1",
+    "name": "Nationals",
+    "location": "Auckland",
+    "date_start": "2022-06-01",
+    "lift_set": [LIFT],
+    "new_field": 1,
+}
+
+
+def test_lift_model():
+    """Lifts read like their payload, with typed attempts."""
+    lift = Lift.from_dict(LIFT)
+    assert not hasattr(lift, "__dict__")
+    assert lift == LIFT
+    assert lift.to_dict() == LIFT
+    assert lift.team == lift["team"] == "TEAM"
+    assert lift.snatch_second is LiftStatus.NOLIFT
+    assert lift.snatches[1] == Attempt(LiftStatus.NOLIFT, 95)
+    assert lift.cnjs[0] == ("LIFT", 120)
+    assert "placing" not in lift
+    assert lift.get("placing") is None
+
+
+def test_competition_model_lift_set_parsed_lazily():
+    """Nested lifts are only converted when read."""
+    competition = Competition.from_dict(COMPETITION)
+    assert isinstance(competition._lift_set[0], dict)
+    assert isinstance(competition.lift_set[0], Lift)
+    assert competition["lift_set"][0].athlete == "a1"
+    assert competition["new_field"] == 1
+    assert competition.to_dict() == COMPETITION
+
+
+def test_lift_table_from_models():
+    """Models can be used wherever lift dictionaries are."""
+    table = LiftTable.from_lifts([Lift.from_dict(LIFT)])
+    assert list(table["snatch_second"]) == [1]
+    assert list(table["team"]) == ["TEAM"]
+
+
+def test_client_models(stub_transport):
+    """`models=True` returns models, and leaves "detail" responses."""
+    stub_transport.routes.update(
+        {
+            ("GET", "/v1/competitions/c1"): (200, COMPETITION),
+            ("GET", "/v1/athletes"): (
+                200,
+                {
+                    "count": 1,
+                    "next": None,
+                    "results": [{"reference_id": "a1"}],
+                },
+            ),
+        }
+    )
+    api = LifterAPI(url=STUB_URL, transport=stub_transport, models=True)
+    competition = api.get_competition(competition_id="c1")
+    assert isinstance(competition, Competition)
+    assert competition.lift_set[0].snatches[0].weight == 90
+    athletes = api.athletes()
+    assert isinstance(athletes["results"][0], Athlete)
+    assert api.get_competition(competition_id="missing") == {
+        "detail": "Competition ID: 'missing' does not exist."
+    }
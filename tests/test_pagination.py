@@ -0,0 +1,109 @@
+"""Test stepping through paginated results."""
+
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from lifter_api.utils.pagination import fetch_all_results, iter_pages
+
+from .conftest import STUB_URL, make_response
+
+PAGE_SIZE = 3
+
+
+def paginated_route(items: list):
+    """Route serving `items` in pages of `PAGE_SIZE`, like the API."""
+
+    def _route(method, url, kwargs):
+        query = parse_qs(urlsplit(url).query)
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * PAGE_SIZE
+        if start >= len(items) and page != 1:
+            return make_response(404, {"detail": "Invalid page."}, url=url)
+        has_next = start + PAGE_SIZE < len(items)
+        body = {
+            "count": len(items),
+            "next": f"{STUB_URL}/v1/x?page={page + 1}" if has_next else None,
+            "previous": None,
+            "results": items[start : start + PAGE_SIZE],
+        }
+        return make_response(200, body, url=url)
+
+    return _route
+
+
+@pytest.fixture
+def athletes(stub_transport):
+    """Eight athletes spread over three pages."""
+    items = [{"reference_id": f"a{i}"} for i in range(8)]
+    stub_transport.routes[("GET", "/v1/athletes")] = paginated_route(items)
+    return items
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_athletes(stub_api, athletes, prefetch):
+    """All athletes are streamed across pages in order."""
+    assert list(stub_api.iter_athletes(prefetch=prefetch)) == athletes
+
+
+def test_iter_athletes_stops_early(stub_api, stub_transport, athletes):
+    """Stopping early does not fetch the remaining pages."""
+    assert len(list(islice(stub_api.iter_athletes(prefetch=False), 2))) == 2
+    assert stub_transport.count("GET", "/v1/athletes") == 1
+
+
+def test_iter_find_athletes_empty(stub_api, stub_transport):
+    """A search without results yields nothing."""
+    stub_transport.routes[("GET", "/v1/athletes")] = paginated_route([])
+    assert list(stub_api.iter_find_athletes("DoesNotExist")) == []
+
+
+def test_iter_pages_closes_on_error():
+    """Errors fetching a page are raised to the consumer."""
+
+    def _fetch_page(page):
+        if page == 2:
+            raise ValueError("page 2")
+        return {"next": "more", "results": [page]}
+
+    pages = iter_pages(_fetch_page)
+    assert next(pages)["results"] == [1]
+    with pytest.raises(ValueError):
+        next(pages)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fetch_all_athletes(stub_api, stub_transport, athletes, max_workers):
+    """All pages are fetched once and returned in order."""
+    assert stub_api.fetch_all_athletes(max_workers=max_workers) == athletes
+    assert stub_transport.count("GET", "/v1/athletes") == 3
+
+
+def test_fetch_all_results_spills_over():
+    """Items added after the first page was read are still collected."""
+    # page 1 reported 7 items, but 10 exist by the time page 3 is read
+    pages = {
+        1: {"count": 7, "next": "2", "results": [0, 1, 2]},
+        2: {"count": 10, "next": "3", "results": [3, 4, 5]},
+        3: {"count": 10, "next": "4", "results": [6, 7, 8]},
+        4: {"count": 10, "next": None, "results": [9]},
+    }
+    assert fetch_all_results(pages.__getitem__) == list(range(10))
+
+
+def test_fetch_all_athletes_shrinks(stub_api, stub_transport):
+    """Items deleted after the first page was read end the results early."""
+    items = [{"reference_id": f"a{i}"} for i in range(8)]
+    route = paginated_route(items)
+
+    def _shrinking(method, url, kwargs):
+        response = route(method, url, kwargs)
+        if "page=1" in url:
+            # two items deleted, so page 3 no longer exists
+            del items[-2:]
+        return response
+
+    stub_transport.routes[("GET", "/v1/athletes")] = _shrinking
+    fetched = stub_api.fetch_all_athletes(max_workers=1)
+    assert fetched == [{"reference_id": f"a{i}"} for i in range(6)]
@@ -0,0 +1,91 @@
+"""Test the client-side rate limiter."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lifter_api import RateLimiter
+from lifter_api.utils.deadline import deadline
+from lifter_api.utils.exceptions import DeadlineExceededError
+from lifter_api.utils.ratelimit import TokenBucket
+
+from .conftest import STUB_URL, make_response
+
+
+def test_token_bucket(monkeypatch):
+    """Requests beyond the burst wait for their token, in order."""
+    monkeypatch.setattr(
+        "lifter_api.utils.ratelimit.time.monotonic", lambda: 100.0
+    )
+    monkeypatch.setattr(
+        "lifter_api.utils.ratelimit.time.sleep", lambda seconds: None
+    )
+    bucket = TokenBucket(rate=10, burst=2)
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.1, 0.2]
+    # a token more than `timeout` away is not taken
+    assert bucket.acquire(timeout=0.25) is None
+    assert bucket.acquire(timeout=0.3) == 0.3
+
+
+def test_rate_limiter_concurrency(stub_transport):
+    """Reads and writes have their own concurrency budgets."""
+    in_flight = {"GET": 0, "POST": 0}
+    peak = {"GET": 0, "POST": 0}
+    lock = threading.Lock()
+
+    def _slow(method, url, kwargs):
+        with lock:
+            in_flight[method] += 1
+            peak[method] = max(peak[method], in_flight[method])
+        time.sleep(0.01)
+        with lock:
+            in_flight[method] -= 1
+        return make_response(200, {}, url=url)
+
+    stub_transport.routes[("GET", "/v1/athletes")] = _slow
+    stub_transport.routes[("POST", "/v1/athletes")] = _slow
+    stub_transport.rate_limiter = RateLimiter(
+        max_concurrent_reads=3, max_concurrent_writes=1
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for method in ["GET", "POST"] * 8:
+            executor.submit(
+                stub_transport.request, method, f"{STUB_URL}/v1/athletes"
+            )
+    assert peak == {"GET": 3, "POST": 1}
+
+
+def test_rate_limiter_within_deadline(stub_transport):
+    """Waiting for a saturated limiter stops at the deadline."""
+    stub_transport.routes[("GET", "/v1/athletes/a1")] = (200, {})
+    stub_transport.rate_limiter = RateLimiter(reads_per_second=1, burst=1)
+    url = f"{STUB_URL}/v1/athletes/a1"
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.5):
+            stub_transport.get(url)
+            stub_transport.get(url)
+    assert time.monotonic() - start < 0.4
+    assert stub_transport.count("GET", "/v1/athletes/a1") == 1
+
+
+def test_concurrency_limit_within_deadline(stub_transport):
+    """Waiting for a slot stops at the deadline, sending nothing."""
+    release = threading.Event()
+    stub_transport.routes[("GET", "/v1/athletes/a1")] = (
+        lambda method, url, kwargs: release.wait(5) and make_response(url=url)
+    )
+    stub_transport.rate_limiter = RateLimiter(max_concurrent_reads=1)
+    url = f"{STUB_URL}/v1/athletes/a1"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        holder = executor.submit(stub_transport.get, url)
+        while not stub_transport.calls:
+            time.sleep(0.001)
+        with pytest.raises(DeadlineExceededError):
+            with deadline(0.05):
+                stub_transport.get(url)
+        release.set()
+        holder.result()
+    assert stub_transport.count("GET", "/v1/athletes/a1") == 1
@@ -0,0 +1,89 @@
+"""Test streaming lift sets."""
+
+import io
+import json
+
+import pytest
+import requests
+
+from lifter_api import Lift, LifterAPI
+from lifter_api.utils.stream import iter_json_array, iter_text
+
+from .conftest import STUB_URL
+
+COMPETITION = {
+    "reference_id": "c1",
+    "name": "Nationals – Ōtautahi",
+    "lifts_count": 1234,
+    "lift_set": [
+        {"reference_id": f"l{number}", "athlete": "a1", "total_lifted": 200}
+        for number in range(50)
+    ],
+    "location": "Christchurch",
+}
+
+
+def chunked(text: str, size: int):
+    """Split `text` into byte chunks of `size`."""
+    body = text.encode()
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 100000])
+def test_iter_json_array(size):
+    """Items are decoded from chunks split anywhere, even within a character."""
+    chunks = iter_text(chunked(json.dumps(COMPETITION, indent=1), size))
+    assert list(iter_json_array(chunks, "lift_set")) == COMPETITION["lift_set"]
+
+
+@pytest.mark.parametrize(
+    "body", ['{"lift_set": []}', '{"lift_set": null}', "{}", '{"a": 1}']
+)
+def test_iter_json_array_empty(body):
+    """Missing or empty arrays yield nothing."""
+    assert list(iter_json_array([body], "lift_set")) == []
+
+
+def test_iter_json_array_not_object():
+    """Only objects can be streamed."""
+    with pytest.raises(ValueError):
+        list(iter_json_array(["[1, 2]"], "lift_set"))
+
+
+def streamed(body: dict, status_code: int = 200):
+    """Route answering with a body that has to be read as a stream."""
+
+    def route(method, url, kwargs):
+        assert kwargs["stream"]
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = url
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        return response
+
+    return route
+
+
+def test_iter_competition_lifts(stub_transport):
+    """Lifts are streamed from the competition detail."""
+    stub_transport.routes[("GET", "/v1/competitions/c1")] = streamed(
+        COMPETITION
+    )
+    api = LifterAPI(url=STUB_URL, transport=stub_transport, models=True)
+    lifts = list(api.iter_competition_lifts(competition_id="c1", chunk_size=7))
+    assert len(lifts) == 50
+    assert isinstance(lifts[0], Lift)
+    assert lifts[-1] == COMPETITION["lift_set"][-1]
+    size = len(json.dumps(COMPETITION).encode())
+    assert api.transfer_stats.totals()[
+        "GET /v1/competitions/{competition_id}"
+    ] == (1, size, size)
+
+
+def test_iter_athlete_lifts_missing(stub_api, stub_transport):
+    """A missing athlete raises instead of yielding nothing."""
+    stub_transport.routes[("GET", "/v1/athletes/a1")] = streamed(
+        {"detail": "Not found."}, status_code=404
+    )
+    with pytest.raises(requests.HTTPError):
+        next(stub_api.iter_athlete_lifts(athlete_id="a1"))
@@ -0,0 +1,82 @@
+"""Test columnar lift tables."""
+
+import io
+from array import array
+
+import pytest
+
+from lifter_api import LiftTable, lifts_to_columns
+
+LIFTS = [
+    {
+        "reference_id": "l1",
+        "athlete": "a1",
+        "weight_category": "M89",
+        "lottery_number": "3",
+        "snatch_first": "LIFT",
+        "snatch_first_weight": 90,
+        "cnj_third": "DNA",
+        "cnj_third_weight": "DNA",
+        "bodyweight": 88.5,
+        "age_categories": {"is_senior": True},
+    },
+    {
+        "reference_id": "l2",
+        "athlete": "a2",
+        "weight_category": "M89",
+        "lottery_number": "1",
+        "snatch_first": "NOLIFT",
+        "snatch_first_weight": 85,
+        "bodyweight": 87.0,
+        "age_categories": {"is_junior": True, "is_senior": True},
+    },
+]
+
+
+def test_lifts_to_columns():
+    """Lifts are flattened into typed columns."""
+    table = lifts_to_columns(iter(LIFTS))
+    assert len(table) == 2
+    assert table["snatch_first_weight"] == array("i", [90, 85])
+    assert table["lottery_number"] == array("i", [3, 1])
+    assert table["cnj_third_weight"] == array("i", [0, 0])
+    assert table["snatch_first"] == array("b", [0, 1])
+    assert table["cnj_third"] == array("b", [2, -1])
+    assert table["is_senior"] == array("b", [1, 1])
+    assert table["is_junior"] == array("b", [0, 1])
+    assert table["weight_category"].values == ["M89"]
+    assert list(table["weight_category"]) == ["M89", "M89"]
+
+
+def test_lift_table_to_csv():
+    """CSV rows decode statuses and strings."""
+    file = io.StringIO()
+    LiftTable.from_lifts(LIFTS).to_csv(file)
+    header, first, _ = file.getvalue().splitlines()
+    row = dict(zip(header.split(","), first.split(",")))
+    assert row["snatch_first"] == "LIFT"
+    assert row["cnj_second"] == ""
+    assert row["weight_category"] == "M89"
+    assert row["bodyweight"] == "88.5"
+
+
+def test_lift_table_to_npz(tmp_path):
+    """Columns are saved to and loaded from NumPy files."""
+    np = pytest.importorskip("numpy")
+    table = LiftTable.from_lifts(LIFTS)
+    table.to_npz(tmp_path / "lifts.npz")
+    with np.load(tmp_path / "lifts.npz") as saved:
+        assert saved["snatch_first_weight"].tolist() == [90, 85]
+        assert saved["weight_category_values"].tolist() == ["M89"]
+        assert saved["bodyweight"].dtype == np.float64
+
+
+def test_lift_table_to_parquet(tmp_path):
+    """Columns are saved to Parquet, keeping dictionary encoding."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    LiftTable.from_lifts(LIFTS).to_parquet(tmp_path / "lifts.parquet")
+    saved = pq.read_table(tmp_path / "lifts.parquet")
+    assert saved.column("snatch_first_weight").to_pylist() == [90, 85]
+    assert saved.column("athlete").to_pylist() == ["a1", "a2"]
@@ -0,0 +1,124 @@
+"""Test local access token handling."""
+
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lifter_api import LifterAPI
+from lifter_api.utils.tokens import (
+    AccessToken,
+    decode_token_expiry,
+    token_is_fresh,
+)
+
+from .conftest import STUB_URL, make_response
+
+
+def make_token(**claims) -> str:
+    """Build an unsigned JSON Web Token."""
+
+    def _encode(data: dict) -> str:
+        raw = json.dumps(data).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    return f"{_encode({'alg': 'HS256'})}.{_encode(claims)}.signature"
+
+
+@pytest.mark.parametrize(
+    "test_input,expected",
+    [
+        pytest.param(make_token(exp=1700000000), 1700000000.0, id="Expiry"),
+        pytest.param(make_token(user_id=1), None, id="No expiry"),
+        pytest.param("WrongToken", None, id="Not a token"),
+        pytest.param("a.!!!.c", None, id="Bad encoding"),
+    ],
+)
+def test_decode_token_expiry(test_input, expected):
+    """Expiry is read from the token without the API."""
+    assert decode_token_expiry(test_input) == expected
+
+
+def test_token_is_fresh():
+    """Tokens are stale within the skew of their expiry."""
+    assert token_is_fresh(time.time() + 60, skew=30)
+    assert not token_is_fresh(time.time() + 10, skew=30)
+    assert not token_is_fresh(None, skew=30)
+
+
+@pytest.fixture
+def token_routes(stub_transport):
+    """Refresh route handing out tokens valid for `lifetime` seconds."""
+    lifetime = {"seconds": 300}
+
+    def _refresh(method, url, kwargs):
+        token = make_token(exp=time.time() + lifetime["seconds"])
+        return make_response(200, {"access": token}, url=url)
+
+    stub_transport.routes[("POST", "/api/token/refresh/")] = _refresh
+    stub_transport.routes[("POST", "/v1/athletes")] = (
+        201,
+        {"reference_id": "a1"},
+    )
+    return lifetime
+
+
+def test_writes_skip_token_verify(stub_transport, token_routes):
+    """A valid access token is reused without asking the API."""
+    api = LifterAPI(url=STUB_URL, auth_token="x", transport=stub_transport)
+    for _ in range(3):
+        api.create_athlete(first_name="A", last_name="B", yearborn=1990)
+    assert stub_transport.count("POST", "/api/token/refresh/") == 1
+    assert stub_transport.count("POST", "/api/token/verify") == 0
+    assert stub_transport.count("POST", "/v1/athletes") == 3
+
+
+def test_token_refreshed_ahead_of_expiry(stub_transport, token_routes):
+    """Tokens expiring within the skew are refreshed before use."""
+    token_routes["seconds"] = 10
+    api = LifterAPI(
+        url=STUB_URL,
+        auth_token="x",
+        transport=stub_transport,
+        token_refresh_skew=30,
+    )
+    api.create_athlete(first_name="A", last_name="B", yearborn=1990)
+    assert stub_transport.count("POST", "/api/token/refresh/") == 2
+
+
+def test_unauthorized_write_retried_once(stub_transport, token_routes):
+    """A rejected access token is refreshed and the request retried."""
+    responses = iter(
+        [(401, {"code": "token_not_valid"}), (201, {"reference_id": "a1"})]
+    )
+    stub_transport.routes[("POST", "/v1/athletes")] = (
+        lambda method, url, kwargs: make_response(*next(responses), url=url)
+    )
+    api = LifterAPI(url=STUB_URL, auth_token="x", transport=stub_transport)
+    api.create_athlete(first_name="A", last_name="B", yearborn=1990)
+    assert stub_transport.count("POST", "/api/token/refresh/") == 2
+    assert stub_transport.count("POST", "/v1/athletes") == 2
+
+
+def test_concurrent_refresh_is_single_flight(stub_transport, token_routes):
+    """Threads finding an expired token share a single refresh."""
+    api = LifterAPI(url=STUB_URL, auth_token="x", transport=stub_transport)
+    token_routes["seconds"] = 300
+    refresh = stub_transport.routes[("POST", "/api/token/refresh/")]
+
+    def _slow_refresh(method, url, kwargs):
+        time.sleep(0.05)
+        return refresh(method, url, kwargs)
+
+    stub_transport.routes[("POST", "/api/token/refresh/")] = _slow_refresh
+    # expire the token obtained on construction
+    api._LifterAPI__access_token = AccessToken("old", time.time() - 1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = set(
+            executor.map(lambda _: api._obtain_access_token(), range(16))
+        )
+    assert stub_transport.count("POST", "/api/token/refresh/") == 2
+    assert len(tokens) == 1
@@ -0,0 +1,125 @@
+"""Test tracing spans."""
+
+import pytest
+import requests
+
+from lifter_api import InMemorySpanExporter, LifterAPI, Tracer
+
+from .conftest import STUB_URL
+from .test_pagination import paginated_route
+from .test_stream import COMPETITION, streamed
+
+
+@pytest.fixture
+def exporter():
+    """Exporter keeping spans in memory."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def traced_api(stub_transport, exporter):
+    """Client tracing into `exporter`, checking IDs with HEAD."""
+    stub_transport.routes.update(
+        {
+            ("HEAD", "/v1/competitions/c1"): (200, None),
+            ("GET", "/v1/competitions/c1/lifts"): (200, []),
+        }
+    )
+    api = LifterAPI(
+        url=STUB_URL,
+        transport=stub_transport,
+        check_ids="head",
+        tracer=Tracer(exporter),
+    )
+    exporter.clear()
+    return api
+
+
+def test_span_per_call(traced_api, exporter):
+    """A call is a parent span of the requests it sends."""
+    traced_api.lifts(competition_id="c1")
+    *children, parent = exporter.spans
+    assert parent.name == "LifterAPI.lifts"
+    assert parent.parent_id is None
+    assert parent.attributes == {"lifter.competition_id": "c1"}
+    assert parent.status == "ok"
+    assert parent.duration >= 0
+    assert exporter.children(parent) == children
+    assert [span.name for span in children] == [
+        "HEAD /v1/competitions/{competition_id}",
+        "GET /v1/competitions/{competition_id}/lifts",
+    ]
+    assert children[0].attributes["lifter.tag"] == "preflight"
+    assert children[1].attributes["http.status_code"] == 200
+    assert {span.trace_id for span in exporter.spans} == {parent.trace_id}
+    assert parent.start <= children[0].start <= children[1].end <= parent.end
+
+
+def test_span_records_detail(traced_api, exporter):
+    """Calls stopped by the ID checks are marked on their span."""
+    traced_api.lifts(competition_id="missing")
+    assert "lifter.detail" in exporter.spans[-1].attributes
+
+
+def test_span_records_errors(traced_api, stub_transport, exporter):
+    """Exceptions mark the call and the request as errors."""
+
+    def route(method, url, kwargs):
+        raise requests.ConnectionError("down")
+
+    stub_transport.routes[("GET", "/v1/competitions/c1/lifts")] = route
+    with pytest.raises(requests.ConnectionError):
+        traced_api.lifts(competition_id="c1")
+    request, call = exporter.spans[-2:]
+    assert request.status == call.status == "error"
+    assert isinstance(call.error, requests.ConnectionError)
+
+
+def test_spans_from_worker_threads(traced_api, stub_transport, exporter):
+    """Pages fetched in worker threads are part of the same trace."""
+    stub_transport.routes[("GET", "/v1/athletes")] = paginated_route(
+        [{"reference_id": f"a{i}"} for i in range(8)]
+    )
+    traced_api.fetch_all_athletes()
+    root = exporter.spans[-1]
+    assert root.name == "LifterAPI.fetch_all_athletes"
+    pages = exporter.children(root)
+    assert [span.name for span in pages] == ["LifterAPI.athletes"] * 3
+    assert all(len(exporter.children(page)) == 1 for page in pages)
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+
+
+def test_span_covers_streamed_lifts(traced_api, stub_transport, exporter):
+    """Streaming lifts is a parent span of the request it sends."""
+    stub_transport.routes[("GET", "/v1/competitions/c1")] = streamed(
+        COMPETITION
+    )
+    lifts = traced_api.iter_competition_lifts(competition_id="c1")
+    assert exporter.spans == []
+    assert len(list(lifts)) == len(COMPETITION["lift_set"])
+    request, call = exporter.spans
+    assert call.name == "LifterAPI.iter_competition_lifts"
+    assert call.attributes == {"lifter.competition_id": "c1"}
+    assert request.parent_id == call.span_id
+    assert request.name == "GET /v1/competitions/{competition_id}"
+
+
+def test_span_covers_iteration(traced_api, stub_transport, exporter):
+    """Pages fetched while iterating, even early, are part of its span."""
+    stub_transport.routes[("GET", "/v1/athletes")] = paginated_route(
+        [{"reference_id": f"a{i}"} for i in range(8)]
+    )
+    athletes = traced_api.iter_athletes()
+    next(athletes)
+    traced_api.lifts(competition_id="c1")
+    athletes.close()
+    root = exporter.spans[-1]
+    assert root.name == "LifterAPI.iter_athletes"
+    assert root.status == "ok"
+    pages = exporter.children(root)
+    assert {span.name for span in pages} == {"LifterAPI.athletes"}
+    # called between items, so not part of the iteration
+    lifts = next(
+        span for span in exporter.spans if span.name == "LifterAPI.lifts"
+    )
+    assert lifts.parent_id is None
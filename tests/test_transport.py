@@ -0,0 +1,200 @@
+"""Test the pooled HTTP transport."""
+
+import gzip
+import io
+import json
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from lifter_api import LifterAPI, RetryPolicy, Transport
+from lifter_api.utils.defaults import VERSION
+from lifter_api.utils.transport import (
+    TransferTotals,
+    best_accept_encoding,
+    endpoint_template,
+    parse_retry_after,
+    transfer_sizes,
+)
+
+from .conftest import STUB_URL, make_response
+
+
+def test_transport_pool_configuration():
+    """Pool size and keep-alive settings are applied to the session."""
+    transport = Transport(
+        pool_connections=2, pool_maxsize=16, keep_alive=False
+    )
+    adapter = transport.session.get_adapter("https://api.lifter.shivan.xyz")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 16
+    assert transport.session.headers["Connection"] == "close"
+
+
+def test_transport_default_timeout(stub_transport):
+    """The default timeout is sent unless overridden per request."""
+    stub_transport.timeout = (1.0, 2.0)
+    stub_transport.get(f"{STUB_URL}/{VERSION}")
+    stub_transport.get(f"{STUB_URL}/{VERSION}", timeout=9)
+    assert stub_transport.calls[0][2]["timeout"] == (1.0, 2.0)
+    assert stub_transport.calls[1][2]["timeout"] == 9
+
+
+def test_all_methods_share_transport(stub_transport):
+    """Every call goes through the one transport passed in."""
+    stub_transport.routes[("GET", f"/{VERSION}/athletes")] = (
+        200,
+        {"count": 0, "next": None, "previous": None, "results": []},
+    )
+    with LifterAPI(url=STUB_URL, transport=stub_transport) as api:
+        api.athletes()
+        api.get_athlete("doesnotexist")
+    assert [call[0] for call in stub_transport.calls] == ["GET"] * 3
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record waits instead of sleeping."""
+    waited = []
+    monkeypatch.setattr("lifter_api.utils.transport.time.sleep", waited.append)
+    return waited
+
+
+def flaky_route(*outcomes):
+    """Route answering with each outcome in turn, raising exceptions."""
+    outcomes = list(outcomes)
+
+    def _route(method, url, kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return make_response(*outcome, url=url)
+
+    return _route
+
+
+def test_parse_retry_after():
+    """Retry-After is read as seconds or an HTTP date."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_get(stub_transport, sleeps):
+    """Idempotent requests are retried, respecting Retry-After."""
+    attempts = []
+    stub_transport.retry = RetryPolicy(
+        max_attempts=4, jitter=False, on_attempt=attempts.append
+    )
+    stub_transport.routes[("GET", "/v1/athletes")] = flaky_route(
+        (503, None, {"Retry-After": "2"}),
+        requests.ConnectionError("reset"),
+        (502, None),
+        (200, {"results": []}),
+    )
+    response = stub_transport.get(f"{STUB_URL}/v1/athletes")
+    assert response.status_code == 200
+    assert sleeps == [2.0, 1.0, 2.0]
+    assert [attempt.status_code for attempt in attempts] == [
+        503,
+        None,
+        502,
+        200,
+    ]
+    assert attempts[-1].delay is None
+
+
+def test_retry_gives_up(stub_transport, sleeps):
+    """The last response is returned once attempts run out."""
+    stub_transport.retry = RetryPolicy(max_attempts=2)
+    stub_transport.routes[("GET", "/v1/athletes")] = (503, None)
+    assert stub_transport.get(f"{STUB_URL}/v1/athletes").status_code == 503
+    assert stub_transport.count("GET", "/v1/athletes") == 2
+
+    stub_transport.routes[("GET", "/v1/athletes")] = flaky_route(
+        requests.ReadTimeout(), requests.ReadTimeout()
+    )
+    with pytest.raises(requests.ReadTimeout):
+        stub_transport.get(f"{STUB_URL}/v1/athletes")
+
+
+def test_retry_post(stub_transport, sleeps):
+    """POST is only retried when it cannot have been processed."""
+    stub_transport.retry = RetryPolicy()
+    stub_transport.routes[("POST", "/v1/athletes")] = flaky_route(
+        (429, None), requests.ConnectTimeout(), (201, {})
+    )
+    assert stub_transport.post(f"{STUB_URL}/v1/athletes").status_code == 201
+
+    stub_transport.routes[("POST", "/v1/athletes")] = flaky_route(
+        (503, None), (201, {})
+    )
+    assert stub_transport.post(f"{STUB_URL}/v1/athletes").status_code == 503
+    assert stub_transport.count("POST", "/v1/athletes") == 4
+
+
+def test_accept_encoding():
+    """The best decodable encoding is asked for, unless overridden."""
+    assert (
+        Transport()
+        .session.headers["Accept-Encoding"]
+        .startswith(best_accept_encoding())
+    )
+    assert "gzip" in best_accept_encoding()
+    transport = Transport(accept_encoding="identity")
+    assert transport.session.headers["Accept-Encoding"] == "identity"
+
+
+@pytest.mark.parametrize(
+    "url,template",
+    [
+        (f"{STUB_URL}/v1/athletes?page=2", "/v1/athletes"),
+        (f"{STUB_URL}/v1/athletes/ab345l", "/v1/athletes/{athlete_id}"),
+        (
+            f"{STUB_URL}/v1/competitions/123def7/lifts/1ab",
+            "/v1/competitions/{competition_id}/lifts/{lift_id}",
+        ),
+        (f"{STUB_URL}/api/token/refresh/", "/api/token/refresh/"),
+    ],
+)
+def test_endpoint_template(url, template):
+    """IDs are replaced by placeholders."""
+    assert endpoint_template(url) == template
+
+
+def test_transfer_stats(stub_transport):
+    """Bytes received are totalled by endpoint."""
+    body = {"reference_id": "ab345l"}
+    stub_transport.routes[("GET", "/v1/athletes/ab345l")] = (200, body)
+    stub_transport.routes[("GET", "/v1/athletes/cd678m")] = (200, body)
+    with LifterAPI(url=STUB_URL, transport=stub_transport) as api:
+        api.get_athlete(athlete_id="ab345l")
+        api.get_athlete(athlete_id="cd678m")
+    size = len(json.dumps(body))
+    assert api.transfer_stats.totals()[
+        "GET /v1/athletes/{athlete_id}"
+    ] == TransferTotals(2, 2 * size, 2 * size)
+    assert api.transfer_stats.total().responses == 3
+    api.transfer_stats.clear()
+    assert api.transfer_stats.total() == TransferTotals(0, 0, 0)
+
+
+def test_transfer_stats_compressed():
+    """Compressed bytes are read from the socket, before decoding."""
+    body = json.dumps([{"age_categories": {"is_senior": True}}] * 100)
+    raw = HTTPResponse(
+        body=io.BytesIO(gzip.compress(body.encode())),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+    )
+    response = HTTPAdapter().build_response(
+        requests.Request("GET", STUB_URL).prepare(), raw
+    )
+    compressed, decompressed = transfer_sizes(response)
+    assert decompressed == len(body)
+    assert compressed < decompressed / 10